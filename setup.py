@@ -22,11 +22,10 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
     ],
-    python_requires=">=3.9",
+    python_requires=">=3.10",
     install_requires=[
         "mcp>=1.0.0",
         "pydantic>=2.0.0",
@@ -38,6 +37,7 @@ setup(
         "dev": [
             "pytest>=7.0.0",
             "pytest-asyncio>=0.21.0",
+            "pytest-xdist>=3.0.0",
             "black>=22.0.0",
             "flake8>=5.0.0",
             "mypy>=1.0.0",
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import date
 
 
@@ -49,11 +49,17 @@ class Portfolio:
         user_id (str): The ID of the portfolio owner.
         name (str): The name of the portfolio.
         holdings (List[StockHolding]): List of stock holdings in the portfolio.
+            Change it through add_holding and remove_holding, which keep the
+            per-symbol index in step.
     """
 
     user_id: str
     name: str
     holdings: List[StockHolding] = field(default_factory=list)
+    # Holdings by upper-cased symbol, in portfolio order, for the symbol lookups
+    _by_symbol: Dict[str, List[StockHolding]] = field(
+        init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         """
@@ -69,9 +75,11 @@ class Portfolio:
             raise ValueError("Portfolio name must be a non-empty string.")
         if not isinstance(self.holdings, list):
             raise ValueError("Holdings must be a list.")
+        self._by_symbol = {}
         for holding in self.holdings:
             if not isinstance(holding, StockHolding):
                 raise TypeError("All holdings must be StockHolding instances.")
+            self._by_symbol.setdefault(holding.symbol.upper(), []).append(holding)
 
     def add_holding(self, holding: StockHolding):
         """
@@ -86,6 +94,7 @@ class Portfolio:
         if not isinstance(holding, StockHolding):
             raise TypeError("Holding must be a StockHolding instance.")
         self.holdings.append(holding)
+        self._by_symbol.setdefault(holding.symbol.upper(), []).append(holding)
 
     def remove_holding(self, symbol: str):
         """
@@ -97,9 +106,11 @@ class Portfolio:
         Returns:
             bool: True if any holdings were removed, False otherwise.
         """
-        initial_len = len(self.holdings)
+        removed = self._by_symbol.pop(symbol.upper(), None)
+        if not removed:
+            return False
         self.holdings = [h for h in self.holdings if h.symbol.upper() != symbol.upper()]
-        return initial_len > len(self.holdings)
+        return True
 
     def get_holding(self, symbol: str) -> Optional[StockHolding]:
         """
@@ -111,10 +122,8 @@ class Portfolio:
         Returns:
             Optional[StockHolding]: The first matching holding, or None if not found.
         """
-        for holding in self.holdings:
-            if holding.symbol.upper() == symbol.upper():
-                return holding
-        return None
+        matches = self._by_symbol.get(symbol.upper())
+        return matches[0] if matches else None
 
     def total_quantity(self, symbol: str) -> int:
         """
@@ -126,6 +135,4 @@ class Portfolio:
         Returns:
             int: The total quantity of shares held for the symbol.
         """
-        return sum(
-            h.quantity for h in self.holdings if h.symbol.upper() == symbol.upper()
-        )
+        return sum(h.quantity for h in self._by_symbol.get(symbol.upper(), ()))
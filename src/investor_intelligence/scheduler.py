@@ -12,7 +12,7 @@ from investor_intelligence.services.query_processor_service import QueryProcesso
 from investor_intelligence.tools.gmail_tool import (
     send_message,
     get_gmail_service,
-    create_message,
+    make_message_factory,
 )
 from investor_intelligence.models.portfolio import Portfolio, StockHolding
 from investor_intelligence.ml.relevance_model import RelevanceModel
@@ -20,6 +20,7 @@ from datetime import date, datetime
 import shutil
 from investor_intelligence.utils.logging import logger
 from investor_intelligence.utils.db import DATABASE_FILE
+from investor_intelligence.utils.cache import sweep_cache
 import os
 
 # Initialize services (ensure portfolio_service is configured with your Google Sheet ID)
@@ -29,6 +30,9 @@ monitoring_service = MonitoringService(alert_service, relevance_model)
 summary_service = SummaryService(alert_service, monitoring_service)
 nlp_service = NLPService()
 
+SUMMARY_SENDER = "me"  # 'me' refers to the authenticated user
+create_summary_message = make_message_factory(SUMMARY_SENDER)
+
 # Placeholder for user data (in a real app, this would come from a user management system)
 USERS_TO_MONITOR = [
     {
@@ -65,9 +69,10 @@ def get_user_id_by_email(email: str) -> str:
 
 def send_daily_intelligence_summary():
     logger.info(f"--- Running daily intelligence summary job at {datetime.now()} ---")
+    today = date.today().isoformat()  # Shared by every summary in this batch
+    portfolios = {}
     for user_data in USERS_TO_MONITOR:
         user_id = user_data["user_id"]
-        user_email = user_data["email"]
         portfolio_name = user_data["portfolio_name"]
 
         portfolio_config = PORTFOLIO_MAPPING.get(user_id)
@@ -86,21 +91,23 @@ def send_daily_intelligence_summary():
 
         if portfolio:
             logger.info(f"Generating summary for {user_id} - {portfolio.name}...")
-            daily_summary = summary_service.generate_daily_summary(user_id, portfolio)
-            gmail_service = get_gmail_service()
-            sender_email = "me"  # 'me' refers to the authenticated user
-            message = create_message(
-                sender_email,
-                user_email,
-                f"Daily Investor Intelligence Summary - {datetime.now().strftime('%Y-%m-%d')}",
-                daily_summary,
-            )
-            send_message(gmail_service, sender_email, message)
+            portfolios[user_id] = portfolio
         else:
             logger.warning(
                 f"Could not load portfolio for user {user_id}. Skipping summary generation."
             )
 
+    # Every user's alerts are fetched in one query
+    daily_summaries = summary_service.generate_daily_summaries(portfolios, today=today)
+    for user_id, daily_summary in daily_summaries.items():
+        gmail_service = get_gmail_service()
+        message = create_summary_message(
+            get_user_email_by_id(user_id),
+            f"Daily Investor Intelligence Summary - {today}",
+            daily_summary,
+        )
+        send_message(gmail_service, SUMMARY_SENDER, message)
+
 
 def send_weekly_intelligence_summary():
     logger.info(f"--- Running weekly intelligence summary job at {datetime.now()} ---")
@@ -143,8 +150,10 @@ def process_incoming_email_queries():
     logger.info(f"--- Processing incoming email queries at {datetime.now()} ---")
     # Fetch unread emails that might be queries
     # You might want to filter by sender or subject more strictly in a real app
+    # Only bodies from known senders are processed, so don't download the others
     unread_emails = get_unread_emails(
-        query="is:unread subject:(stock OR query OR portfolio OR price OR earnings OR news)"
+        query="is:unread subject:(stock OR query OR portfolio OR price OR earnings OR news)",
+        body_filter=lambda email: get_user_id_by_email(email["sender"]) is not None,
     )
 
     if unread_emails:
@@ -220,6 +229,10 @@ if __name__ == "__main__":
         CronTrigger(hour=3, minute=0),
     )  # Daily backup at 3 AM
 
+    scheduler.add_job(
+        sweep_cache, CronTrigger(hour=3, minute=30)
+    )  # Daily removal of expired API cache files at 3:30 AM
+
     # Schedule daily monitoring (e.g., every day at 7:00 AM)
     scheduler.add_job(
         run_monitoring_jobs, CronTrigger(hour=7, minute=0, day_of_week="*")
@@ -96,8 +96,8 @@ class InvestorIntelligenceServer(MCPServer):
         if data is None or data == {}:
             raise ValueError(f"Could not retrieve historical data for {ticker}")
 
-        # Convert DataFrame to dictionary for JSON serialization
-        return data
+        # Cached series are read-only mappings; copy them to dicts for JSON serialization
+        return {timestamp: dict(bar) for timestamp, bar in data.items()}
 
     async def _get_portfolio_status(self, params):
         class Result:
@@ -4,15 +4,25 @@ from typing import List, Optional, Dict, Tuple
 import json
 
 from investor_intelligence.models.alert_feedback import AlertFeedback, FeedbackType
-from investor_intelligence.utils.db import DATABASE_FILE, init_db
+from investor_intelligence.utils.db import (
+    DATABASE_FILE,
+    create_schema,
+    get_connection,
+    init_db,
+)
 
 
 class AlertFeedbackService:
     """Service for collecting and managing user feedback on alert relevance."""
 
-    def __init__(self):
+    def __init__(self, connection: Optional[sqlite3.Connection] = None):
+        # None means the shared DATABASE_FILE connection
+        self._conn = connection
         try:
-            init_db()  # Ensure database and tables are initialized
+            if connection is None:
+                init_db()  # Ensure database and tables are initialized
+            else:
+                create_schema(connection)
             self.create_table()
         except Exception as e:
             raise RuntimeError(f"Failed to initialize AlertFeedbackService: {e}")
@@ -20,7 +30,7 @@ class AlertFeedbackService:
     def create_table(self):
         """Create the alert_feedback table if it doesn't exist."""
         try:
-            conn = sqlite3.connect(DATABASE_FILE)
+            conn = self._get_db_connection()
             cursor = conn.cursor()
             cursor.execute(
                 """
@@ -48,15 +58,15 @@ class AlertFeedbackService:
             cursor.execute(
                 "CREATE INDEX IF NOT EXISTS idx_alert_feedback_timestamp ON alert_feedback (timestamp)"
             )
-            conn.commit()
-            conn.close()
         except sqlite3.OperationalError as e:
             raise RuntimeError(f"Cannot create alert_feedback table: {e}")
 
     def _get_db_connection(self):
         """Get a database connection."""
+        if self._conn is not None:
+            return self._conn
         try:
-            return sqlite3.connect(DATABASE_FILE)
+            return get_connection(DATABASE_FILE)
         except sqlite3.OperationalError as e:
             raise RuntimeError(f"Cannot connect to database: {e}")
 
@@ -86,8 +96,6 @@ class AlertFeedbackService:
         )
 
         feedback.id = cursor.lastrowid
-        conn.commit()
-        conn.close()
         return feedback
 
     def record_alert_view(
@@ -160,7 +168,6 @@ class AlertFeedbackService:
             (alert_id,),
         )
         rows = cursor.fetchall()
-        conn.close()
 
         return [self._row_to_feedback(row) for row in rows]
 
@@ -176,7 +183,6 @@ class AlertFeedbackService:
             (user_id, cutoff_date.isoformat()),
         )
         rows = cursor.fetchall()
-        conn.close()
 
         return [self._row_to_feedback(row) for row in rows]
 
@@ -201,7 +207,6 @@ class AlertFeedbackService:
             (cutoff_date.isoformat(),),
         )
         rows = cursor.fetchall()
-        conn.close()
 
         # Group by alert and aggregate feedback
         training_data = []
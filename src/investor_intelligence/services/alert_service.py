@@ -1,9 +1,16 @@
+import os
 import sqlite3
+import threading
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from investor_intelligence.models.alert import Alert
-from investor_intelligence.utils.db import DATABASE_FILE, init_db
+from investor_intelligence.utils.db import (
+    DATABASE_FILE,
+    create_schema,
+    get_connection,
+    init_db,
+)
 from investor_intelligence.services.user_config_service import UserConfigService
 from investor_intelligence.services.alert_feedback_service import AlertFeedbackService
 from investor_intelligence.tools.gmail_tool import (
@@ -15,22 +22,62 @@ from investor_intelligence.tools.gmail_tool import (
 import re
 import json
 
+# Matches the percentage in price alert messages, e.g. "price changed by 2.50% to $10.00"
+_PRICE_CHANGE_PATTERN = re.compile(r"by ([\d\.]+)%")
+_PRICE_ALERT_TYPES = ("price_gain", "price_drop")
+
+
+def _price_change_percent(message: Optional[str]) -> Optional[float]:
+    """Returns the percentage change quoted in a price alert message, or None."""
+    match = _PRICE_CHANGE_PATTERN.search(message or "")
+    if match:
+        try:
+            return float(match.group(1))
+        except ValueError:
+            return None
+    return None
+
 
 class AlertService:
     """Manages the creation, persistence, and retrieval of alerts."""
 
-    def __init__(self):
+    # Every instance shares one connection per database, whose last insert rowid
+    # is per connection; this keeps an INSERT and the read of its id together
+    _insert_lock = threading.Lock()
+
+    def __init__(
+        self,
+        connection: Optional[sqlite3.Connection] = None,
+        db_path: Optional[str] = None,
+        user_config_service: Optional[UserConfigService] = None,
+    ):
+        # Tests pass an in-memory database or a database file of their own; with
+        # neither, the shared DATABASE_FILE connection is used. The feedback
+        # service uses the same one, and so do the user configs unless a
+        # user_config_service is passed in, so such tests never touch data/.
+        if connection is None and db_path is not None:
+            connection = get_connection(os.fspath(db_path))
+        self._conn = connection
         try:
-            init_db()  # Ensure database and table are initialized
+            if connection is None:
+                init_db()  # Ensure database and table are initialized
+            else:
+                create_schema(connection)
             self.create_table()
-            self.user_config_service = UserConfigService()
-            self.feedback_service = AlertFeedbackService()
+            if user_config_service is None:
+                user_config_service = (
+                    UserConfigService(db_path=db_path, connection=connection)
+                    if connection is not None
+                    else UserConfigService()
+                )
+            self.user_config_service = user_config_service
+            self.feedback_service = AlertFeedbackService(connection)
         except Exception as e:
             raise RuntimeError(f"Failed to initialize AlertService: {e}")
 
     def create_table(self):
         try:
-            conn = sqlite3.connect(DATABASE_FILE)
+            conn = self._get_db_connection()
             cursor = conn.cursor()
             cursor.execute(
                 """
@@ -58,16 +105,19 @@ class AlertService:
                 # Column already exists, ignore error
                 pass
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_user_id ON alerts (user_id)")
-            conn.commit()
-            conn.close()
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_user_id_alert_type ON alerts (user_id, alert_type)"
+            )
         except sqlite3.OperationalError as e:
             raise RuntimeError(
                 f"Cannot create alerts table in database at {DATABASE_FILE}: {e}"
             )
 
     def _get_db_connection(self):
+        if self._conn is not None:
+            return self._conn
         try:
-            return sqlite3.connect(DATABASE_FILE)
+            return get_connection(DATABASE_FILE)
         except sqlite3.OperationalError as e:
             raise RuntimeError(f"Cannot connect to database at {DATABASE_FILE}: {e}")
 
@@ -75,27 +125,26 @@ class AlertService:
         """Inserts a new alert into the database and returns the alert with its ID."""
         conn = self._get_db_connection()
         cursor = conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO alerts (user_id, portfolio_id, alert_type, symbol, threshold, message, created_at, is_active, triggered_at, relevance_score)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-            (
-                alert.user_id,
-                alert.portfolio_id,
-                alert.alert_type,
-                alert.symbol,
-                alert.threshold,
-                alert.message,
-                alert.created_at.isoformat(),
-                int(alert.is_active),
-                alert.triggered_at.isoformat() if alert.triggered_at else None,
-                alert.relevance_score,
-            ),
-        )
-        alert.id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        with self._insert_lock:
+            cursor.execute(
+                """
+                INSERT INTO alerts (user_id, portfolio_id, alert_type, symbol, threshold, message, created_at, is_active, triggered_at, relevance_score)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+                (
+                    alert.user_id,
+                    alert.portfolio_id,
+                    alert.alert_type,
+                    alert.symbol,
+                    alert.threshold,
+                    alert.message,
+                    alert.created_at.isoformat(),
+                    int(alert.is_active),
+                    alert.triggered_at.isoformat() if alert.triggered_at else None,
+                    alert.relevance_score,
+                ),
+            )
+            alert.id = cursor.lastrowid
         return alert
 
     def get_alert_by_id(self, alert_id: int) -> Optional[Alert]:
@@ -104,25 +153,127 @@ class AlertService:
         cursor = conn.cursor()
         cursor.execute("SELECT * FROM alerts WHERE id = ?", (alert_id,))
         row = cursor.fetchone()
-        conn.close()
         if row:
             return self._row_to_alert(row)
         return None
 
     def get_alerts_for_user(
-        self, user_id: str, active_only: bool = True
+        self,
+        user_id: str,
+        active_only: bool = True,
+        alert_types: Optional[Iterable[str]] = None,
     ) -> List[Alert]:
-        """Retrieves alerts for a specific user, optionally filtering by active status."""
-        conn = self._get_db_connection()
-        cursor = conn.cursor()
-        query = "SELECT * FROM alerts WHERE user_id = ?"
-        params = (user_id,)
+        """Retrieves alerts for a specific user, optionally filtering by active status.
+
+        Args:
+            user_id (str): The ID of the user.
+            active_only (bool): If True, only active alerts are returned.
+            alert_types (Iterable[str], optional): If given, only alerts of these types
+                are returned. The filter is applied in SQL so discarded rows are never fetched.
+
+        Returns:
+            List[Alert]: The matching alerts.
+        """
+        return self.get_alerts_for_users([user_id], active_only, alert_types)[user_id]
+
+    def get_alerts_for_users(
+        self,
+        user_ids: Iterable[str],
+        active_only: bool = True,
+        alert_types: Optional[Iterable[str]] = None,
+    ) -> Dict[str, List[Alert]]:
+        """Retrieves the alerts of several users with a single query.
+
+        Args:
+            user_ids (Iterable[str]): The IDs of the users.
+            active_only (bool): If True, only active alerts are returned.
+            alert_types (Iterable[str], optional): If given, only alerts of these types
+                are returned.
+
+        Returns:
+            Dict[str, List[Alert]]: Each requested user ID mapped to its matching
+                alerts, in database order; users without any get an empty list.
+        """
+        user_ids = list(dict.fromkeys(user_ids))
+        alerts_by_user = {user_id: [] for user_id in user_ids}
+        if user_ids:
+            for alert in self._select_alerts(user_ids, active_only, alert_types):
+                alerts_by_user[alert.user_id].append(alert)
+        return alerts_by_user
+
+    def get_filtered_alerts_for_user(
+        self,
+        user_id: str,
+        types: Optional[Iterable[str]] = None,
+        since: Optional[datetime] = None,
+        active_only: bool = True,
+    ) -> List[Alert]:
+        """Retrieves a user's alerts with their preferences already applied.
+
+        Returns the same alerts as passing get_alerts_for_user's result through
+        filter_alerts, but every predicate runs in the SQL query, so rows that would be
+        discarded are never turned into Alert objects.
+
+        Args:
+            user_id (str): The ID of the user.
+            types (Iterable[str], optional): If given, only alerts of these types are returned.
+            since (datetime, optional): If given, only alerts created at or after this time are returned.
+            active_only (bool): If True, only active alerts are returned.
+
+        Returns:
+            List[Alert]: The matching alerts.
+        """
+        preferences = self.user_config_service.get_user_config(user_id)
+        return self._select_alerts(
+            [user_id],
+            active_only,
+            types,
+            since=since,
+            min_price_change_percent=preferences.get("min_price_change_percent", 0.0),
+        )
+
+    def _select_alerts(
+        self,
+        user_ids: List[str],
+        active_only: bool,
+        alert_types: Optional[Iterable[str]],
+        since: Optional[datetime] = None,
+        min_price_change_percent: Optional[float] = None,
+    ) -> List[Alert]:
+        query = (
+            f"SELECT * FROM alerts WHERE user_id IN ({', '.join('?' * len(user_ids))})"
+        )
+        params = list(user_ids)
         if active_only:
             query += " AND is_active = 1"
+        if alert_types is not None:
+            alert_types = list(alert_types)
+            if not alert_types:
+                return []
+            query += f" AND alert_type IN ({', '.join('?' * len(alert_types))})"
+            params.extend(alert_types)
+        if since is not None:
+            query += " AND created_at >= ?"
+            params.append(since.isoformat())
 
+        conn = self._get_db_connection()
+        if min_price_change_percent is not None:
+            # Same rule as filter_alerts: price alerts whose message quotes a change
+            # below the user's minimum are dropped, everything else is kept
+            conn.create_function(
+                "price_change_percent", 1, _price_change_percent, deterministic=True
+            )
+            query += (
+                " AND (alert_type NOT IN (?, ?)"
+                " OR price_change_percent(message) IS NULL"
+                " OR price_change_percent(message) >= ?)"
+            )
+            params.extend(_PRICE_ALERT_TYPES)
+            params.append(min_price_change_percent)
+
+        cursor = conn.cursor()
         cursor.execute(query, params)
         rows = cursor.fetchall()
-        conn.close()
         return [self._row_to_alert(row) for row in rows]
 
     def update_alert(self, alert: Alert) -> bool:
@@ -152,9 +303,7 @@ class AlertService:
                 alert.id,
             ),
         )
-        conn.commit()
         rows_affected = cursor.rowcount
-        conn.close()
         return rows_affected > 0
 
     def deactivate_alert(self, alert_id: int) -> bool:
@@ -162,9 +311,7 @@ class AlertService:
         conn = self._get_db_connection()
         cursor = conn.cursor()
         cursor.execute("UPDATE alerts SET is_active = 0 WHERE id = ?", (alert_id,))
-        conn.commit()
         rows_affected = cursor.rowcount
-        conn.close()
         return rows_affected > 0
 
     def _row_to_alert(self, row) -> Alert:
@@ -215,11 +362,10 @@ class AlertService:
 
         filtered_alerts = []
         for alert in alerts:
-            if alert.alert_type in ["price_gain", "price_drop"]:
+            if alert.alert_type in _PRICE_ALERT_TYPES:
                 # Extract percentage from message (e.g., "Price changed by X.XX%")
-                match = re.search(r"by ([\d\.]+)%", alert.message)
-                if match:
-                    change_percent = float(match.group(1))
+                change_percent = _price_change_percent(alert.message)
+                if change_percent is not None:
                     if change_percent >= min_price_change_percent:
                         filtered_alerts.append(alert)
                 else:
@@ -324,8 +470,6 @@ class AlertService:
         cursor.execute(
             "UPDATE alerts SET feedback = ? WHERE id = ?", (feedback, alert_id)
         )
-        conn.commit()
-        conn.close()
 
 
 if __name__ == "__main__":
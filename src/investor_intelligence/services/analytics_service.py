@@ -1,5 +1,7 @@
+import time
 from typing import List
 from datetime import datetime, timedelta
+from functools import lru_cache
 import pandas as pd
 import numpy as np
 
@@ -8,6 +10,7 @@ from investor_intelligence.tools.alpha_vantage_tool import (
     get_time_series_data,
     get_quote_endpoint,
     get_earnings_calendar,
+    QUOTE_CACHE_TTL,
 )
 
 import yfinance as yf
@@ -16,6 +19,38 @@ from investor_intelligence.services.alert_service import AlertService
 from investor_intelligence.models.alert import Alert
 
 
+@lru_cache(maxsize=64)
+def _performance_for_window(holdings, window):
+    # window only busts the cache: each QUOTE_CACHE_TTL-second window of quotes is a
+    # new key, so prices are as fresh as get_quote_endpoint's
+    total_current_value = 0.0
+    total_purchase_value = 0.0
+
+    # To calculate daily returns, we need a common date range for all holdings
+    # For simplicity, let's just calculate total return for now.
+    # A more robust solution would involve fetching historical data for all stocks
+    # and aligning their dates.
+
+    for symbol, quantity, purchase_price in holdings:
+        current_price_data = get_quote_endpoint(symbol)
+        if current_price_data:
+            current_price = float(current_price_data["05. price"])
+            total_current_value += current_price * quantity
+        total_purchase_value += purchase_price * quantity
+
+    total_return = total_current_value - total_purchase_value
+    percentage_return = (
+        (total_return / total_purchase_value) * 100 if total_purchase_value > 0 else 0.0
+    )
+
+    return {
+        "total_current_value": total_current_value,
+        "total_purchase_value": total_purchase_value,
+        "total_return": total_return,
+        "percentage_return": percentage_return,
+    }
+
+
 class AnalyticsService:
     """Service for performing portfolio analytics."""
 
@@ -28,37 +63,18 @@ class AnalyticsService:
         Args:
             portfolio (Portfolio): The portfolio to analyze.
 
+        Results are memoized by the holdings' contents for as long as quotes are
+        cached, so repeated page views of an unchanged portfolio cost nothing.
+
         Returns:
             dict: A dictionary containing performance metrics.
         """
-        total_current_value = 0.0
-        total_purchase_value = 0.0
-
-        # To calculate daily returns, we need a common date range for all holdings
-        # For simplicity, let's just calculate total return for now.
-        # A more robust solution would involve fetching historical data for all stocks
-        # and aligning their dates.
-
-        for holding in portfolio.holdings:
-            current_price_data = get_quote_endpoint(holding.symbol)
-            if current_price_data:
-                current_price = float(current_price_data["05. price"])
-                total_current_value += current_price * holding.quantity
-            total_purchase_value += holding.purchase_price * holding.quantity
-
-        total_return = total_current_value - total_purchase_value
-        percentage_return = (
-            (total_return / total_purchase_value) * 100
-            if total_purchase_value > 0
-            else 0.0
+        holdings = tuple(
+            (h.symbol, h.quantity, h.purchase_price) for h in portfolio.holdings
+        )
+        return dict(
+            _performance_for_window(holdings, int(time.time() // QUOTE_CACHE_TTL))
         )
-
-        return {
-            "total_current_value": total_current_value,
-            "total_purchase_value": total_purchase_value,
-            "total_return": total_return,
-            "percentage_return": percentage_return,
-        }
 
     def calculate_daily_returns(self, portfolio: Portfolio) -> pd.DataFrame:
         """Calculates daily returns for each holding in the portfolio.
@@ -69,11 +85,8 @@ class AnalyticsService:
         all_daily_prices = {}
         for holding in portfolio.holdings:
             daily_data = get_time_series_data(holding.symbol)
-            if daily_data:
-                # Convert to DataFrame and get '4. close' prices
-                df = pd.DataFrame.from_dict(daily_data, orient="index")
-                df.index = pd.to_datetime(df.index)
-                all_daily_prices[holding.symbol] = df["4. close"].astype(float)
+            if daily_data is not None and not daily_data.empty:
+                all_daily_prices[holding.symbol] = daily_data["4. close"]
 
         if not all_daily_prices:
             return pd.DataFrame()
@@ -146,17 +159,16 @@ class AnalyticsService:
         stock_daily_data = get_time_series_data(stock_symbol, outputsize="full")
         market_daily_data = get_time_series_data(market_symbol, outputsize="full")
 
-        if not stock_daily_data or not market_daily_data:
+        if (
+            stock_daily_data is None
+            or stock_daily_data.empty
+            or market_daily_data is None
+            or market_daily_data.empty
+        ):
             return None
 
-        stock_df = pd.DataFrame.from_dict(stock_daily_data, orient="index")
-        market_df = pd.DataFrame.from_dict(market_daily_data, orient="index")
-
-        stock_df.index = pd.to_datetime(stock_df.index)
-        market_df.index = pd.to_datetime(market_df.index)
-
-        stock_returns = stock_df["4. close"].astype(float).pct_change().dropna()
-        market_returns = market_df["4. close"].astype(float).pct_change().dropna()
+        stock_returns = stock_daily_data["4. close"].pct_change().dropna()
+        market_returns = market_daily_data["4. close"].pct_change().dropna()
 
         # Align the dataframes by date
         combined_returns = pd.DataFrame(
@@ -2,14 +2,24 @@ from typing import List
 from datetime import datetime, date
 from investor_intelligence.models.portfolio import Portfolio, StockHolding
 from investor_intelligence.tools.alpha_vantage_tool import (
+    get_batch_quotes,
     get_current_price,
     get_earnings_calendar,
 )
 from investor_intelligence.services.alert_service import AlertService
 from investor_intelligence.models.alert import Alert
 from investor_intelligence.ml.relevance_model import RelevanceModel
-from investor_intelligence.services.user_config_service import UserConfigService
+from investor_intelligence.utils.metrics import BatchLatencyTracker
 import time
+from collections import defaultdict
+
+
+def _group_events_by_symbol(earnings_calendar: List[dict]) -> dict:
+    """Indexes earnings calendar events by upper-cased symbol, preserving order."""
+    events_by_symbol = defaultdict(list)
+    for event in earnings_calendar:
+        events_by_symbol[event.get("symbol", "").upper()].append(event)
+    return events_by_symbol
 
 
 class MonitoringService:
@@ -18,7 +28,8 @@ class MonitoringService:
     def __init__(self, alert_service: AlertService, relevance_model: RelevanceModel):
         self.alert_service = alert_service
         self.relevance_model = RelevanceModel()
-        self.user_config_service = UserConfigService()
+        # Same preferences store as the alert service, so both read one database
+        self.user_config_service = alert_service.user_config_service
 
     def monitor_earnings_reports(self, user_id: str, portfolio: Portfolio):
         """Monitors upcoming earnings reports for stocks in a given portfolio and generates alerts."""
@@ -33,88 +44,83 @@ class MonitoringService:
             )
             return
 
+        events_by_symbol = _group_events_by_symbol(earnings_calendar)
+        today = datetime.now().date()
         for holding in portfolio.holdings:
             print(f"  - Checking earnings for {holding.symbol}...")
-            for event in earnings_calendar:
-                if event.get("symbol", "").upper() == holding.symbol.upper():
-                    report_date_str = event.get("reportDate", "")
-                    try:
-                        report_date = datetime.strptime(
-                            report_date_str, "%Y-%m-%d"
-                        ).date()
-                        if (
-                            report_date >= datetime.now().date()
-                        ):  # Only alert for future earnings
-                            days_until = (report_date - datetime.now().date()).days
-                            message = f"ALERT: Earnings report for {holding.symbol} is scheduled for {report_date_str} ({days_until} days from now)."
-
-                            # Check if we already have an alert for this earnings event
-                            existing_alerts = self.alert_service.get_alerts_for_user(
-                                user_id, active_only=True
-                            )
-                            alert_exists = any(
-                                alert.alert_type == "earnings_report"
-                                and alert.symbol == holding.symbol
-                                and report_date_str in alert.message
-                                for alert in existing_alerts
-                            )
+            for event in events_by_symbol.get(holding.symbol.upper(), ()):
+                report_date_str = event.get("reportDate", "")
+                try:
+                    report_date = datetime.strptime(report_date_str, "%Y-%m-%d").date()
+                    if report_date >= today:  # Only alert for future earnings
+                        days_until = (report_date - today).days
+                        message = f"ALERT: Earnings report for {holding.symbol} is scheduled for {report_date_str} ({days_until} days from now)."
+
+                        # Check if we already have an alert for this earnings event
+                        existing_alerts = self.alert_service.get_alerts_for_user(
+                            user_id, active_only=True
+                        )
+                        alert_exists = any(
+                            alert.alert_type == "earnings_report"
+                            and alert.symbol == holding.symbol
+                            and report_date_str in alert.message
+                            for alert in existing_alerts
+                        )
 
-                            if not alert_exists:
-                                # Calculate relevance score
-                                user_preferences = self.alert_service.user_config_service.get_user_config(
+                        if not alert_exists:
+                            # Calculate relevance score
+                            user_preferences = (
+                                self.alert_service.user_config_service.get_user_config(
                                     user_id
                                 )
-                                portfolio_context = {
-                                    "symbol_held": [
-                                        h.symbol for h in portfolio.holdings
-                                    ],
-                                    "holdings_quantity": {
-                                        h.symbol: h.quantity for h in portfolio.holdings
-                                    },
-                                    "portfolio_value": sum(
-                                        h.quantity * get_current_price(h.symbol)
-                                        for h in portfolio.holdings
-                                        if get_current_price(h.symbol) is not None
-                                    ),
-                                }
-                                alert_dict = {
-                                    "type": "earnings_report",
-                                    "symbol": holding.symbol,
-                                    "report_date": report_date_str,
-                                }
-                                relevance_score = (
-                                    self.relevance_model.predict_relevance(
-                                        alert_dict, user_preferences, portfolio_context
-                                    )
-                                )
-                                new_alert = Alert(
-                                    user_id=user_id,
-                                    portfolio_id=portfolio.user_id,
-                                    alert_type="earnings_report",
-                                    symbol=holding.symbol,
-                                    message=message,
-                                    triggered_at=datetime.now(),
-                                    relevance_score=relevance_score,
-                                )
-                                # Filter the alert before creating
-                                filtered = self.alert_service.filter_alerts(
-                                    [new_alert], user_id
-                                )
-                                if filtered:
-                                    self.alert_service.create_alert(filtered[0])
-                                    print(f"    {message}")
-                                else:
-                                    print(
-                                        f"    Alert for {holding.symbol} filtered out by user preferences."
-                                    )
+                            )
+                            portfolio_context = {
+                                "symbol_held": [h.symbol for h in portfolio.holdings],
+                                "holdings_quantity": {
+                                    h.symbol: h.quantity for h in portfolio.holdings
+                                },
+                                "portfolio_value": sum(
+                                    h.quantity * get_current_price(h.symbol)
+                                    for h in portfolio.holdings
+                                    if get_current_price(h.symbol) is not None
+                                ),
+                            }
+                            alert_dict = {
+                                "type": "earnings_report",
+                                "symbol": holding.symbol,
+                                "report_date": report_date_str,
+                            }
+                            relevance_score = self.relevance_model.predict_relevance(
+                                alert_dict, user_preferences, portfolio_context
+                            )
+                            new_alert = Alert(
+                                user_id=user_id,
+                                portfolio_id=portfolio.user_id,
+                                alert_type="earnings_report",
+                                symbol=holding.symbol,
+                                message=message,
+                                triggered_at=datetime.now(),
+                                relevance_score=relevance_score,
+                            )
+                            # Filter the alert before creating
+                            filtered = self.alert_service.filter_alerts(
+                                [new_alert], user_id
+                            )
+                            if filtered:
+                                self.alert_service.create_alert(filtered[0])
+                                print(f"    {message}")
                             else:
                                 print(
-                                    f"    Alert already exists for {holding.symbol} earnings on {report_date_str}"
+                                    f"    Alert for {holding.symbol} filtered out by user preferences."
                                 )
-                    except ValueError:
-                        print(
-                            f"    Invalid report date format for {holding.symbol}: {report_date_str}"
-                        )
+                        else:
+                            print(
+                                f"    Alert already exists for {holding.symbol} earnings on {report_date_str}"
+                            )
+                except ValueError:
+                    print(
+                        f"    Invalid report date format for {holding.symbol}: {report_date_str}"
+                    )
 
     def generate_earnings_summary(self, user_id: str, portfolio: Portfolio) -> str:
         """Generates a summary of upcoming earnings reports for the portfolio."""
@@ -126,23 +132,22 @@ class MonitoringService:
             return "\n".join(summary_lines)
 
         found_earnings = False
+        events_by_symbol = _group_events_by_symbol(earnings_calendar)
+        today = datetime.now().date()
         for holding in portfolio.holdings:
-            for event in earnings_calendar:
-                if event.get("symbol", "").upper() == holding.symbol.upper():
-                    report_date_str = event.get("reportDate", "")
-                    try:
-                        report_date = datetime.strptime(
-                            report_date_str, "%Y-%m-%d"
-                        ).date()
-                        if report_date >= datetime.now().date():
-                            days_until = (report_date - datetime.now().date()).days
-                            fiscal_date = event.get("fiscalDateEnding", "N/A")
-                            summary_lines.append(
-                                f"  - {holding.symbol}: Report due on {report_date_str} ({days_until} days) - Fiscal Date Ending: {fiscal_date}\n"
-                            )
-                            found_earnings = True
-                    except ValueError:
-                        pass  # Skip invalid dates
+            for event in events_by_symbol.get(holding.symbol.upper(), ()):
+                report_date_str = event.get("reportDate", "")
+                try:
+                    report_date = datetime.strptime(report_date_str, "%Y-%m-%d").date()
+                    if report_date >= today:
+                        days_until = (report_date - today).days
+                        fiscal_date = event.get("fiscalDateEnding", "N/A")
+                        summary_lines.append(
+                            f"  - {holding.symbol}: Report due on {report_date_str} ({days_until} days) - Fiscal Date Ending: {fiscal_date}\n"
+                        )
+                        found_earnings = True
+                except ValueError:
+                    pass  # Skip invalid dates
 
         if not found_earnings:
             summary_lines.append(
@@ -199,86 +204,99 @@ class MonitoringService:
         from datetime import timedelta
         from investor_intelligence.tools.news_tool import get_news_articles
 
-        for holding in portfolio.holdings:
-            print(f"  - Checking news for {holding.symbol}...")
-            # Fetch news for the last 24 hours
-            from_date = (datetime.now() - timedelta(days=1)).isoformat()
-            to_date = datetime.now().isoformat()
-            articles = get_news_articles(
-                holding.symbol, from_date=from_date, to_date=to_date, page_size=5
-            )
-            if not articles:
-                print(f"    No recent news found for {holding.symbol}.")
-                continue
-            for article in articles:
-                title = article.get("title", "")
-                description = article.get("description", "")
-                content = f"{title}. {description}"
-                sentiment = self.analyze_sentiment(content)
-                if sentiment != "neutral":
-                    message = f"NEWS ALERT: {holding.symbol} - {sentiment.upper()} sentiment detected in news: \"{title}\". URL: {article.get('url')}"
-                    # Prevent duplicate alerts for the same article/sentiment
-                    existing_alerts = self.alert_service.get_alerts_for_user(
-                        user_id, active_only=True
+        # News from the last 24 hours. The start is truncated to the hour and the
+        # end left to default to now, so repeated checks hit the news cache
+        # instead of building a new key every time
+        from_date = (
+            datetime.now().replace(minute=0, second=0, microsecond=0)
+            - timedelta(days=1)
+        ).isoformat()
+
+        with BatchLatencyTracker() as batch:
+            for holding in portfolio.holdings:
+                print(f"  - Checking news for {holding.symbol}...")
+                with batch.track(
+                    "get_news_articles",
+                    "monitoring_service",
+                    metadata={"symbol": holding.symbol},
+                ):
+                    articles = get_news_articles(
+                        holding.symbol,
+                        from_date=from_date,
+                        page_size=5,
                     )
-                    alert_exists = any(
-                        alert.alert_type == "news_sentiment"
-                        and alert.symbol == holding.symbol
-                        and alert.message == message
-                        for alert in existing_alerts
-                    )
-                    if not alert_exists:
-                        # Calculate relevance score
-                        user_preferences = (
-                            self.alert_service.user_config_service.get_user_config(
-                                user_id
-                            )
-                        )
-
-                        portfolio_context = {
-                            "symbol_held": [h.symbol for h in portfolio.holdings],
-                            "holdings_quantity": {
-                                h.symbol: h.quantity for h in portfolio.holdings
-                            },
-                            "portfolio_value": sum(
-                                h.quantity * get_current_price(h.symbol)
-                                for h in portfolio.holdings
-                                if get_current_price(h.symbol) is not None
-                            ),
-                        }
-                        alert_dict = {
-                            "type": "news_sentiment",
-                            "symbol": holding.symbol,
-                            "sentiment": sentiment,
-                            "title": title,
-                        }
-                        relevance_score = self.relevance_model.predict_relevance(
-                            alert_dict, user_preferences, portfolio_context
+                if not articles:
+                    print(f"    No recent news found for {holding.symbol}.")
+                    continue
+                for article in articles:
+                    title = article.get("title", "")
+                    description = article.get("description", "")
+                    content = f"{title}. {description}"
+                    sentiment = self.analyze_sentiment(content)
+                    if sentiment != "neutral":
+                        message = f"NEWS ALERT: {holding.symbol} - {sentiment.upper()} sentiment detected in news: \"{title}\". URL: {article.get('url')}"
+                        # Prevent duplicate alerts for the same article/sentiment
+                        existing_alerts = self.alert_service.get_alerts_for_user(
+                            user_id, active_only=True
                         )
-                        new_alert = Alert(
-                            user_id=user_id,
-                            portfolio_id=portfolio.user_id,
-                            alert_type="news_sentiment",
-                            symbol=holding.symbol,
-                            message=message,
-                            triggered_at=datetime.now(),
-                            relevance_score=relevance_score,
+                        alert_exists = any(
+                            alert.alert_type == "news_sentiment"
+                            and alert.symbol == holding.symbol
+                            and alert.message == message
+                            for alert in existing_alerts
                         )
-                        # Filter the alert before creating
-                        filtered = self.alert_service.filter_alerts(
-                            [new_alert], user_id
-                        )
-                        if filtered:
-                            self.alert_service.create_alert(filtered[0])
-                            print(f"    {message}")
+                        if not alert_exists:
+                            # Calculate relevance score
+                            user_preferences = (
+                                self.alert_service.user_config_service.get_user_config(
+                                    user_id
+                                )
+                            )
+
+                            portfolio_context = {
+                                "symbol_held": [h.symbol for h in portfolio.holdings],
+                                "holdings_quantity": {
+                                    h.symbol: h.quantity for h in portfolio.holdings
+                                },
+                                "portfolio_value": sum(
+                                    h.quantity * get_current_price(h.symbol)
+                                    for h in portfolio.holdings
+                                    if get_current_price(h.symbol) is not None
+                                ),
+                            }
+                            alert_dict = {
+                                "type": "news_sentiment",
+                                "symbol": holding.symbol,
+                                "sentiment": sentiment,
+                                "title": title,
+                            }
+                            relevance_score = self.relevance_model.predict_relevance(
+                                alert_dict, user_preferences, portfolio_context
+                            )
+                            new_alert = Alert(
+                                user_id=user_id,
+                                portfolio_id=portfolio.user_id,
+                                alert_type="news_sentiment",
+                                symbol=holding.symbol,
+                                message=message,
+                                triggered_at=datetime.now(),
+                                relevance_score=relevance_score,
+                            )
+                            # Filter the alert before creating
+                            filtered = self.alert_service.filter_alerts(
+                                [new_alert], user_id
+                            )
+                            if filtered:
+                                self.alert_service.create_alert(filtered[0])
+                                print(f"    {message}")
+                            else:
+                                print(
+                                    f"    News sentiment alert for {holding.symbol} filtered out by user preferences."
+                                )
                         else:
                             print(
-                                f"    News sentiment alert for {holding.symbol} filtered out by user preferences."
+                                f"    Duplicate news sentiment alert for {holding.symbol} already exists."
                             )
-                    else:
-                        print(
-                            f"    Duplicate news sentiment alert for {holding.symbol} already exists."
-                        )
 
     def monitor_price_changes(self, user_id: str, portfolio: Portfolio, threshold):
         """Monitors price changes for stocks in a given portfolio and generates alerts.
@@ -291,9 +309,20 @@ class MonitoringService:
         print(
             f"\nMonitoring price changes for portfolio {portfolio.name} (User: {user_id})..."
         )
+        # One batch quote request for the whole portfolio
+        start_time = time.time()
+        prices = get_batch_quotes([h.symbol for h in portfolio.holdings])
+        end_time = time.time()
+        print(f"Get current prices took: {end_time - start_time:.4f} seconds")
+        portfolio_value = sum(
+            h.quantity * prices[h.symbol]
+            for h in portfolio.holdings
+            if h.symbol in prices
+        )
+
         for holding in portfolio.holdings:
             print(f"  - Checking price for {holding.symbol}...")
-            current_price = get_current_price(holding.symbol)
+            current_price = prices.get(holding.symbol)
             if current_price is None:
                 print(
                     f"Could not retrieve current price for {holding.symbol}. Skipping price change for this holding."
@@ -332,11 +361,7 @@ class MonitoringService:
                         "holdings_quantity": {
                             h.symbol: h.quantity for h in portfolio.holdings
                         },
-                        "portfolio_value": sum(
-                            h.quantity * get_current_price(h.symbol)
-                            for h in portfolio.holdings
-                            if get_current_price(h.symbol) is not None
-                        ),
+                        "portfolio_value": portfolio_value,
                     }
                     alert_dict = {
                         "type": alert_type,
@@ -384,13 +409,6 @@ class MonitoringService:
                     f"    Previous price for {holding.symbol} is not valid. Cannot calculate change."
                 )
 
-        start_time = time.time()
-        current_price = get_current_price(holding.symbol)
-        end_time = time.time()
-        print(
-            f"Get current price time for {holding.symbol} took: {end_time - start_time:.4f} seconds"
-        )
-
 
 if __name__ == "__main__":
 
@@ -1,14 +1,58 @@
 from typing import List, Optional
-from datetime import date, datetime
+from datetime import date
+
+import pandas as pd
 
 from investor_intelligence.models.portfolio import Portfolio, StockHolding
 from investor_intelligence.tools.sheets_tool import (
     read_spreadsheet_data,
     get_sheets_service,
+    clear_spreadsheet_cache,
 )
+from investor_intelligence.utils.google_api import GOOGLE_API_RETRIES
 from investor_intelligence.utils.metrics import track_latency
 
 
+def _parse_holdings(data_rows: List[list]) -> List[StockHolding]:
+    """Converts sheet rows (symbol, quantity, price, YYYY-MM-DD date) to holdings.
+
+    The columns are converted all at once; rows that StockHolding would reject (a
+    missing cell or blank symbol, a quantity that isn't a positive whole number, a
+    price that isn't a positive number or a malformed date) are reported and skipped.
+    """
+    # Short rows are padded with NaN, which every check below rejects
+    frame = pd.DataFrame(data_rows).reindex(columns=range(4))
+    symbols = frame[0].astype(str).str.strip()
+    quantities = pd.to_numeric(frame[1], errors="coerce")
+    prices = pd.to_numeric(frame[2], errors="coerce")
+    dates = pd.to_datetime(
+        frame[3].astype(str).str.strip(), format="%Y-%m-%d", errors="coerce"
+    )
+    valid = (
+        frame[0].notna()
+        & (symbols != "")
+        & (quantities % 1 == 0)
+        & (quantities > 0)
+        & (prices > 0)
+        & dates.notna()
+    )
+
+    for position in frame.index[~valid]:
+        print(f"Skipping invalid row: {data_rows[position]}")
+
+    return [
+        StockHolding(
+            symbol=symbol,
+            quantity=int(quantity),
+            purchase_price=float(price),
+            purchase_date=purchase_date.date(),
+        )
+        for symbol, quantity, price, purchase_date in zip(
+            symbols[valid], quantities[valid], prices[valid], dates[valid]
+        )
+    ]
+
+
 class PortfolioService:
     """Manages user portfolios, including loading from Google Sheets."""
 
@@ -37,29 +81,7 @@ class PortfolioService:
             # Assuming the first row is headers, skip it
             headers = sheet_data[0]
             data_rows = sheet_data[1:]
-
-            holdings: List[StockHolding] = []
-            for row in data_rows:
-                try:
-                    # Basic validation and type conversion
-                    symbol = str(row[0]).strip()
-                    quantity = int(row[1])
-                    purchase_price = float(row[2])
-                    # Parse date in YYYY-MM-DD format
-                    purchase_date = datetime.strptime(
-                        str(row[3]).strip(), "%Y-%m-%d"
-                    ).date()
-
-                    holding = StockHolding(
-                        symbol=symbol,
-                        quantity=quantity,
-                        purchase_price=purchase_price,
-                        purchase_date=purchase_date,
-                    )
-                    holdings.append(holding)
-                except (ValueError, IndexError) as e:
-                    print(f"Skipping invalid row: {row}. Error: {e}")
-                    continue
+            holdings = _parse_holdings(data_rows)
 
             self._portfolio = Portfolio(
                 user_id=user_id, name=portfolio_name, holdings=holdings
@@ -116,15 +138,10 @@ class PortfolioService:
 
         # Prepare data: header + holdings
         data = [["Stock Symbol", "Quantity", "Purchase Price", "Purchase Date"]]
-        for holding in self._portfolio.holdings:
-            data.append(
-                [
-                    holding.symbol,
-                    holding.quantity,
-                    holding.purchase_price,
-                    holding.purchase_date.strftime("%Y-%m-%d"),
-                ]
-            )
+        data.extend(
+            [h.symbol, h.quantity, h.purchase_price, h.purchase_date.isoformat()]
+            for h in self._portfolio.holdings
+        )
 
         body = {"values": data}
 
@@ -136,9 +153,10 @@ class PortfolioService:
                 valueInputOption="RAW",
                 body=body,
             )
-            .execute()
+            .execute(num_retries=GOOGLE_API_RETRIES)
         )
 
+        clear_spreadsheet_cache()  # Later loads must see what was just written
         print(f"{result.get('updatedCells')} cells updated in Google Sheet.")
         return True
 
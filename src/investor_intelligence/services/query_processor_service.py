@@ -5,7 +5,7 @@ from investor_intelligence.tools.alpha_vantage_tool import (
     get_quote_endpoint,
     get_earnings_calendar,
 )
-from investor_intelligence.tools.news_tool import get_news_articles
+from investor_intelligence.tools.news_tool import get_recent_news_articles
 from investor_intelligence.models.portfolio import Portfolio
 
 
@@ -71,8 +71,9 @@ class QueryProcessorService:
                     )
                     if earnings_data:
                         found_earnings = False
+                        symbol_upper = symbol.upper()
                         for event in earnings_data:
-                            if event.get("symbol", "").upper() == symbol.upper():
+                            if event.get("symbol", "").upper() == symbol_upper:
                                 response_lines.append(
                                     f"- {symbol}: Report Date: {event.get('reportDate')}, Fiscal Date Ending: {event.get('fiscalDateEnding')}\n"
                                 )
@@ -97,7 +98,7 @@ class QueryProcessorService:
                     "Here are the latest news headlines for your requested symbols:\n"
                 )
                 for symbol in symbols:
-                    articles = get_news_articles(symbol, page_size=3)
+                    articles = get_recent_news_articles(symbol, page_size=3)
                     if articles:
                         for article in articles:
                             response_lines.append(
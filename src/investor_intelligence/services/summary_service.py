@@ -1,16 +1,54 @@
-from typing import List
-from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from datetime import date, datetime, timedelta
+
+import numpy as np
 
 from investor_intelligence.models.portfolio import Portfolio, StockHolding
 from investor_intelligence.models.alert import Alert
 from investor_intelligence.services.alert_service import AlertService
 from investor_intelligence.services.monitoring_service import MonitoringService
 from investor_intelligence.tools.alpha_vantage_tool import (
-    get_quote_endpoint,
-    get_time_series_data,
-    get_historical_data,
+    get_batch_quotes,
+    fetch_daily_series,
+)
+
+_PRICE_ALERT_TYPES = frozenset({"price_drop", "price_gain"})
+_NEWS_ALERT_TYPES = frozenset({"news_sentiment"})
+_DAILY_ALERT_TYPES = _PRICE_ALERT_TYPES | _NEWS_ALERT_TYPES
+
+_SEPARATOR = "====================================================="
+_DISCLAIMER = "Disclaimer: This information is for educational purposes only and not financial advice."
+_DAILY_FOOTER = (
+    _SEPARATOR,
+    "This is an automated summary from your Investor Intelligence Agent. ",
+    _DISCLAIMER,
+)
+_WEEKLY_FOOTER = (
+    _SEPARATOR,
+    "This is an automated weekly summary from your Investor Intelligence Agent. ",
+    _DISCLAIMER,
 )
 
+_EMPTY_DAILY_SUMMARY_TEMPLATE = "\n".join(
+    (
+        "Daily Investor Intelligence Summary for {name} ({date})",
+        _SEPARATOR,
+        "Your portfolio has no holdings, so there is nothing to report today.",
+        "",
+        *_DAILY_FOOTER,
+        "",
+    )
+)
+
+
+def _close_on_or_before(historical_data: Optional[dict], candidate_dates) -> float:
+    """Returns the close on the first candidate date present in the series, or NaN."""
+    if historical_data:
+        for date_str in candidate_dates:
+            if date_str in historical_data:
+                return float(historical_data[date_str]["4. close"])
+    return np.nan
+
 
 class SummaryService:
     """Service for generating email summaries of alerts and market intelligence."""
@@ -21,74 +59,128 @@ class SummaryService:
         self.alert_service = alert_service
         self.monitoring_service = monitoring_service
 
-    def generate_daily_summary(self, user_id: str, portfolio: Portfolio) -> str:
+    def generate_daily_summary(
+        self, user_id: str, portfolio: Portfolio, today: Optional[str] = None
+    ) -> str:
         """Generates a comprehensive daily summary for a user's portfolio.
 
         This summary includes:
         - Recent price change alerts
         - Upcoming earnings reports
         - Recent news sentiment alerts
+
+        Args:
+            user_id (str): The ID of the user.
+            portfolio (Portfolio): The user's portfolio.
+            today (str, optional): Today's date as YYYY-MM-DD. Batch jobs compute it once
+                and pass it in; defaults to the current local date.
+        """
+        if today is None:
+            today = date.today().isoformat()
+
+        if not portfolio.holdings:
+            # Nothing to look up: skip the earnings calendar and alert queries entirely
+            return _EMPTY_DAILY_SUMMARY_TEMPLATE.format(name=portfolio.name, date=today)
+
+        # Fetch the active price and news alerts that pass the user's preferences in
+        # one query
+        active_alerts = self.alert_service.get_filtered_alerts_for_user(
+            user_id, types=_DAILY_ALERT_TYPES, active_only=True
+        )
+        return self._render_daily_summary(user_id, portfolio, today, active_alerts)
+
+    def generate_daily_summaries(
+        self, portfolios: Dict[str, Portfolio], today: Optional[str] = None
+    ) -> Dict[str, str]:
+        """Generates the daily summaries of several users.
+
+        Produces the same text as calling generate_daily_summary for each user, but
+        the alerts of every user are fetched with a single query.
+
+        Args:
+            portfolios (Dict[str, Portfolio]): Each user ID mapped to its portfolio.
+            today (str, optional): Today's date as YYYY-MM-DD; defaults to the current
+                local date.
+
+        Returns:
+            Dict[str, str]: Each user ID mapped to its summary.
         """
+        if today is None:
+            today = date.today().isoformat()
+
+        # Users with empty portfolios get the short summary and need no alerts
+        alerts_by_user = self.alert_service.get_alerts_for_users(
+            [user_id for user_id, p in portfolios.items() if p.holdings],
+            active_only=True,
+            alert_types=_DAILY_ALERT_TYPES,
+        )
+
+        summaries = {}
+        for user_id, portfolio in portfolios.items():
+            if user_id in alerts_by_user:
+                active_alerts = self.alert_service.filter_alerts(
+                    alerts_by_user[user_id], user_id
+                )
+                summaries[user_id] = self._render_daily_summary(
+                    user_id, portfolio, today, active_alerts
+                )
+            else:
+                summaries[user_id] = _EMPTY_DAILY_SUMMARY_TEMPLATE.format(
+                    name=portfolio.name, date=today
+                )
+        return summaries
+
+    def _render_daily_summary(
+        self,
+        user_id: str,
+        portfolio: Portfolio,
+        today: str,
+        active_alerts: List[Alert],
+    ) -> str:
+        """Builds the daily summary of a non-empty portfolio from its filtered alerts."""
+        # Lines are joined with newlines at the end; "" produces a blank line
         summary_lines = [
-            f"Daily Investor Intelligence Summary for {portfolio.name} ({datetime.now().strftime('%Y-%m-%d')})\n"
+            f"Daily Investor Intelligence Summary for {portfolio.name} ({today})",
+            _SEPARATOR,
         ]
-        summary_lines.append("=====================================================\n")
+
+        price_alerts = [a for a in active_alerts if a.alert_type in _PRICE_ALERT_TYPES]
+        news_alerts = [a for a in active_alerts if a.alert_type in _NEWS_ALERT_TYPES]
 
         # 1. Price Change Alerts
-        summary_lines.append("## Price Change Alerts\n")
-        all_price_alerts = [
-            alert
-            for alert in self.alert_service.get_alerts_for_user(
-                user_id, active_only=True
-            )
-            if alert.alert_type in ["price_drop", "price_gain"]
-        ]
-        price_alerts = self.alert_service.filter_alerts(all_price_alerts, user_id)
+        summary_lines.append("## Price Change Alerts")
         if price_alerts:
             for alert in price_alerts:
-                summary_lines.append(f"- {alert.message}\n")
+                summary_lines.append(f"- {alert.message}")
                 # Optionally deactivate price alerts after including them in summary
                 # self.alert_service.deactivate_alert(alert.id)
         else:
-            summary_lines.append("No significant price changes detected.\n")
-        summary_lines.append("\n")
+            summary_lines.append("No significant price changes detected.")
+        summary_lines.append("")
 
         # 2. Earnings Reports
-        summary_lines.append("## Upcoming Earnings Reports\n")
+        summary_lines.append("## Upcoming Earnings Reports")
         earnings_summary_text = self.monitoring_service.generate_earnings_summary(
             user_id, portfolio
         )
+        # The earnings text brings its own line breaks; the join terminates it
         summary_lines.append(earnings_summary_text)
-        summary_lines.append("\n")
 
         # 3. News Sentiment Alerts
-        summary_lines.append("## News Sentiment Alerts\n")
-        all_news_alerts = [
-            alert
-            for alert in self.alert_service.get_alerts_for_user(
-                user_id, active_only=True
-            )
-            if alert.alert_type == "news_sentiment"
-        ]
-        news_alerts = self.alert_service.filter_alerts(all_news_alerts, user_id)
+        summary_lines.append("## News Sentiment Alerts")
         if news_alerts:
             for alert in news_alerts:
-                summary_lines.append(f"- {alert.message}\n")
+                summary_lines.append(f"- {alert.message}")
                 # Optionally deactivate news alerts after including them in summary
                 # self.alert_service.deactivate_alert(alert.id)
         else:
-            summary_lines.append("No significant news sentiment detected.\n")
-        summary_lines.append("\n")
+            summary_lines.append("No significant news sentiment detected.")
+        summary_lines.append("")
 
-        summary_lines.append("=====================================================\n")
-        summary_lines.append(
-            "This is an automated summary from your Investor Intelligence Agent. \n"
-        )
-        summary_lines.append(
-            "Disclaimer: This information is for educational purposes only and not financial advice.\n"
-        )
+        summary_lines.extend(_DAILY_FOOTER)
+        summary_lines.append("")
 
-        return "".join(summary_lines)
+        return "\n".join(summary_lines)
 
     def generate_weekly_summary(self, user_id: str, portfolio: Portfolio) -> str:
         """Generates a comprehensive weekly summary for a user's portfolio.
@@ -98,97 +190,106 @@ class SummaryService:
         - Market trend analysis (basic)
         - Consolidated alerts from the week
         """
+        # Read the clock once; every date below is derived from it
+        now = datetime.now()
+        one_week_ago = now - timedelta(days=7)
+
+        # Lines are joined with newlines at the end; "" produces a blank line
         summary_lines = [
-            f"Weekly Investor Intelligence Summary for {portfolio.name} ({datetime.now().strftime('%Y-%m-%d')})\n"
+            f"Weekly Investor Intelligence Summary for {portfolio.name} ({now.date().isoformat()})",
+            _SEPARATOR,
         ]
-        summary_lines.append("=====================================================\n")
 
         # 1. Portfolio Performance Overview
-        summary_lines.append("## Portfolio Performance Overview (Last 7 Days)\n")
-        total_current_value = 0.0
-        total_initial_value = 0.0
-
-        for holding in portfolio.holdings:
-            current_price_data = get_quote_endpoint(holding.symbol)
-            if current_price_data:
-                current_price = float(current_price_data["05. price"])
-                holding_value = current_price * holding.quantity
-                print(
-                    f"{holding.symbol}: {holding.quantity} × ${current_price:.2f} = ${holding_value:.2f}"
-                )
-                total_current_value += holding_value
-
-            # Get historical price from 7 days ago
-            historical_data = get_historical_data(
-                holding.symbol, interval="1d", outputsize="full"
-            )
-            if historical_data:
-                # Find the closest date to 7 days ago
-                seven_days_ago = (datetime.now() - timedelta(days=7)).strftime(
-                    "%Y-%m-%d"
-                )
-                historical_price_7_days_ago = None
-                for date_str, data in historical_data.items():
-                    if date_str <= seven_days_ago:
-                        historical_price_7_days_ago = float(data["4. close"])
-                        break
-
-                if historical_price_7_days_ago:
-                    total_initial_value += (
-                        historical_price_7_days_ago * holding.quantity
-                    )
-
-        if total_initial_value > 0:
-            weekly_change_percent = (
-                (total_current_value - total_initial_value) / total_initial_value
-            ) * 100
-            summary_lines.append(f"Total Portfolio Value: ${total_current_value:.2f}\n")
-            summary_lines.append(f"Weekly Change: {weekly_change_percent:.2f}%\n")
+        summary_lines.append("## Portfolio Performance Overview (Last 7 Days)")
+        if portfolio.holdings:
+            self._append_weekly_performance(summary_lines, portfolio, one_week_ago)
         else:
-            summary_lines.append(
-                "Cannot calculate weekly change (insufficient historical data or initial value).\n"
-            )
-        summary_lines.append("\n")
+            # Nothing to price: skip the quote and history requests entirely
+            summary_lines.append("No holdings in portfolio.")
+        summary_lines.append("")
 
         # 2. Consolidated Alerts from the Week
-        summary_lines.append("## Alerts from the Past Week\n")
-        one_week_ago = datetime.now() - timedelta(days=7)
-        all_weekly_alerts = [
-            alert
-            for alert in self.alert_service.get_alerts_for_user(
-                user_id, active_only=False
-            )
-            if alert.created_at >= one_week_ago
-        ]
-        weekly_alerts = self.alert_service.filter_alerts(all_weekly_alerts, user_id)
+        summary_lines.append("## Alerts from the Past Week")
+        weekly_alerts = self.alert_service.get_filtered_alerts_for_user(
+            user_id, since=one_week_ago, active_only=False
+        )
 
         if weekly_alerts:
             for alert in weekly_alerts:
                 summary_lines.append(
-                    f"- [{alert.created_at.strftime('%Y-%m-%d %H:%M')}] {alert.alert_type.upper()} for {alert.symbol}: {alert.message}\n"
+                    f"- [{alert.created_at.strftime('%Y-%m-%d %H:%M')}] {alert.alert_type.upper()} for {alert.symbol}: {alert.message}"
                 )
         else:
-            summary_lines.append("No new alerts generated in the past week.\n")
-        summary_lines.append("\n")
+            summary_lines.append("No new alerts generated in the past week.")
+        summary_lines.append("")
 
         # 3. Market Trend Analysis (Basic)
-        summary_lines.append("## Basic Market Trend Analysis\n")
+        summary_lines.append("## Basic Market Trend Analysis")
         # This is a placeholder. A real implementation would involve analyzing
         # broader market indices (e.g., S&P 500) or economic indicators.
         summary_lines.append(
-            "Market trends will be analyzed in more detail in future updates.\n"
+            "Market trends will be analyzed in more detail in future updates."
         )
-        summary_lines.append("\n")
+        summary_lines.append("")
 
-        summary_lines.append("=====================================================\n")
-        summary_lines.append(
-            "This is an automated weekly summary from your Investor Intelligence Agent. \n"
+        summary_lines.extend(_WEEKLY_FOOTER)
+        summary_lines.append("")
+
+        return "\n".join(summary_lines)
+
+    def _append_weekly_performance(
+        self, summary_lines: List[str], portfolio: Portfolio, one_week_ago: datetime
+    ):
+        """Appends the total value and weekly change of a non-empty portfolio."""
+        # The date 7 days ago, then up to 5 earlier days in case it fell on a
+        # weekend or market holiday
+        target = one_week_ago.date()
+        candidate_dates = [
+            (target - timedelta(days=days)).isoformat() for days in range(6)
+        ]
+
+        # One batch request for current prices, then concurrent history fetches for
+        # the symbols that got one; a holding without a current price can't be
+        # compared, so its history isn't worth a request. The latest 100 daily bars
+        # reach back far enough.
+        symbols = [h.symbol for h in portfolio.holdings]
+        current_prices = get_batch_quotes(symbols)
+        priced_symbols = [symbol for symbol in symbols if symbol in current_prices]
+        historical_by_symbol = (
+            fetch_daily_series(priced_symbols, outputsize="compact")
+            if priced_symbols
+            else {}
         )
-        summary_lines.append(
-            "Disclaimer: This information is for educational purposes only and not financial advice.\n"
+
+        # Missing prices are NaN so nansum leaves those holdings out of each total
+        quantities = np.array(
+            [h.quantity for h in portfolio.holdings], dtype=np.float64
+        )
+        prices = np.array(
+            [current_prices.get(symbol, np.nan) for symbol in symbols],
+            dtype=np.float64,
         )
+        prices_7_days_ago = np.array(
+            [
+                _close_on_or_before(historical_by_symbol.get(symbol), candidate_dates)
+                for symbol in symbols
+            ],
+            dtype=np.float64,
+        )
+        total_current_value = float(np.nansum(prices * quantities))
+        total_initial_value = float(np.nansum(prices_7_days_ago * quantities))
 
-        return "".join(summary_lines)
+        if total_initial_value > 0:
+            weekly_change_percent = (
+                (total_current_value - total_initial_value) / total_initial_value
+            ) * 100
+            summary_lines.append(f"Total Portfolio Value: ${total_current_value:.2f}")
+            summary_lines.append(f"Weekly Change: {weekly_change_percent:.2f}%")
+        else:
+            summary_lines.append(
+                "Cannot calculate weekly change (insufficient historical data or initial value)."
+            )
 
 
 if __name__ == "__main__":
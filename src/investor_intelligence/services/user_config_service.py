@@ -1,14 +1,65 @@
 import sqlite3
-import json
 import os
-from typing import Dict, Any
+import threading
+from typing import Dict, Any, List, Optional, Tuple
+
+import orjson
+
+from investor_intelligence.utils.db import get_connection
+
+# Stored in place of a NULL portfolio_id for global user configs. NULLs are
+# distinct in a SQLite primary key, so INSERT OR REPLACE would never replace them.
+_GLOBAL_PORTFOLIO_ID = ""
+
+# Shared by the single and bulk save paths so sqlite3's statement cache reuses
+# one prepared statement
+_UPSERT_CONFIG_SQL = "INSERT OR REPLACE INTO user_configs (user_id, portfolio_id, config_json) VALUES (?, ?, ?)"
+
+
+def _config_row(
+    user_id: str, config: Dict[str, Any], portfolio_id: Optional[str]
+) -> Tuple[str, str, str]:
+    # Ensure risk_profile is present
+    if "risk_profile" not in config:
+        config["risk_profile"] = "moderate"
+    return (
+        user_id,
+        portfolio_id or _GLOBAL_PORTFOLIO_ID,
+        orjson.dumps(config).decode("utf-8"),
+    )
 
 
 class UserConfigService:
     """Service for managing user-specific configurations and preferences."""
 
-    def __init__(self):
-        self._ensure_data_directory()
+    # Instances share one connection per database file, and a transaction is per
+    # connection; writers hold this so a single save never lands inside (or
+    # collides with) another thread's bulk save transaction
+    _write_lock = threading.Lock()
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        connection: Optional[sqlite3.Connection] = None,
+    ):
+        """Opens the user configs database.
+
+        Args:
+            db_path (str, optional): Path of the database file. Defaults to
+                data/user_configs.db under the project root.
+            connection (sqlite3.Connection, optional): An open database to keep the
+                configs in instead, e.g. a test's in-memory database.
+        """
+        self._db_path = os.fspath(db_path) if db_path is not None else None
+        if connection is not None:
+            self._conn = connection
+        else:
+            self._ensure_data_directory()
+            try:
+                # Shared with every other instance using this file; never closed here
+                self._conn = get_connection(self.DB_FILE)
+            except sqlite3.OperationalError as e:
+                raise RuntimeError(f"Cannot open database at {self.DB_FILE}: {e}")
         self._create_table()
 
     def _get_project_root(self):
@@ -39,6 +90,8 @@ class UserConfigService:
     @property
     def DB_FILE(self):
         """Get the database file path."""
+        if self._db_path is not None:
+            return self._db_path
         project_root = self._get_project_root()
         return os.path.join(project_root, "data", "user_configs.db")
 
@@ -47,32 +100,41 @@ class UserConfigService:
         data_dir = os.path.dirname(self.DB_FILE)
         try:
             os.makedirs(data_dir, exist_ok=True)
-            # Test if the directory is writable
-            test_file = os.path.join(data_dir, ".test_write")
-            with open(test_file, "w") as f:
-                f.write("test")
-            os.remove(test_file)
         except (OSError, IOError) as e:
             raise RuntimeError(
                 f"Cannot create or write to data directory {data_dir}: {e}"
             )
+        if not os.access(data_dir, os.W_OK):
+            raise RuntimeError(f"Cannot write to data directory {data_dir}")
 
     def _create_table(self):
         try:
-            conn = sqlite3.connect(self.DB_FILE)
-            cursor = conn.cursor()
-            cursor.execute(
+            with self._write_lock:
+                self._conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS user_configs (
+                        user_id TEXT NOT NULL,
+                        portfolio_id TEXT,
+                        config_json TEXT NOT NULL,
+                        PRIMARY KEY (user_id, portfolio_id)
+                    )
                 """
-                CREATE TABLE IF NOT EXISTS user_configs (
-                    user_id TEXT NOT NULL,
-                    portfolio_id TEXT,
-                    config_json TEXT NOT NULL,
-                    PRIMARY KEY (user_id, portfolio_id)
                 )
-            """
-            )
-            conn.commit()
-            conn.close()
+                # Migrate global configs stored with a NULL portfolio_id, keeping the
+                # most recently written row per user
+                self._conn.execute(
+                    """
+                    DELETE FROM user_configs
+                    WHERE portfolio_id IS NULL AND rowid NOT IN (
+                        SELECT MAX(rowid) FROM user_configs
+                        WHERE portfolio_id IS NULL GROUP BY user_id
+                    )
+                """
+                )
+                self._conn.execute(
+                    "UPDATE OR REPLACE user_configs SET portfolio_id = ? WHERE portfolio_id IS NULL",
+                    (_GLOBAL_PORTFOLIO_ID,),
+                )
         except sqlite3.OperationalError as e:
             raise RuntimeError(f"Cannot create database at {self.DB_FILE}: {e}")
 
@@ -86,19 +148,37 @@ class UserConfigService:
             config (Dict[str, Any]): A dictionary containing the user's configuration. If 'risk_profile' is not present, it will be set to 'moderate' by default.
             portfolio_id (str, optional): The ID of the portfolio. If None, saves as a global user config.
         """
-        # Ensure risk_profile is present
-        if "risk_profile" not in config:
-            config["risk_profile"] = "moderate"
         try:
-            conn = sqlite3.connect(self.DB_FILE)
-            cursor = conn.cursor()
-            config_json = json.dumps(config)
-            cursor.execute(
-                "INSERT OR REPLACE INTO user_configs (user_id, portfolio_id, config_json) VALUES (?, ?, ?)",
-                (user_id, portfolio_id, config_json),
-            )
-            conn.commit()
-            conn.close()
+            with self._write_lock:
+                self._conn.execute(
+                    _UPSERT_CONFIG_SQL, _config_row(user_id, config, portfolio_id)
+                )
+        except sqlite3.OperationalError as e:
+            raise RuntimeError(f"Cannot access database at {self.DB_FILE}: {e}")
+
+    def save_user_configs(self, rows: List[Tuple[str, Optional[str], Dict[str, Any]]]):
+        """Saves or updates several configurations in a single transaction.
+
+        Args:
+            rows (List[Tuple[str, Optional[str], Dict[str, Any]]]): (user_id, portfolio_id, config)
+                tuples, with the same meaning and defaults as the arguments to save_user_config.
+        """
+        payload = [
+            _config_row(user_id, config, portfolio_id)
+            for user_id, portfolio_id, config in rows
+        ]
+        try:
+            with self._write_lock:
+                # A savepoint starts a transaction on an autocommit connection and
+                # nests inside one a caller already opened
+                self._conn.execute("SAVEPOINT save_user_configs")
+                try:
+                    self._conn.executemany(_UPSERT_CONFIG_SQL, payload)
+                except BaseException:
+                    self._conn.execute("ROLLBACK TO save_user_configs")
+                    self._conn.execute("RELEASE save_user_configs")
+                    raise
+                self._conn.execute("RELEASE save_user_configs")
         except sqlite3.OperationalError as e:
             raise RuntimeError(f"Cannot access database at {self.DB_FILE}: {e}")
 
@@ -113,16 +193,12 @@ class UserConfigService:
             Dict[str, Any]: A dictionary containing the user's configuration, or an empty dict if not found.
         """
         try:
-            conn = sqlite3.connect(self.DB_FILE)
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT config_json FROM user_configs WHERE user_id = ? AND portfolio_id IS ?",
-                (user_id, portfolio_id),
-            )
-            row = cursor.fetchone()
-            conn.close()
+            row = self._conn.execute(
+                "SELECT config_json FROM user_configs WHERE user_id = ? AND portfolio_id = ?",
+                (user_id, portfolio_id or _GLOBAL_PORTFOLIO_ID),
+            ).fetchone()
             if row:
-                return json.loads(row[0])
+                return orjson.loads(row[0])
             return {}
         except sqlite3.OperationalError as e:
             raise RuntimeError(f"Cannot access database at {self.DB_FILE}: {e}")
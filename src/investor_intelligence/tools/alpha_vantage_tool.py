@@ -1,21 +1,174 @@
 import os
-import csv
-from io import StringIO
-from dotenv import load_dotenv
-from alpha_vantage.timeseries import TimeSeries
 import time
-from alpha_vantage.fundamentaldata import FundamentalData
+import random
+import asyncio
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+from types import MappingProxyType
+import httpx
+import orjson
+import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from functools import lru_cache
 from investor_intelligence.utils.metrics import track_latency
+from investor_intelligence.utils.cache import file_cached, singleflight
+from investor_intelligence.utils.env import load_env
 
-load_dotenv()
+load_env()
 
 ALPHA_VANTAGE_API_KEY = os.getenv("ALPHA_VANTAGE_API_KEY")
 
-ts = TimeSeries(key=ALPHA_VANTAGE_API_KEY, output_format="json")
-
 BASE_URL = "https://www.alphavantage.co"
+REQUEST_TIMEOUT = 30
+
+# Request URLs with everything but the per-call parameters filled in at import
+_QUERY_URL = f"{BASE_URL}/query?apikey={ALPHA_VANTAGE_API_KEY}"
+_QUOTE_URL_TMPL = _QUERY_URL + "&function=GLOBAL_QUOTE&symbol={}"
+_SERIES_URL_TMPL = _QUERY_URL + "&function={}&symbol={}&outputsize={}"
+_BATCH_QUOTES_URL_TMPL = _QUERY_URL + "&function=BATCH_STOCK_QUOTES&symbols={}"
+_EARNINGS_CALENDAR_URL_TMPL = _QUERY_URL + "&function=EARNINGS_CALENDAR&horizon={}"
+
+
+# Extra random wait added to each retry, as a fraction of the wait (Retry-After) or
+# in seconds (exponential backoff), so workers limited together don't retry together
+RETRY_JITTER = 0.3
+
+
+class _JitteredRetry(Retry):
+    """Retry that honors Retry-After plus up to RETRY_JITTER of it again at random."""
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return retry_after + random.uniform(0, retry_after * RETRY_JITTER)
+
+
+def _create_session(max_retries=5, backoff_factor=0.5):
+    """Builds a pooled session that retries rate-limited and transient failures."""
+    retry = _JitteredRetry(
+        total=max_retries,
+        backoff_factor=backoff_factor,
+        backoff_jitter=RETRY_JITTER,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retry)
+    session = requests.Session()
+    # Ask for compressed bodies explicitly; the earnings calendar CSV shrinks several
+    # times over. Streamed responses are decoded by the caller (see decode_content).
+    session.headers["Accept-Encoding"] = "gzip, deflate"
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Reused by every REST call so connections and TLS sessions stay warm
+_SESSION = _create_session()
+
+# Freshness windows for the on-disk response cache, in seconds. Daily and longer
+# data is also keyed by trading session (see _last_market_close), so it is
+# refetched once per close rather than on a fixed clock.
+QUOTE_CACHE_TTL = 60
+DAILY_CACHE_TTL = 24 * 60 * 60
+INTRADAY_CACHE_TTL = 60
+
+MARKET_TIMEZONE = ZoneInfo("America/New_York")
+MARKET_CLOSE_HOUR = 16
+
+# Most concurrent requests in flight, matching the free tier's per-minute quota
+REQUEST_CONCURRENCY = 5
+
+_DAILY_OR_LONGER_INTERVALS = ("1d", "1wk", "1mo")
+_TIME_SERIES_INTERVALS = {"daily": "1d", "weekly": "1wk", "monthly": "1mo"}
+# API function and response section for each daily-or-longer interval; anything
+# else is an intraday interval
+_SERIES_FUNCTIONS = {
+    "1d": ("TIME_SERIES_DAILY", "Time Series (Daily)"),
+    "1wk": ("TIME_SERIES_WEEKLY", "Weekly Time Series"),
+    "1mo": ("TIME_SERIES_MONTHLY", "Monthly Time Series"),
+}
+# Column types for time series frames. Prices stay float64: float32 can't hold
+# cents at high share prices (its step is about 0.06 near 600,000) and the error
+# would carry into returns, volatility and beta. Volumes are whole shares.
+_SERIES_DTYPES = {
+    "1. open": "float64",
+    "2. high": "float64",
+    "3. low": "float64",
+    "4. close": "float64",
+    "5. volume": "int64",
+}
+_INTERNED_EARNINGS_FIELDS = ("symbol", "currency", "reportDate", "fiscalDateEnding")
+
+
+def _last_market_close():
+    """Returns the date of the most recent weekday 16:00 ET close, as YYYY-MM-DD."""
+    now = datetime.now(MARKET_TIMEZONE)
+    close_day = now.date()
+    if now.hour < MARKET_CLOSE_HOUR:
+        close_day -= timedelta(days=1)
+    while close_day.weekday() >= 5:  # Saturday or Sunday
+        close_day -= timedelta(days=1)
+    return close_day.isoformat()
+
+
+def _quote_url(symbol):
+    return _QUOTE_URL_TMPL.format(symbol)
+
+
+def _series_request(symbol, interval, outputsize):
+    """Returns the URL for a time series request and the response key holding the bars."""
+    try:
+        function, section = _SERIES_FUNCTIONS[interval]
+    except KeyError:
+        url = _SERIES_URL_TMPL.format("TIME_SERIES_INTRADAY", symbol, outputsize)
+        return f"{url}&interval={interval}", f"Time Series ({interval})"
+    return _SERIES_URL_TMPL.format(function, symbol, outputsize), section
+
+
+def _response_section(data, section, symbol):
+    """Returns data[section], raising ValueError with Alpha Vantage's message if it is missing."""
+    if section in data:
+        return data[section]
+    message = (
+        data.get("Error Message")
+        or data.get("Note")
+        or data.get("Information")
+        or f"Response for {symbol} has no {section!r} section"
+    )
+    raise ValueError(message)
+
+
+def _history_cache_ttl(symbol, interval, outputsize):
+    """Daily and longer bars don't change intraday; intraday bars go stale quickly."""
+    if interval in _DAILY_OR_LONGER_INTERVALS:
+        return DAILY_CACHE_TTL
+    return INTRADAY_CACHE_TTL
+
+
+def _read_only_series(series):
+    """Wraps a series and each of its bars in read-only views, so cached data can't be mutated."""
+    if not series:
+        return series
+    return MappingProxyType({ts: MappingProxyType(bar) for ts, bar in series.items()})
+
+
+def _series_frame(series):
+    """Converts a {timestamp: {field: str}} series into a typed, date-sorted DataFrame."""
+    frame = pd.DataFrame.from_dict(series, orient="index")
+    frame = frame.astype(
+        {
+            column: dtype
+            for column, dtype in _SERIES_DTYPES.items()
+            if column in frame.columns
+        }
+    )
+    frame.index = pd.to_datetime(frame.index)
+    return frame.sort_index()
 
 
 def get_stock_info(symbol):
@@ -30,8 +183,13 @@ def get_stock_info(symbol):
     """
     # Alpha Vantage does not provide company sector/name in free tier, only time series data
     # You can get price and historical data
-    data, meta_data = ts.get_quote_endpoint(symbol)
-    return data
+    return get_quote_endpoint(symbol)
+
+
+@lru_cache(maxsize=1024)
+def _parse_price(price: str) -> float:
+    # Cached quotes hand back the same price strings, so parse each one once
+    return float(price)
 
 
 @track_latency("get_current_price", "alpha_vantage_tool")
@@ -40,7 +198,7 @@ def get_current_price(symbol):
     quote = get_quote_endpoint(symbol)
     if quote and "05. price" in quote:
         try:
-            return float(quote["05. price"])
+            return _parse_price(quote["05. price"])
         except ValueError:
             print(
                 f"Could not convert price to float for {symbol}: {quote['05. price']}"
@@ -54,6 +212,11 @@ def get_historical_data(symbol, interval="1d", outputsize="compact"):
     """
     Retrieve historical price data for a given stock symbol and interval.
 
+    Daily and longer series are memoized in-process until the next market close
+    and are shared by every caller, so they are returned as read-only mappings; copy
+    them (e.g. into a DataFrame) before modifying. Intraday series go through the
+    short-lived on-disk cache only and are returned as plain dicts.
+
     Args:
         symbol (str): The stock ticker symbol (e.g., 'AAPL').
         interval (str): Data interval ('1d', '1wk', '1mo', or intraday intervals like '5min').
@@ -62,51 +225,184 @@ def get_historical_data(symbol, interval="1d", outputsize="compact"):
     Returns:
         dict: Historical price data indexed by date/time.
     """
-    # interval: '1min', '5min', '15min', '30min', '60min', 'daily', 'weekly', 'monthly'
-    if interval == "1d":
-        data, meta_data = ts.get_daily(symbol=symbol, outputsize=outputsize)
-    elif interval == "1wk":
-        data, meta_data = ts.get_weekly(symbol=symbol)
-    elif interval == "1mo":
-        data, meta_data = ts.get_monthly(symbol=symbol)
-    else:
-        data, meta_data = ts.get_intraday(
-            symbol=symbol, interval=interval, outputsize=outputsize
+    if interval in _DAILY_OR_LONGER_INTERVALS:
+        return _get_historical_data_for_day(
+            symbol, interval, outputsize, _last_market_close()
         )
-    return data
+    return _fetch_historical_data(symbol, interval, outputsize)
 
 
-@lru_cache(maxsize=128)
-def get_time_series_data(symbol, interval="daily", outputsize="compact"):
-    """Fetches time series data (e.g., daily, weekly, monthly) for a given stock symbol."""
-    function = "TIME_SERIES_DAILY"
-    if interval == "weekly":
-        function = "TIME_SERIES_WEEKLY"
-    elif interval == "monthly":
-        function = "TIME_SERIES_MONTHLY"
-
-    url = f"{BASE_URL}/query?function={function}&symbol={symbol}&outputsize={outputsize}&apikey={ALPHA_VANTAGE_API_KEY}"
+@lru_cache(maxsize=512)
+def _get_historical_data_for_day(symbol, interval, outputsize, day):
+    # day only busts the cache: each close is a new key
+    return _read_only_series(_fetch_historical_data(symbol, interval, outputsize))
+
+
+@file_cached("historical_data", _history_cache_ttl, partition=_last_market_close)
+def _fetch_historical_data(symbol, interval, outputsize):
+    # interval: '1d', '1wk', '1mo' or intraday '1min', '5min', '15min', '30min', '60min'
+    url, section = _series_request(symbol, interval, outputsize)
+    response = _make_api_call(url)
+    return _response_section(orjson.loads(response.content), section, symbol)
+
+
+async def _fetch_section(client, semaphore, symbol, url, section):
+    async with semaphore:
+        try:
+            response = await client.get(url)
+            response.raise_for_status()
+            return _response_section(orjson.loads(response.content), section, symbol)
+        except Exception as e:
+            print(f"Error fetching {section} for {symbol}: {e}")
+            return None
+
+
+async def _fetch_sections(requests_):
+    """Fetches (symbol, url, section) requests concurrently; None marks a failed request."""
+    # The client is bound to the running event loop, so it lives for one batch.
+    # HTTP/2 multiplexes the whole batch over a single TLS connection.
+    async with httpx.AsyncClient(
+        http2=True, timeout=60, limits=httpx.Limits(max_connections=8)
+    ) as client:
+        semaphore = asyncio.Semaphore(REQUEST_CONCURRENCY)
+        return await asyncio.gather(
+            *(
+                _fetch_section(client, semaphore, symbol, url, section)
+                for symbol, url, section in requests_
+            )
+        )
+
+
+@track_latency("fetch_daily_series", "alpha_vantage_tool")
+def fetch_daily_series(symbols, outputsize="full"):
+    """
+    Retrieve daily price history for several symbols concurrently.
+
+    All requests share one async HTTP client and are awaited together, so the
+    wall-clock cost is roughly that of the slowest symbol rather than the sum. Symbols
+    with a fresh entry in get_historical_data's on-disk cache are not requested at all.
+
+    Args:
+        symbols (list): The stock ticker symbols (e.g., ['AAPL', 'MSFT']).
+        outputsize (str): 'compact' (latest 100 points) or 'full' (default, full-length data).
+
+    Returns:
+        dict: Maps each symbol to its daily data indexed by date, or None if the request failed.
+    """
+    cache = _fetch_historical_data.cache
+    keys = {
+        symbol: _fetch_historical_data.cache_key(symbol, "1d", outputsize)
+        for symbol in dict.fromkeys(symbols)
+    }
+    series = {symbol: cache.get(key, DAILY_CACHE_TTL) for symbol, key in keys.items()}
+
+    missing = [symbol for symbol, data in series.items() if data is None]
+    if missing:
+        results = asyncio.run(
+            _fetch_sections(
+                [
+                    (symbol, *_series_request(symbol, "1d", outputsize))
+                    for symbol in missing
+                ]
+            )
+        )
+        for symbol, data in zip(missing, results):
+            series[symbol] = data
+            if data:
+                cache.set(keys[symbol], data)
+    return series
+
+
+@track_latency("get_batch_quotes", "alpha_vantage_tool")
+def _quote_prices(symbols):
+    """Current prices from concurrent per-symbol quote requests (see get_quotes)."""
+    prices = {}
+    for symbol, quote in get_quotes(symbols).items():
+        try:
+            prices[symbol] = float(quote["05. price"])
+        except (KeyError, TypeError, ValueError):
+            print(f"Could not read price for {symbol} from quote: {quote}")
+    return prices
+
+
+def get_batch_quotes(symbols):
+    """
+    Retrieve current prices for several symbols with a single batch quote request.
+
+    Falls back to concurrent per-symbol quote requests (see get_quotes) if the batch
+    response has no "Stock Quotes" section (e.g. the endpoint is not available for
+    the API key), and for the symbols whose batch price can't be read.
+
+    Args:
+        symbols (list): The stock ticker symbols (e.g., ['AAPL', 'MSFT']).
+
+    Returns:
+        dict: Maps each symbol, as passed in, to its current price. Symbols without a
+            price are omitted.
+    """
+    unique_symbols = list(dict.fromkeys(symbols))
+    if not unique_symbols:
+        return {}
+
+    url = _BATCH_QUOTES_URL_TMPL.format(",".join(unique_symbols))
     try:
         response = _make_api_call(url)
-        data = response.json()
-        key = f"Time Series ({interval.capitalize()})"
-        if key in data:
-            return data[key]
-        elif "Error Message" in data:
-            print(f"Alpha Vantage API Error for {symbol}: {data['Error Message']}")
-        return None
+        quotes = orjson.loads(response.content)["Stock Quotes"]
+    except KeyError:
+        return _quote_prices(unique_symbols)
     except Exception as e:
-        print(f"Error fetching time series data for {symbol}: {e}")
-        return None
+        print(f"Error fetching batch quotes for {unique_symbols}: {e}")
+        return {}
 
+    # The response echoes symbols in its own case; key the prices by the caller's
+    # spelling so lookups with the symbols passed in succeed
+    raw_prices = {}
+    for quote in quotes:
+        try:
+            raw_prices[quote["1. symbol"].upper()] = quote["2. price"]
+        except (AttributeError, KeyError, TypeError):
+            print(f"Skipping malformed batch quote: {quote}")
+
+    prices = {}
+    unreadable = []
+    for symbol in unique_symbols:
+        if symbol.upper() not in raw_prices:
+            continue
+        try:
+            prices[symbol] = float(raw_prices[symbol.upper()])
+        except (TypeError, ValueError):
+            print(f"Could not read batch price for {symbol}, requesting its quote")
+            unreadable.append(symbol)
+    if unreadable:
+        prices.update(_quote_prices(unreadable))
+    return prices
 
-def get_time_series_data_cached(symbol):
-    if (
-        get_time_series_data.cache_info().hits > 0
-        and (symbol,) in get_time_series_data.cache_parameters
-    ):
-        print(f"[CACHE HIT] get_time_series_data for {symbol}")
-    return get_time_series_data(symbol)
+
+def get_time_series_data(symbol, interval="daily", outputsize="compact"):
+    """Fetches time series data (e.g., daily, weekly, monthly) for a given stock symbol.
+
+    This goes through get_historical_data, so both names share one set of cache
+    entries, and converts the result into a DataFrame ready for computation.
+
+    Args:
+        symbol (str): The stock ticker symbol (e.g., 'AAPL').
+        interval (str): 'daily' (default), 'weekly' or 'monthly'.
+        outputsize (str): 'compact' (default, latest 100 points) or 'full' (full-length data).
+
+    Returns:
+        pd.DataFrame: One row per bar on an ascending DatetimeIndex, with float64
+            "1. open" to "4. close" columns and an int64 "5. volume" column, or None
+            on errors.
+    """
+    try:
+        return _series_frame(
+            get_historical_data(
+                symbol, _TIME_SERIES_INTERVALS.get(interval, "1d"), outputsize
+            )
+        )
+    except Exception as e:
+        print(f"Error fetching time series data for {symbol}: {e}")
+        return None
 
 
 def get_intraday_data(symbol, interval="5min"):
@@ -120,20 +416,33 @@ def get_intraday_data(symbol, interval="5min"):
     Returns:
         dict: Intraday time series data indexed by datetime.
     """
-    ts_local = TimeSeries(key=ALPHA_VANTAGE_API_KEY, output_format="json")
-    data, _ = ts_local.get_intraday(
-        symbol=symbol, interval=interval, outputsize="compact"
-    )
-    return data
+    return get_historical_data(symbol, interval=interval, outputsize="compact")
 
 
-@lru_cache(maxsize=128)
 def get_quote_endpoint(symbol):
-    """Fetches real-time quote data for a given stock symbol."""
-    url = f"{BASE_URL}/query?function=GLOBAL_QUOTE&symbol={symbol}&apikey={ALPHA_VANTAGE_API_KEY}"
+    """Fetches real-time quote data for a given stock symbol.
+
+    Quotes are reused in-process for up to QUOTE_CACHE_TTL seconds. Concurrent calls
+    for the same symbol share one request: later callers wait for the first and then
+    read the quote it cached. The quote is shared by every caller, so it is returned
+    as a read-only mapping.
+    """
+    return _get_quote_for_window(symbol, int(time.time() // QUOTE_CACHE_TTL))
+
+
+@lru_cache(maxsize=128)
+def _get_quote_for_window(symbol, window):
+    # window only busts the cache: each QUOTE_CACHE_TTL-second window is a new key
+    quote = _fetch_quote(symbol)
+    return MappingProxyType(quote) if quote else quote
+
+
+@singleflight
+@file_cached("quote_endpoint", QUOTE_CACHE_TTL)
+def _fetch_quote(symbol):
     try:
-        response = _make_api_call(url)
-        data = response.json()
+        response = _make_api_call(_quote_url(symbol))
+        data = orjson.loads(response.content)
         if "Global Quote" in data:
             return data["Global Quote"]
         elif "Error Message" in data:
@@ -144,36 +453,114 @@ def get_quote_endpoint(symbol):
         return None
 
 
+async def get_quotes_batch(symbols):
+    """Fetches real-time quote data for several symbols concurrently.
+
+    Requests share one httpx.AsyncClient and at most REQUEST_CONCURRENCY are in flight
+    at once.
+
+    Args:
+        symbols (list): The stock ticker symbols (e.g., ['AAPL', 'MSFT']).
+
+    Returns:
+        list: The quote for each symbol, in order, or None where the request failed.
+    """
+    return await _fetch_sections(
+        [(symbol, _quote_url(symbol), "Global Quote") for symbol in symbols]
+    )
+
+
+@track_latency("get_quotes", "alpha_vantage_tool")
+def get_quotes(symbols):
+    """Fetches real-time quote data for several symbols; synchronous get_quotes_batch.
+
+    Symbols with a fresh entry in get_quote_endpoint's on-disk cache are not requested.
+    Unlike get_quote_endpoint, the quotes are plain dicts owned by the caller.
+
+    Args:
+        symbols (list): The stock ticker symbols (e.g., ['AAPL', 'MSFT']).
+
+    Returns:
+        dict: Maps each symbol to its quote. Symbols whose request failed are omitted.
+    """
+    cache = _fetch_quote.cache
+    keys = {symbol: _fetch_quote.cache_key(symbol) for symbol in dict.fromkeys(symbols)}
+    quotes = {symbol: cache.get(key, QUOTE_CACHE_TTL) for symbol, key in keys.items()}
+
+    missing = [symbol for symbol, quote in quotes.items() if quote is None]
+    if missing:
+        for symbol, quote in zip(missing, asyncio.run(get_quotes_batch(missing))):
+            quotes[symbol] = quote
+            if quote:
+                cache.set(keys[symbol], quote)
+    return {symbol: quote for symbol, quote in quotes.items() if quote}
+
+
 def get_quote_endpoint_cached(symbol):
     if (
-        get_quote_endpoint.cache_info().hits > 0
-        and (symbol,) in get_quote_endpoint.cache_parameters
+        _get_quote_for_window.cache_info().hits > 0
+        and (symbol,) in _get_quote_for_window.cache_parameters
     ):
         print(f"[CACHE HIT] get_quote_endpoint for {symbol}")
     return get_quote_endpoint(symbol)
 
 
-@lru_cache(maxsize=32)
 def get_earnings_calendar(horizon="3month", symbol=None):
     """Fetches the earnings calendar.
 
+    The calendar is reused in-process until the next market close. It is shared by
+    every caller, so it is returned as a tuple of read-only mappings.
+
     Args:
         horizon (str): The reporting horizon (e.g., "3month", "6month", "12month").
         symbol (str): Optional. Filter by a specific stock symbol.
 
     Returns:
-        list: A list of dictionaries, each representing an earnings event.
+        tuple: One read-only mapping per earnings event; empty on errors.
+    """
+    return _get_earnings_calendar_for_session(horizon, symbol, _last_market_close())
+
+
+@lru_cache(maxsize=32)
+def _get_earnings_calendar_for_session(horizon, symbol, session):
+    # session only busts the cache: each close is a new key
+    rows = _intern_fields(
+        _fetch_earnings_calendar(horizon, symbol), _INTERNED_EARNINGS_FIELDS
+    )
+    return tuple(MappingProxyType(row) for row in rows)
+
+
+def _intern_fields(rows, fields):
+    """Makes equal values of the given fields share one string object across rows.
+
+    The calendar repeats the same currencies, dates and tickers on many rows; pooling
+    them keeps one copy of each in memory for as long as the calendar is cached.
     """
-    url = f"{BASE_URL}/query?function=EARNINGS_CALENDAR&horizon={horizon}&apikey={ALPHA_VANTAGE_API_KEY}"
+    pool = {}
+    for row in rows:
+        for field in fields:
+            value = row.get(field)
+            if value is not None:
+                row[field] = pool.setdefault(value, value)
+    return rows
+
+
+@file_cached("earnings_calendar", DAILY_CACHE_TTL, partition=_last_market_close)
+def _fetch_earnings_calendar(horizon, symbol):
+    url = _EARNINGS_CALENDAR_URL_TMPL.format(horizon)
     if symbol:
         url += f"&symbol={symbol}"
 
     try:
-        response = _make_api_call(url)
-        # Alpha Vantage earnings calendar returns CSV
-        csv_data = StringIO(response.text)
-        reader = csv.DictReader(csv_data)
-        return list(reader)
+        # Alpha Vantage earnings calendar returns CSV. Stream it from the socket into
+        # pandas' C parser, keeping every field as the string the API sent, so the
+        # whole payload is never held in memory as bytes or text.
+        with _make_api_call(url, stream=True) as response:
+            response.raw.decode_content = True  # Undo gzip/deflate transfer encoding
+            calendar = pd.read_csv(
+                response.raw, engine="c", dtype=str, keep_default_na=False
+            )
+        return calendar.to_dict(orient="records")
     except Exception as e:
         print(f"Error fetching earnings calendar: {e}")
         return []
@@ -181,8 +568,8 @@ def get_earnings_calendar(horizon="3month", symbol=None):
 
 def get_earnings_calendar_cached(horizon="3month", symbol=None):
     if (
-        get_earnings_calendar.cache_info().hits > 0
-        and (horizon, symbol) in get_earnings_calendar.cache_parameters
+        _get_earnings_calendar_for_session.cache_info().hits > 0
+        and (horizon, symbol) in _get_earnings_calendar_for_session.cache_parameters
     ):
         print(
             f"[CACHE HIT] get_earnings_calendar for horizon={horizon}, symbol={symbol}"
@@ -190,36 +577,21 @@ def get_earnings_calendar_cached(horizon="3month", symbol=None):
     return get_earnings_calendar(horizon, symbol)
 
 
-def _make_api_call(url: str, max_retries: int = 5, backoff_factor: float = 0.5):
-    """Helper function to make API calls with retry and exponential backoff."""
-    for i in range(max_retries):
-        try:
-            response = requests.get(url)
-            response.raise_for_status()  # Raise HTTPError for bad responses (4xx or 5xx)
-            return response
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 429:  # Too Many Requests
-                print(
-                    f"Rate limit hit. Retrying in {backoff_factor * (2 ** i):.2f} seconds..."
-                )
-                time.sleep(backoff_factor * (2**i))
-            else:
-                print(f"HTTP error occurred: {e}")
-                raise  # Re-raise other HTTP errors
-        except requests.exceptions.ConnectionError as e:
-            print(
-                f"Connection error occurred: {e}. Retrying in {backoff_factor * (2 ** i):.2f} seconds..."
-            )
-            time.sleep(backoff_factor * (2**i))
-        except requests.exceptions.Timeout as e:
-            print(
-                f"Timeout error occurred: {e}. Retrying in {backoff_factor * (2 ** i):.2f} seconds..."
-            )
-            time.sleep(backoff_factor * (2**i))
-        except requests.exceptions.RequestException as e:
-            print(f"An unexpected request error occurred: {e}")
-            raise  # Re-raise any other request exceptions
-    raise Exception(f"Failed to make API call after {max_retries} retries.")
+def _make_api_call(url: str, stream: bool = False):
+    """Helper function to make API calls over the shared keep-alive session.
+
+    Rate limits (429), transient 5xx responses and connection errors are retried with
+    jittered exponential backoff by the session's adapter, waiting as long as the
+    Retry-After header asks when one is sent; any error left after that is raised.
+
+    Args:
+        url (str): The request URL.
+        stream (bool): If True, the body is left unread so it can be consumed from
+            response.raw; the caller must close the response.
+    """
+    response = _SESSION.get(url, timeout=REQUEST_TIMEOUT, stream=stream)
+    response.raise_for_status()  # Raise HTTPError for bad responses (4xx or 5xx)
+    return response
 
 
 if __name__ == "__main__":
@@ -1,14 +1,19 @@
 import os
-import pickle
+import codecs
+import functools
+import threading
 from email.mime.text import MIMEText
-import base64
+import pybase64
 
 from google.auth.transport.requests import Request
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
-# If modifying these scopes, delete the file token.pickle.
+from investor_intelligence.utils.auth import load_credentials, save_credentials
+from investor_intelligence.utils.google_api import GOOGLE_API_RETRIES, JSON_MODEL
+
+# If modifying these scopes, delete the file token.json.
 SCOPES = [
     "https://www.googleapis.com/auth/gmail.send",
     "https://www.googleapis.com/auth/gmail.readonly",
@@ -16,45 +21,81 @@ SCOPES = [
     "https://www.googleapis.com/auth/spreadsheets.readonly",
 ]
 
+# Most sub-requests per batch HTTP request; Gmail allows 100 but recommends 50 to
+# stay clear of rate limits
+GMAIL_BATCH_SIZE = 50
 
-def get_gmail_service():
-    """Shows basic usage of the Gmail API."""
-    creds = None
-    # Find the absolute path to config/credentials.json relative to this file
-    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    credentials_path = os.path.join(base_dir, "..", "..", "config", "credentials.json")
-    credentials_path = os.path.abspath(credentials_path)
-    fallback_path = os.path.join(
-        base_dir,
+# Header block MIMEText produces for a plain ASCII message, for create_message's
+# fast path
+_ASCII_MESSAGE_TEMPLATE = (
+    'Content-Type: text/plain; charset="us-ascii"\n'
+    "MIME-Version: 1.0\n"
+    "Content-Transfer-Encoding: 7bit\n"
+    "to: {to}\n"
+    "from: {sender}\n"
+    "subject: {subject}\n"
+    "\n"
+    "{body}"
+)
+# Longest header line MIMEText leaves unfolded
+_MAX_HEADER_LINE = 78
+
+# Bodies with more base64 characters than this are decoded in chunks of
+# BODY_DECODE_CHUNK characters (a multiple of 4, so chunks split on whole quanta)
+MAX_INLINE_BODY_CHARS = 1_000_000
+BODY_DECODE_CHUNK = 64 * 1024
+
+# Partial responses: only the parts of a message that _parse_email reads. Full
+# fetches keep the whole part tree, as text/plain may be nested at any depth.
+METADATA_FIELDS = "id,snippet,payload/headers"
+FULL_FIELDS = "id,snippet,payload(headers,body/data,parts)"
+
+
+# OAuth client secrets in config/ at the project root, resolved once at import
+_CREDENTIALS_PATH = os.path.abspath(
+    os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
         "..",
         "..",
         "config",
         "credentials.json",
     )
-    fallback_path = os.path.abspath(fallback_path)
-    # The file token.pickle stores the user's access and refresh tokens, and is
-    # created automatically when the authorization flow completes for the first
-    # time.
-    if os.path.exists("token.pickle"):
-        with open("token.pickle", "rb") as token:
-            creds = pickle.load(token)
+)
+
+# Built once per process by get_gmail_service
+_GMAIL_SERVICE = None
+_GMAIL_SERVICE_LOCK = threading.Lock()
+
+
+def get_gmail_service():
+    """Returns the authorized Gmail API service, building it on first use.
+
+    Loading the token and building the client is done once per process; the client
+    refreshes its access token by itself when it expires.
+    """
+    global _GMAIL_SERVICE
+    if _GMAIL_SERVICE is None:
+        with _GMAIL_SERVICE_LOCK:
+            if _GMAIL_SERVICE is None:
+                _GMAIL_SERVICE = _build_gmail_service()
+    return _GMAIL_SERVICE
+
+
+def _build_gmail_service():
+    """Shows basic usage of the Gmail API."""
+    # token.json stores the user's access and refresh tokens (see utils.auth)
+    creds = load_credentials(SCOPES)
     # If there are no (valid) credentials available, let the user log in.
     if not creds or not creds.valid:
         if creds and creds.expired and creds.refresh_token:
             creds.refresh(Request())
         else:
-            if os.path.exists(credentials_path):
-                flow = InstalledAppFlow.from_client_secrets_file(
-                    credentials_path, SCOPES
-                )
-            else:
-                flow = InstalledAppFlow.from_client_secrets_file(fallback_path, SCOPES)
+            flow = InstalledAppFlow.from_client_secrets_file(_CREDENTIALS_PATH, SCOPES)
             creds = flow.run_local_server(port=0)
         # Save the credentials for the next run
-        with open("token.pickle", "wb") as token:
-            pickle.dump(creds, token)
+        save_credentials(creds)
 
-    service = build("gmail", "v1", credentials=creds)
+    service = build("gmail", "v1", credentials=creds, model=JSON_MODEL)
     return service
 
 
@@ -70,11 +111,79 @@ def create_message(sender, to, subject, message_text):
     Returns:
         An object containing a base64url encoded email object.
     """
+    if _is_plain_ascii_message(sender, to, subject, message_text):
+        # Same bytes MIMEText would produce, without running the email generator
+        raw = _ASCII_MESSAGE_TEMPLATE.format(
+            to=to, sender=sender, subject=subject, body=message_text
+        ).encode("ascii")
+        return {"raw": pybase64.urlsafe_b64encode(raw).decode("ascii")}
+
     message = MIMEText(message_text)
     message["to"] = to
     message["from"] = sender
     message["subject"] = subject
-    return {"raw": base64.urlsafe_b64encode(message.as_bytes()).decode()}
+    return {"raw": pybase64.urlsafe_b64encode(message.as_bytes()).decode()}
+
+
+def make_message_factory(sender):
+    """Returns create_message specialized for one sender.
+
+    The sender is checked and substituted into the fast-path template once, so each
+    call only fills in the recipient, subject and body. Useful for send loops such
+    as the scheduled summaries, which always send from the same account.
+
+    Args:
+        sender: Email address of the sender.
+
+    Returns:
+        callable: Takes (to, subject, message_text) and returns what create_message
+            would for the same arguments.
+    """
+    if not _is_plain_ascii_header("from", sender):
+        return functools.partial(create_message, sender)
+    # Escape braces so the sender survives the per-message format call
+    template = _ASCII_MESSAGE_TEMPLATE.replace(
+        "{sender}", sender.replace("{", "{{").replace("}", "}}")
+    )
+
+    def create(to, subject, message_text):
+        if not (
+            _is_plain_ascii_body(message_text)
+            and _is_plain_ascii_header("to", to)
+            and _is_plain_ascii_header("subject", subject)
+        ):
+            return create_message(sender, to, subject, message_text)
+        raw = template.format(to=to, subject=subject, body=message_text)
+        return {"raw": pybase64.urlsafe_b64encode(raw.encode("ascii")).decode("ascii")}
+
+    return create
+
+
+def _is_plain_ascii_message(sender, to, subject, message_text):
+    """Whether MIMEText would emit the message unchanged under _ASCII_MESSAGE_TEMPLATE.
+
+    That holds for ASCII text without carriage returns (which MIMEText normalizes)
+    and single-line headers short enough not to be folded.
+    """
+    return (
+        _is_plain_ascii_body(message_text)
+        and _is_plain_ascii_header("to", to)
+        and _is_plain_ascii_header("from", sender)
+        and _is_plain_ascii_header("subject", subject)
+    )
+
+
+def _is_plain_ascii_body(message_text):
+    return message_text.isascii() and "\r" not in message_text
+
+
+def _is_plain_ascii_header(name, value):
+    return (
+        value.isascii()
+        and "\n" not in value
+        and "\r" not in value
+        and len(name) + 2 + len(value) <= _MAX_HEADER_LINE
+    )
 
 
 def send_message(service, user_id, message):
@@ -98,83 +207,189 @@ def send_message(service, user_id, message):
         print(f"An error occurred: {error}")
         return None
 
-    service = get_gmail_service()
-    message = MIMEText(message_body)
-    message["to"] = to_email
-    message["subject"] = subject
-    raw_message = base64.urlsafe_b64encode(message.as_bytes()).decode()
-    body = {"raw": raw_message}
-    try:
-        message = service.users().messages().send(userId="me", body=body).execute()
-        print(f"Email sent to {to_email}. Message Id: {message[id]}")
-    except Exception as e:
-        print(f"An error occurred: {e}")
 
+def _execute_in_batches(service, requests_):
+    """Executes (request_id, HttpRequest) pairs as batch requests of GMAIL_BATCH_SIZE.
+
+    Each batch travels as a single multipart HTTP request to Gmail's batch endpoint.
+
+    Args:
+        service: Authorized Gmail API service instance.
+        requests_ (list): (request_id, HttpRequest) pairs.
+
+    Returns:
+        dict: Maps each request_id to its response. Failed requests are omitted.
+    """
+    responses = {}
+
+    def on_response(request_id, response, exception):
+        if exception is not None:
+            print(f"Batch request {request_id} failed: {exception}")
+        else:
+            responses[request_id] = response
+
+    for start in range(0, len(requests_), GMAIL_BATCH_SIZE):
+        batch = service.new_batch_http_request(callback=on_response)
+        for request_id, request in requests_[start : start + GMAIL_BATCH_SIZE]:
+            batch.add(request, request_id=request_id)
+        batch.execute()
+    return responses
+
+
+def _decode_body(data):
+    """Decodes a base64url message body to text.
+
+    Large bodies are decoded a chunk at a time through an incremental UTF-8 decoder,
+    so the whole decoded body is never held as bytes alongside the text.
+    """
+    if len(data) <= MAX_INLINE_BODY_CHARS:
+        return pybase64.urlsafe_b64decode(data).decode("utf-8")
+
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    text = [
+        decoder.decode(
+            pybase64.urlsafe_b64decode(data[start : start + BODY_DECODE_CHUNK])
+        )
+        for start in range(0, len(data), BODY_DECODE_CHUNK)
+    ]
+    text.append(decoder.decode(b"", final=True))
+    return "".join(text)
+
+
+def _iter_parts(payload):
+    """Yields the leaf parts of a message payload in document order.
 
-def get_unread_emails(query: str = "is:unread") -> list:
+    Walks nested multipart parts (e.g. multipart/mixed > multipart/alternative >
+    text/plain) with an explicit stack rather than recursion.
+    """
+    stack = [payload]
+    while stack:
+        part = stack.pop()
+        if "parts" in part:
+            stack.extend(reversed(part["parts"]))
+        else:
+            yield part
+
+
+def _parse_email(message):
+    """Extracts the id, subject, sender, plain text body and snippet of a message.
+
+    Works on both "metadata" and "full" format messages; the body is empty for the
+    former.
+    """
+    # Extract relevant parts of the email
+    payload = message["payload"]
+    # The first occurrence of a repeated header wins
+    headers = {}
+    for header in payload["headers"]:
+        headers.setdefault(header["name"], header["value"])
+    subject = headers.get("Subject", "No Subject")
+    sender = headers.get("From", "Unknown Sender")
+
+    # Get email body (handling different MIME types)
+    msg_body = ""
+    if "parts" in payload:
+        data = next(
+            (
+                part["body"]["data"]
+                for part in _iter_parts(payload)
+                if part.get("mimeType") == "text/plain" and part["body"].get("data")
+            ),
+            None,
+        )
+        if data:
+            msg_body = _decode_body(data)
+    else:
+        data = payload.get("body", {}).get("data")
+        if data:
+            msg_body = _decode_body(data)
+
+    return {
+        "id": message["id"],
+        "subject": subject,
+        "sender": sender,
+        "body": msg_body,
+        "snippet": message["snippet"],
+    }
+
+
+def _get_messages(service, msg_ids, **params):
+    """Batch-fetches messages by id; returns {msg_id: message} for those that succeeded."""
+    messages = service.users().messages()
+    return _execute_in_batches(
+        service,
+        [
+            (msg_id, messages.get(userId="me", id=msg_id, **params))
+            for msg_id in msg_ids
+        ],
+    )
+
+
+def get_unread_emails(query: str = "is:unread", body_filter=None) -> list:
     """Fetches unread emails from the user's inbox based on a query.
 
+    The matching messages are fetched with batch requests of up to GMAIL_BATCH_SIZE
+    messages each and then marked as read with a single batchModify call. Responses
+    are trimmed to the fields that are read.
+
     Args:
         query (str): Gmail API query string (e.g., "is:unread subject:stock").
+        body_filter (callable, optional): Takes an email dict without its body and
+            returns whether the body is needed. When given, every message is first
+            fetched as headers and snippet only, and just the selected ones are
+            fetched in full; the others are returned with an empty 'body'. By
+            default every message is fetched in full.
 
     Returns:
         list: A list of dictionaries, where each dictionary represents an email message.
-              Each dictionary contains 'id', 'snippet', and 'payload' (for full content).
+              Each dictionary contains 'id', 'subject', 'sender', 'body' and 'snippet'.
     """
     service = get_gmail_service()
     try:
-        response = service.users().messages().list(userId="me", q=query).execute()
-        messages = response.get("messages", [])
-
-        email_list = []
-        for msg in messages:
-            msg_id = msg["id"]
-            full_message = (
-                service.users()
-                .messages()
-                .get(userId="me", id=msg_id, format="full")
-                .execute()
-            )
+        response = (
+            service.users()
+            .messages()
+            .list(userId="me", q=query)
+            .execute(num_retries=GOOGLE_API_RETRIES)
+        )
+        msg_ids = [msg["id"] for msg in response.get("messages", [])]
+        if not msg_ids:
+            return []
 
-            # Extract relevant parts of the email
-            headers = full_message["payload"]["headers"]
-            subject = next(
-                (header["value"] for header in headers if header["name"] == "Subject"),
-                "No Subject",
+        if body_filter is None:
+            body_ids = msg_ids
+            messages = {}
+        else:
+            messages = _get_messages(
+                service,
+                msg_ids,
+                format="metadata",
+                metadataHeaders=["Subject", "From"],
+                fields=METADATA_FIELDS,
             )
-            sender = next(
-                (header["value"] for header in headers if header["name"] == "From"),
-                "Unknown Sender",
+            body_ids = [
+                msg_id
+                for msg_id in msg_ids
+                if msg_id in messages and body_filter(_parse_email(messages[msg_id]))
+            ]
+        if body_ids:
+            messages.update(
+                _get_messages(service, body_ids, format="full", fields=FULL_FIELDS)
             )
 
-            # Get email body (handling different MIME types)
-            msg_body = ""
-            if "parts" in full_message["payload"]:
-                for part in full_message["payload"]["parts"]:
-                    if part["mimeType"] == "text/plain":
-                        data = part["body"].get("data")
-                        if data:
-                            msg_body = base64.urlsafe_b64decode(data).decode("utf-8")
-                            break
-            else:
-                data = full_message["payload"]["body"].get("data")
-                if data:
-                    msg_body = base64.urlsafe_b64decode(data).decode("utf-8")
-
-            email_list.append(
-                {
-                    "id": msg_id,
-                    "subject": subject,
-                    "sender": sender,
-                    "body": msg_body,
-                    "snippet": full_message["snippet"],
-                }
-            )
+        email_list = [
+            _parse_email(messages[msg_id]) for msg_id in msg_ids if msg_id in messages
+        ]
 
-            # Mark as read after processing (optional, but good practice)
-            service.users().messages().modify(
-                userId="me", id=msg_id, body={"removeLabelIds": ["UNREAD"]}
-            ).execute()
+        # Mark as read after processing (optional, but good practice)
+        if email_list:
+            service.users().messages().batchModify(
+                userId="me",
+                body={
+                    "ids": [email["id"] for email in email_list],
+                    "removeLabelIds": ["UNREAD"],
+                },
+            ).execute(num_retries=GOOGLE_API_RETRIES)
 
         return email_list
 
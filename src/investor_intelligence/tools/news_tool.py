@@ -1,13 +1,45 @@
 import os
+import time
+import asyncio
+import httpx
+import orjson
 import requests
 from datetime import datetime, timedelta
 from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from investor_intelligence.utils.cache import file_cached
 
 NEWS_API_KEY = os.getenv("NEWS_API_KEY")
 NEWS_API_BASE_URL = "https://newsapi.org/v2/everything"  # Example for NewsAPI.org
 
+REQUEST_TIMEOUT = 10
+# How long news results are reused, in-process and on disk, in seconds
+NEWS_CACHE_TTL = 300
+# Most queries get_news_articles_batch has in flight at once
+MAX_CONCURRENT_QUERIES = 16
+
+
+def _create_session():
+    """Builds a pooled session that retries rate-limited and transient failures."""
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    return session
+
+
+# Reused by every request so connections to the news API stay open
+_SESSION = _create_session()
+
 
-@lru_cache(maxsize=64)
 def get_news_articles(
     query: str,
     from_date: str = None,
@@ -26,21 +58,68 @@ def get_news_articles(
         sort_by (str): The order to sort the articles in. Defaults to "relevancy".
         page_size (int): The number of results to return per page. Defaults to 10.
 
+    Results are reused for up to NEWS_CACHE_TTL seconds. Default dates are resolved
+    after the cache lookup, so calls that leave them out share entries. Empty results
+    (no articles, a missing API key or a failed request) are not reused.
+
     Returns:
         list: A list of dictionaries, where each dictionary represents a news article.
     """
+    try:
+        return _get_news_articles_for_window(
+            query,
+            from_date,
+            to_date,
+            language,
+            sort_by,
+            page_size,
+            int(time.time() // NEWS_CACHE_TTL),
+        )
+    except _NoArticles:
+        return []
+
+
+class _NoArticles(Exception):
+    """Raised instead of returning [] so lru_cache doesn't memoize the result."""
+
+
+@lru_cache(maxsize=256)
+def _get_news_articles_for_window(
+    query, from_date, to_date, language, sort_by, page_size, window
+):
+    # window only busts the cache: each NEWS_CACHE_TTL-second window is a new key
+    articles = _fetch_news_articles(
+        query, from_date, to_date, language, sort_by, page_size
+    )
+    if not articles:
+        raise _NoArticles()
+    return articles
+
+
+def _api_key_missing() -> bool:
     if not NEWS_API_KEY or NEWS_API_KEY == "YOUR_NEWS_API_KEY":
         print(
             "NEWS_API_KEY is not set. Please set it in your environment variables or replace the placeholder."
         )
-        return []
+        return True
+    return False
+
 
+def _news_params(
+    query,
+    from_date=None,
+    to_date=None,
+    language="en",
+    sort_by="relevancy",
+    page_size=10,
+):
+    """Builds the NewsAPI query parameters, resolving the default date range."""
     if from_date is None:
         from_date = (datetime.now() - timedelta(days=7)).isoformat()  # Last 7 days
     if to_date is None:
         to_date = datetime.now().isoformat()
 
-    params = {
+    return {
         "q": query,
         "from": from_date,
         "to": to_date,
@@ -50,10 +129,20 @@ def get_news_articles(
         "apiKey": NEWS_API_KEY,
     }
 
+
+@file_cached("news_articles", NEWS_CACHE_TTL)
+def _fetch_news_articles(query, from_date, to_date, language, sort_by, page_size):
+    if _api_key_missing():
+        return []
+
+    params = _news_params(query, from_date, to_date, language, sort_by, page_size)
+
     try:
-        response = requests.get(NEWS_API_BASE_URL, params=params)
+        response = _SESSION.get(
+            NEWS_API_BASE_URL, params=params, timeout=REQUEST_TIMEOUT
+        )
         response.raise_for_status()  # Raise an exception for HTTP errors
-        data = response.json()
+        data = orjson.loads(response.content)
         return data.get("articles", [])
     except requests.exceptions.RequestException as e:
         print(f"Error fetching news articles for query '{query}': {e}")
@@ -63,6 +152,109 @@ def get_news_articles(
         return []
 
 
+async def _fetch_articles(client, semaphore, query, params):
+    async with semaphore:
+        try:
+            response = await client.get(NEWS_API_BASE_URL, params=params)
+            response.raise_for_status()
+            return orjson.loads(response.content).get("articles", [])
+        except Exception as e:
+            print(f"Error fetching news articles for query '{query}': {e}")
+            return None
+
+
+async def get_news_articles_batch(queries: list, **kwargs) -> list:
+    """Fetches news articles for several queries concurrently, bypassing the caches.
+
+    Requests share one httpx.AsyncClient; HTTP/2 multiplexes them over a single TLS
+    connection and at most MAX_CONCURRENT_QUERIES are in flight at once.
+
+    Args:
+        queries (list): The search queries (e.g., stock symbols, company names).
+        **kwargs: The get_news_articles parameters, applied to every query.
+
+    Returns:
+        list: The article list for each query, in order, or None where the request failed.
+    """
+    # The client is bound to the running event loop, so it lives for one batch
+    async with httpx.AsyncClient(
+        http2=True,
+        timeout=REQUEST_TIMEOUT,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+    ) as client:
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_QUERIES)
+        return await asyncio.gather(
+            *(
+                _fetch_articles(client, semaphore, query, _news_params(query, **kwargs))
+                for query in queries
+            )
+        )
+
+
+def get_news_articles_many(
+    queries: list,
+    from_date: str = None,
+    to_date: str = None,
+    language: str = "en",
+    sort_by: str = "relevancy",
+    page_size: int = 10,
+) -> list:
+    """Fetches news articles for several queries; synchronous get_news_articles_batch.
+
+    Queries with a fresh entry in get_news_articles' on-disk cache are not requested.
+
+    Args:
+        queries (list): The search queries (e.g., stock symbols, company names).
+        from_date, to_date, language, sort_by, page_size: As for get_news_articles,
+            applied to every query.
+
+    Returns:
+        list: The article list for each query, in order.
+    """
+    if not queries:
+        return []
+    if _api_key_missing():
+        return [[] for _ in queries]
+
+    cache = _fetch_news_articles.cache
+    params = (from_date, to_date, language, sort_by, page_size)
+    keys = {query: _fetch_news_articles.cache_key(query, *params) for query in queries}
+    articles = {query: cache.get(key, NEWS_CACHE_TTL) for query, key in keys.items()}
+    missing = [query for query, found in articles.items() if found is None]
+    if missing:
+        results = asyncio.run(
+            get_news_articles_batch(
+                missing,
+                from_date=from_date,
+                to_date=to_date,
+                language=language,
+                sort_by=sort_by,
+                page_size=page_size,
+            )
+        )
+        for query, found in zip(missing, results):
+            articles[query] = found or []
+            if found:
+                cache.set(keys[query], found)
+    return [articles[query] for query in queries]
+
+
+def get_recent_news_articles(query: str, page_size: int = 10) -> list:
+    """Fetches the last week of news for a query.
+
+    This is get_news_articles with the default date range, so both share one set of
+    cache entries.
+
+    Args:
+        query (str): The search query (e.g., stock symbol, company name).
+        page_size (int): The number of results to return. Defaults to 10.
+
+    Returns:
+        list: A list of dictionaries, where each dictionary represents a news article.
+    """
+    return get_news_articles(query, page_size=page_size)
+
+
 if __name__ == "__main__":
     # Example Usage:
     print("\n--- Fetching news articles for Apple (AAPL) ---")
@@ -1,18 +1,62 @@
 import os
-import pickle
+import time
+import threading
+from functools import lru_cache
+
+import pandas as pd
 
 from google.auth.transport.requests import Request
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 
-# If modifying these scopes, delete the file token.pickle.
+from investor_intelligence.utils.auth import load_credentials, save_credentials
+from investor_intelligence.utils.google_api import GOOGLE_API_RETRIES, JSON_MODEL
+
+# If modifying these scopes, delete the file token.json.
 SCOPES = [
     "https://www.googleapis.com/auth/spreadsheets",
     "https://www.googleapis.com/auth/gmail.send",
 ]
 
 
+# How long read_spreadsheet_data reuses a range's values, in seconds
+SPREADSHEET_CACHE_TTL = 60
+
+# OAuth client secrets in config/ at the project root, resolved once at import
+_CREDENTIALS_PATH = os.path.abspath(
+    os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        "..",
+        "..",
+        "config",
+        "credentials.json",
+    )
+)
+
+# Built once per process by get_sheets_service
+_SHEETS_SERVICE = None
+_SHEETS_SERVICE_LOCK = threading.Lock()
+
+
 def get_sheets_service():
+    """
+    Return the authorized Google Sheets API service client, building it on first use.
+
+    Loading the token and building the client is done once per process; the client
+    refreshes its access token by itself when it expires.
+
+    Returns:
+        googleapiclient.discovery.Resource: Authorized Sheets API service instance.
+    """
+    global _SHEETS_SERVICE
+    if _SHEETS_SERVICE is None:
+        with _SHEETS_SERVICE_LOCK:
+            if _SHEETS_SERVICE is None:
+                _SHEETS_SERVICE = _build_sheets_service()
+    return _SHEETS_SERVICE
+
+
+def _build_sheets_service():
     """
     Authenticate and return a Google Sheets API service client.
 
@@ -21,59 +65,83 @@ def get_sheets_service():
     Returns:
         googleapiclient.discovery.Resource: Authorized Sheets API service instance.
     """
-    creds = None
-    # The file token.pickle stores the user's access and refresh tokens, and is
-    # created automatically when the authorization flow completes for the first
-    # time.
-    print("Checking if token.pickle exists in:", os.path.abspath("token.pickle"))
-    if os.path.exists("token.pickle"):
-        print("token.pickle exists, attempting to load credentials...")
-        with open("token.pickle", "rb") as token:
-            creds = pickle.load(token)
+    # token.json stores the user's access and refresh tokens (see utils.auth)
+    creds = load_credentials(SCOPES)
     # If there are no (valid) credentials available, let the user log in.
     if not creds or not creds.valid:
         if creds and creds.expired and creds.refresh_token:
             print("Credentials expired, refreshing...")
             creds.refresh(Request())
         else:
-            # Find the absolute path to config/credentials.json relative to this file
-            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            credentials_path = os.path.join(
-                base_dir, "..", "..", "config", "credentials.json"
-            )
-            credentials_path = os.path.abspath(credentials_path)
             print(
                 "About to call InstalledAppFlow.from_client_secrets_file with:",
-                credentials_path,
+                _CREDENTIALS_PATH,
             )
             flow = InstalledAppFlow.from_client_secrets_file(
-                credentials_path,
+                _CREDENTIALS_PATH,
                 SCOPES,
             )
             creds = flow.run_local_server(port=0)
         # Save the credentials for the next run
-        with open("token.pickle", "wb") as token:
-            pickle.dump(creds, token)
+        save_credentials(creds)
 
-    service = build("sheets", "v4", credentials=creds)
+    service = build("sheets", "v4", credentials=creds, model=JSON_MODEL)
     return service
 
 
-def read_spreadsheet_data(spreadsheet_id, range_name):
+def read_spreadsheet_data(spreadsheet_id, range_name, as_frame=False):
     """
     Read data from a specified range in a Google Sheet.
 
     Args:
         spreadsheet_id (str): The ID of the Google Spreadsheet.
         range_name (str): The A1 notation of the range to retrieve (e.g., 'Sheet1!A1:D10').
+        as_frame (bool): Return a DataFrame with the first row as column names and
+            numeric columns parsed in one vectorized pass, instead of the raw rows.
+
+    Values are reused for up to SPREADSHEET_CACHE_TTL seconds; call
+    clear_spreadsheet_cache after writing to a sheet.
 
     Returns:
         list: List of rows (each row is a list of cell values). Returns an empty list if no data is found.
+            With as_frame, a pandas.DataFrame (empty if no data is found).
     """
+    values = _read_spreadsheet_data_for_window(
+        spreadsheet_id, range_name, int(time.time() // SPREADSHEET_CACHE_TTL)
+    )
+    return _values_frame(values) if as_frame else values
+
+
+def _values_frame(values):
+    """Builds a DataFrame from sheet rows, converting columns that are all numbers."""
+    if not values:
+        return pd.DataFrame()
+    # The API drops trailing empty cells, so short rows are padded with NaN; cells
+    # beyond the header row have no column name and are dropped
+    width = len(values[0])
+    frame = pd.DataFrame([row[:width] for row in values[1:]], columns=values[0])
+    for position in range(frame.shape[1]):
+        try:
+            frame.isetitem(position, pd.to_numeric(frame.iloc[:, position]))
+        except (ValueError, TypeError):
+            pass  # Not a numeric column; keep the strings
+    return frame
+
+
+def clear_spreadsheet_cache():
+    """Drops every cached read_spreadsheet_data result."""
+    _read_spreadsheet_data_for_window.cache_clear()
+
+
+@lru_cache(maxsize=64)
+def _read_spreadsheet_data_for_window(spreadsheet_id, range_name, window):
+    # window only busts the cache: each SPREADSHEET_CACHE_TTL-second window is a new key
     service = get_sheets_service()
     sheet = service.spreadsheets()
     result = (
-        sheet.values().get(spreadsheetId=spreadsheet_id, range=range_name).execute()
+        sheet.values()
+        .get(spreadsheetId=spreadsheet_id, range=range_name)
+        .execute(num_retries=GOOGLE_API_RETRIES)
     )
     values = result.get("values", [])
 
@@ -0,0 +1,40 @@
+"""Storage for the Google OAuth token shared by the Gmail and Sheets tools."""
+
+import os
+
+from google.oauth2.credentials import Credentials
+
+# Stores the user's access and refresh tokens as JSON; created automatically when
+# the authorization flow completes for the first time
+TOKEN_FILE = "token.json"
+# Written by earlier versions; converted to TOKEN_FILE the first time it is found
+LEGACY_TOKEN_FILE = "token.pickle"
+
+
+def load_credentials(scopes):
+    """Returns the stored OAuth credentials, or None if there are none yet.
+
+    Args:
+        scopes (list): The scopes the credentials are used for.
+
+    Returns:
+        google.oauth2.credentials.Credentials: The stored credentials, or None.
+    """
+    if os.path.exists(TOKEN_FILE):
+        return Credentials.from_authorized_user_file(TOKEN_FILE, scopes)
+    if os.path.exists(LEGACY_TOKEN_FILE):
+        # Unpickle the old token one last time and replace it with JSON
+        import pickle
+
+        with open(LEGACY_TOKEN_FILE, "rb") as token:
+            creds = pickle.load(token)
+        save_credentials(creds)
+        os.remove(LEGACY_TOKEN_FILE)
+        return creds
+    return None
+
+
+def save_credentials(creds):
+    """Writes the credentials to TOKEN_FILE for the next run."""
+    with open(TOKEN_FILE, "w") as token:
+        token.write(creds.to_json())
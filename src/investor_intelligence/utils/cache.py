@@ -0,0 +1,186 @@
+"""On-disk TTL cache for expensive API responses."""
+
+import os
+import json
+import time
+import hashlib
+import inspect
+import functools
+import threading
+from typing import Any, Callable, Optional, Union
+
+import orjson
+
+from investor_intelligence.utils.db import PROJECT_ROOT
+
+# Read at call time so it can be redirected (e.g. by tests)
+CACHE_DIR = os.getenv(
+    "INVESTOR_INTELLIGENCE_CACHE_DIR", os.path.join(PROJECT_ROOT, ".cache")
+)
+
+# The longest TTL any cached function uses; older files can be swept
+MAX_ENTRY_AGE = 24 * 60 * 60
+
+
+class FileCache:
+    """Stores JSON-serializable values as one file per key under CACHE_DIR/<namespace>.
+
+    Each file holds {"ts": <epoch seconds>, "data": <value>}; entries older than the
+    TTL are treated as missing and deleted. I/O errors are reported and treated as
+    cache misses so a broken cache never breaks the caller.
+    """
+
+    def __init__(self, namespace: str):
+        self.namespace = namespace
+
+    def _path(self, key: str) -> str:
+        return os.path.join(CACHE_DIR, self.namespace, f"{key}.json")
+
+    @staticmethod
+    def make_key(*parts) -> str:
+        """Builds a stable file name from JSON-serializable key parts."""
+        raw = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.md5(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str, ttl: float) -> Optional[Any]:
+        """Returns the cached value for key, or None if missing or older than ttl seconds."""
+        try:
+            with open(self._path(key), "rb") as f:
+                entry = orjson.loads(f.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            print(f"Could not read cache entry {self.namespace}/{key}: {e}")
+            return None
+        if time.time() - entry.get("ts", 0) >= ttl:
+            # The caller refetches and rewrites the entry, or it is never needed
+            # again (e.g. an older partition), so don't leave it on disk
+            self._remove(key)
+            return None
+        return entry.get("data")
+
+    def _remove(self, key: str):
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Could not remove cache entry {self.namespace}/{key}: {e}")
+
+    def set(self, key: str, value: Any):
+        """Writes value for key, replacing any existing entry atomically."""
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(orjson.dumps({"ts": time.time(), "data": value}))
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Could not write cache entry {self.namespace}/{key}: {e}")
+
+
+def sweep_cache(max_age: float = MAX_ENTRY_AGE) -> int:
+    """Deletes cache files last written more than max_age seconds ago.
+
+    Entries of past partitions are never read again, so get() never gets to
+    delete them; a periodic sweep keeps CACHE_DIR from growing without bound.
+
+    Args:
+        max_age (float): Age in seconds beyond which files are removed. Defaults to
+            MAX_ENTRY_AGE, past which no entry can still be fresh.
+
+    Returns:
+        int: The number of files removed.
+    """
+    cutoff = time.time() - max_age
+    removed = 0
+    for dir_path, _, file_names in os.walk(CACHE_DIR):
+        for file_name in file_names:
+            path = os.path.join(dir_path, file_name)
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+                    removed += 1
+            except OSError as e:
+                # Already removed by a concurrent get() or sweep, or unreadable
+                if not isinstance(e, FileNotFoundError):
+                    print(f"Could not sweep cache file {path}: {e}")
+    return removed
+
+
+def file_cached(
+    namespace: str,
+    ttl: Union[float, Callable[..., float]],
+    partition: Optional[Callable[[], str]] = None,
+):
+    """Decorator that serves a function's results from a FileCache while they are fresh.
+
+    Args:
+        namespace (str): Sub-directory of CACHE_DIR for this function's entries.
+        ttl (float or callable): Freshness window in seconds, or a function taking the
+            decorated function's arguments and returning one.
+        partition (callable, optional): Returns a string that is folded into every key,
+            e.g. the current trading day. When it changes, older entries stop matching.
+
+    Empty results (None, [], {}) are never cached, since the tools return those on errors.
+    The wrapper exposes `cache` (the FileCache), `cache_key(*args, **kwargs)` and
+    `cache_ttl(*args, **kwargs)` so batch callers can share entries with it.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        cache = FileCache(namespace)
+        signature = inspect.signature(func)
+
+        def bind(args, kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return bound.arguments
+
+        def cache_key(*args, **kwargs) -> str:
+            parts = (func.__name__, bind(args, kwargs))
+            if partition is not None:
+                parts += (partition(),)
+            return FileCache.make_key(*parts)
+
+        def cache_ttl(*args, **kwargs) -> float:
+            return ttl(**bind(args, kwargs)) if callable(ttl) else ttl
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = cache_key(*args, **kwargs)
+            cached = cache.get(key, cache_ttl(*args, **kwargs))
+            if cached is not None:
+                return cached
+            result = func(*args, **kwargs)
+            if result:
+                cache.set(key, result)
+            return result
+
+        wrapper.cache = cache
+        wrapper.cache_key = cache_key
+        wrapper.cache_ttl = cache_ttl
+        return wrapper
+
+    return decorator
+
+
+def singleflight(func: Callable) -> Callable:
+    """Decorator that lets only one call per distinct argument tuple run at a time.
+
+    Concurrent callers with the same arguments wait for the first one instead of
+    racing it. Stack it on top of file_cached so the waiters find the entry the first
+    caller wrote and no duplicate request is made.
+    """
+    locks = {}
+    locks_guard = threading.Lock()
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        key = (args, tuple(sorted(kwargs.items())))
+        with locks_guard:
+            lock = locks.setdefault(key, threading.Lock())
+        with lock:
+            return func(*args, **kwargs)
+
+    return wrapper
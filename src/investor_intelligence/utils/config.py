@@ -1,14 +1,25 @@
 """Configuration management for Investor Intelligence Agent."""
 
 import os
+import copy
 import yaml
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 from pydantic import BaseModel
-from dotenv import load_dotenv
+
+from investor_intelligence.utils.env import load_env
 
 # Load environment variables
-load_dotenv()
+load_env()
+
+# libyaml's C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Parsed config files by path, with the modification time they were parsed at
+_parsed_configs: Dict[str, Tuple[float, Dict[str, Any]]] = {}
 
 
 class AppConfig(BaseModel):
@@ -44,6 +55,12 @@ class LoggingConfig(BaseModel):
     file: str = "logs/investor_intelligence.log"
 
 
+class MetricsConfig(BaseModel):
+    enabled: bool = True
+    # Calls faster than this are not recorded
+    min_duration_ms: float = 0.0
+
+
 class Config:
     """Main configuration class."""
 
@@ -63,20 +80,36 @@ class Config:
             url=os.getenv("DATABASE_URL", "sqlite:///investor_intelligence.db")
         )
         self.logging = LoggingConfig(**self._config_data.get("logging", {}))
+        self.metrics = MetricsConfig(**self._config_data.get("metrics", {}))
 
     def _load_config(self) -> Dict[str, Any]:
-        """Load configuration from YAML file."""
-        if not self.config_file.exists():
+        """Load configuration from YAML file.
+
+        The parsed data is kept in-process, tagged with the file's modification
+        time, so later Config instances skip YAML parsing until the file changes.
+        Each instance gets its own copy.
+        """
+        try:
+            mtime = self.config_file.stat().st_mtime
+        except FileNotFoundError:
             print(f"Config file {self.config_file} not found. Using defaults.")
             return {}
 
+        key = str(self.config_file.resolve())
+        cached = _parsed_configs.get(key)
+        if cached is not None and cached[0] == mtime:
+            return copy.deepcopy(cached[1])
+
         try:
             with open(self.config_file, "r") as f:
-                return yaml.safe_load(f) or {}
+                data = yaml.load(f, Loader=_YamlLoader) or {}
         except Exception as e:
             print(f"Error loading config file: {e}")
             return {}
 
+        _parsed_configs[key] = (mtime, data)
+        return copy.deepcopy(data)
+
 
 # Global configuration instance
 config = Config()
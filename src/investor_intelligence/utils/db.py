@@ -1,16 +1,19 @@
 import sqlite3
 import os
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional
 
 
+@lru_cache(maxsize=1)
 def get_project_root():
     """Get the project root directory reliably."""
     # Try multiple approaches to find the project root
     current_file = os.path.abspath(__file__)
 
     # Approach 1: Go up from utils/db.py to project root
-    project_root = os.path.dirname(
-        os.path.dirname(os.path.dirname(os.path.dirname(current_file)))
-    )
+    project_root = str(Path(current_file).parents[3])
 
     # Approach 2: If that doesn't work, try to find it by looking for setup.py or requirements.txt
     if not os.path.exists(os.path.join(project_root, "setup.py")):
@@ -34,84 +37,156 @@ PROJECT_ROOT = get_project_root()
 DATABASE_FILE = os.path.join(PROJECT_ROOT, "data", "investor_intelligence.db")
 
 
+# Applied to every connection opened by get_connection. WAL turns a commit into an
+# append to the log, and synchronous=NORMAL skips the fsync per commit that WAL
+# doesn't need. journal_mode is stored in the database file, so connections opened
+# elsewhere use WAL too.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MiB
+    "PRAGMA cache_size=-65536",  # 64 MiB
+)
+
+# One connection per database file, shared process-wide
+_connections: Dict[str, sqlite3.Connection] = {}
+_connections_lock = threading.Lock()
+
+
+def get_connection(db_file: Optional[str] = None) -> sqlite3.Connection:
+    """Returns the process-wide connection for db_file, opening it on first use.
+
+    The connection is in autocommit mode (each statement is its own transaction
+    unless BEGIN is issued), may be used from any thread, and must not be closed
+    by callers.
+
+    Args:
+        db_file (str, optional): Path of the database. Defaults to DATABASE_FILE.
+    """
+    db_file = db_file or DATABASE_FILE
+    with _connections_lock:
+        conn = _connections.get(db_file)
+        if conn is None:
+            conn = sqlite3.connect(
+                db_file, check_same_thread=False, isolation_level=None
+            )
+            for pragma in _CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            _connections[db_file] = conn
+        return conn
+
+
+# Data directories already found to exist and be writable; failures are not
+# remembered, so a fixed directory is picked up on the next call
+_writable_dirs = set()
+
+
 def ensure_data_directory():
     """Ensure the data directory exists and is writable."""
     data_dir = os.path.dirname(DATABASE_FILE)
+    if data_dir in _writable_dirs:
+        return True
     try:
         os.makedirs(data_dir, exist_ok=True)
-        # Test if the directory is writable
-        test_file = os.path.join(data_dir, ".test_write")
-        with open(test_file, "w") as f:
-            f.write("test")
-        os.remove(test_file)
-        return True
     except (OSError, IOError) as e:
         print(f"Warning: Could not create or write to data directory {data_dir}: {e}")
         return False
+    if not os.access(data_dir, os.W_OK):
+        print(f"Warning: Data directory {data_dir} is not writable")
+        return False
+    _writable_dirs.add(data_dir)
+    return True
+
+
+# Database files init_db has already set up in this process
+_initialized_dbs = set()
+_init_lock = threading.Lock()
 
 
 def init_db():
-    """Initializes the SQLite database and creates the alerts table if it doesn't exist."""
+    """Initializes the SQLite database and creates the alerts table if it doesn't exist.
+
+    The schema is created once per process and database file; later calls return
+    immediately.
+    """
+    with _init_lock:
+        if DATABASE_FILE in _initialized_dbs:
+            return
+        _init_db()
+        _initialized_dbs.add(DATABASE_FILE)
+
+
+def _init_db():
     if not ensure_data_directory():
         raise RuntimeError(
             f"Cannot create or write to data directory: {os.path.dirname(DATABASE_FILE)}"
         )
 
     try:
-        conn = sqlite3.connect(DATABASE_FILE)
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS alerts (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id TEXT NOT NULL,
-                portfolio_id TEXT NOT NULL,
-                alert_type TEXT NOT NULL,
-                symbol TEXT,
-                threshold REAL,
-                message TEXT NOT NULL,
-                created_at TEXT NOT NULL,
-                is_active INTEGER NOT NULL DEFAULT 1,
-                triggered_at TEXT,
-                relevance_score REAL
-            )
+        create_schema(get_connection())
+        print(f"Database initialized at {DATABASE_FILE}")
+    except sqlite3.OperationalError as e:
+        raise RuntimeError(f"Cannot create database at {DATABASE_FILE}: {e}")
+
+
+def create_schema(conn: sqlite3.Connection):
+    """Creates the alerts and alert_feedback tables and indexes on conn if missing.
+
+    init_db runs this on the shared connection; tests can run it on an in-memory
+    database instead.
+    """
+    cursor = conn.cursor()
+    cursor.execute(
         """
+        CREATE TABLE IF NOT EXISTS alerts (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id TEXT NOT NULL,
+            portfolio_id TEXT NOT NULL,
+            alert_type TEXT NOT NULL,
+            symbol TEXT,
+            threshold REAL,
+            message TEXT NOT NULL,
+            created_at TEXT NOT NULL,
+            is_active INTEGER NOT NULL DEFAULT 1,
+            triggered_at TEXT,
+            relevance_score REAL
         )
+    """
+    )
 
-        # Create alert feedback table for tracking user interactions and relevance feedback
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS alert_feedback (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                alert_id INTEGER NOT NULL,
-                user_id TEXT NOT NULL,
-                feedback_type TEXT NOT NULL,
-                timestamp TEXT NOT NULL,
-                rating INTEGER,
-                relevance_score REAL,
-                interaction_duration REAL,
-                dismiss_reason TEXT,
-                notes TEXT,
-                FOREIGN KEY (alert_id) REFERENCES alerts (id) ON DELETE CASCADE
-            )
+    # Create alert feedback table for tracking user interactions and relevance feedback
+    cursor.execute(
         """
+        CREATE TABLE IF NOT EXISTS alert_feedback (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            alert_id INTEGER NOT NULL,
+            user_id TEXT NOT NULL,
+            feedback_type TEXT NOT NULL,
+            timestamp TEXT NOT NULL,
+            rating INTEGER,
+            relevance_score REAL,
+            interaction_duration REAL,
+            dismiss_reason TEXT,
+            notes TEXT,
+            FOREIGN KEY (alert_id) REFERENCES alerts (id) ON DELETE CASCADE
         )
+    """
+    )
 
-        # Create indexes for better query performance
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_alert_feedback_alert_id ON alert_feedback (alert_id)"
-        )
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_alert_feedback_user_id ON alert_feedback (user_id)"
-        )
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_alert_feedback_timestamp ON alert_feedback (timestamp)"
-        )
-        conn.commit()
-        conn.close()
-        print(f"Database initialized at {DATABASE_FILE}")
-    except sqlite3.OperationalError as e:
-        raise RuntimeError(f"Cannot create database at {DATABASE_FILE}: {e}")
+    # Create indexes for better query performance
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_alert_feedback_alert_id ON alert_feedback (alert_id)"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_alert_feedback_user_id ON alert_feedback (user_id)"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_alert_feedback_timestamp ON alert_feedback (timestamp)"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_alerts_user ON alerts (user_id, is_active)"
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,24 @@
+"""Loads the project's .env file once per process."""
+
+import os
+from functools import lru_cache
+
+from dotenv import load_dotenv
+
+from investor_intelligence.utils.db import PROJECT_ROOT
+
+ENV_FILE = os.path.join(PROJECT_ROOT, ".env")
+
+
+@lru_cache(maxsize=None)
+def load_env():
+    """Loads ENV_FILE into os.environ the first time it is called.
+
+    Modules that read settings at import call this instead of load_dotenv(), so the
+    file is read once per process and opened directly rather than searched for up
+    the directory tree. Variables already set in the environment take precedence.
+
+    Returns:
+        bool: True if the file set at least one variable.
+    """
+    return load_dotenv(ENV_FILE)
@@ -0,0 +1,31 @@
+"""Shared pieces of the Google API clients built by the Gmail and Sheets tools."""
+
+import orjson
+from googleapiclient.model import JsonModel
+
+# Passed as execute(num_retries=...) on idempotent requests: googleapiclient then
+# retries 429s, 5xx responses and dropped connections with randomized exponential
+# backoff. Message sends are left out, since a retried send can deliver twice.
+GOOGLE_API_RETRIES = 5
+
+
+class OrjsonModel(JsonModel):
+    """JsonModel that parses response bodies with orjson instead of the json module.
+
+    Gmail "full" message responses run to hundreds of KB, so the decode is a
+    noticeable share of a batch. Bodies that are not JSON are handed to JsonModel,
+    which returns them as text.
+    """
+
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return super().deserialize(content)
+        if self._data_wrapper and isinstance(body, dict) and "data" in body:
+            body = body["data"]
+        return body
+
+
+# Passed as build(..., model=JSON_MODEL); it holds no per-service state
+JSON_MODEL = OrjsonModel()
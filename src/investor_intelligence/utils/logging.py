@@ -1,5 +1,7 @@
 """Logging configuration for Investor Intelligence Agent."""
 
+import queue
+import atexit
 import logging
 import logging.handlers
 from pathlib import Path
@@ -32,9 +34,17 @@ def setup_logging():
     file_handler.setLevel(getattr(logging, config.logging.level))
     file_handler.setFormatter(formatter)
 
+    # Callers only enqueue records; a listener thread formats them and does the
+    # console and (rotating) file I/O
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)  # Flushes the queued records on exit
+
     # Add handlers to logger
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
     return logger
 
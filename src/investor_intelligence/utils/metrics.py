@@ -1,21 +1,128 @@
 """Metrics collection and monitoring for Investor Intelligence Agent."""
 
 import time
+import atexit
 import functools
 import threading
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Callable
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from collections import defaultdict, deque
 import json
-import sqlite3
 from pathlib import Path
 import logging
 
 from .config import config
-
-
-@dataclass
+from .db import get_connection
+
+_LOG = logging.getLogger("investor_intelligence.metrics")
+
+# When disabled, the tracking decorators and LatencyTracker only run the code
+_ENABLED = config.metrics.enabled
+# Calls faster than this are not recorded, so trivial calls don't flood the table
+_MIN_DURATION_MS = config.metrics.min_duration_ms
+
+# Most metrics waiting for the writer thread; beyond this the oldest are dropped
+METRICS_QUEUE_SIZE = 50_000
+# Most metrics inserted per transaction
+METRICS_FLUSH_BATCH = 1000
+# Most old metrics deleted per transaction by cleanup_old_metrics
+METRICS_CLEANUP_BATCH = 10_000
+
+# start_time and end_time are epoch milliseconds
+_CREATE_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS latency_metrics (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        operation TEXT NOT NULL,
+        service TEXT NOT NULL,
+        start_time INTEGER NOT NULL,
+        end_time INTEGER NOT NULL,
+        duration_ms REAL NOT NULL,
+        success BOOLEAN NOT NULL,
+        error_message TEXT,
+        metadata TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+
+# Earlier versions stored local isoformat() strings; 'utc' shifts them to UTC
+# before the Julian day is converted to epoch milliseconds
+_MIGRATE_TEXT_TIMESTAMPS_SQL = """
+    INSERT INTO latency_metrics
+    (id, operation, service, start_time, end_time, duration_ms, success,
+     error_message, metadata, created_at)
+    SELECT id, operation, service,
+           CAST(ROUND((julianday(start_time, 'utc') - 2440587.5) * 86400000) AS INTEGER),
+           CAST(ROUND((julianday(end_time, 'utc') - 2440587.5) * 86400000) AS INTEGER),
+           duration_ms, success, error_message, metadata, created_at
+    FROM latency_metrics_text
+"""
+
+_INSERT_SQL = """
+    INSERT INTO latency_metrics
+    (operation, service, start_time, end_time, duration_ms, success, error_message, metadata)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SUMMARY_SQL_TEMPLATE = """
+    SELECT
+        COUNT(*) as total_requests,
+        AVG(duration_ms) as avg_duration,
+        MIN(duration_ms) as min_duration,
+        MAX(duration_ms) as max_duration,
+        SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END) as successful_requests,
+        SUM(CASE WHEN success = 0 THEN 1 ELSE 0 END) as failed_requests
+    FROM latency_metrics
+    WHERE {where_clause}
+"""
+# get_metrics_summary's statement for each (filter by service, filter by operation)
+_SUMMARY_SQL = {
+    (by_service, by_operation): _SUMMARY_SQL_TEMPLATE.format(
+        where_clause=" AND ".join(
+            ["start_time >= ?"]
+            + ["service = ?"] * by_service
+            + ["operation = ?"] * by_operation
+        )
+    )
+    for by_service in (False, True)
+    for by_operation in (False, True)
+}
+
+_SERVICE_METRICS_SQL = """
+    SELECT service,
+           COUNT(*) as total_requests,
+           AVG(duration_ms) as avg_duration,
+           MIN(duration_ms) as min_duration,
+           MAX(duration_ms) as max_duration,
+           SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END) as successful_requests
+    FROM latency_metrics
+    WHERE start_time >= ?
+    GROUP BY service
+    ORDER BY total_requests DESC
+"""
+
+_SLOWEST_OPERATIONS_SQL = """
+    SELECT operation, service, duration_ms, start_time, success
+    FROM latency_metrics
+    WHERE start_time >= ?
+    ORDER BY duration_ms DESC
+    LIMIT ?
+"""
+
+_CLEANUP_SQL = """
+    DELETE FROM latency_metrics
+    WHERE rowid IN (
+        SELECT rowid FROM latency_metrics WHERE start_time < ? LIMIT ?
+    )
+"""
+
+
+def _epoch_ms(moment: datetime) -> int:
+    """A (local, naive) datetime as integer milliseconds since the epoch."""
+    return int(moment.timestamp() * 1000)
+
+
+@dataclass(slots=True)
 class LatencyMetric:
     """Represents a single latency measurement."""
 
@@ -27,88 +134,157 @@ class LatencyMetric:
     success: bool
     error_message: Optional[str] = None
     metadata: Optional[Dict[str, Any]] = None
+    # start_time and end_time as epoch milliseconds and the metadata JSON (None
+    # without metadata, the usual case), converted once for storage
+    start_ms: int = field(init=False, repr=False, compare=False)
+    end_ms: int = field(init=False, repr=False, compare=False)
+    metadata_json: Optional[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.start_ms = _epoch_ms(self.start_time)
+        self.end_ms = _epoch_ms(self.end_time)
+        self.metadata_json = json.dumps(self.metadata) if self.metadata else None
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for storage."""
         return {
             "operation": self.operation,
             "service": self.service,
-            "start_time": self.start_time.isoformat(),
-            "end_time": self.end_time.isoformat(),
+            "start_time": self.start_ms,
+            "end_time": self.end_ms,
             "duration_ms": self.duration_ms,
             "success": self.success,
             "error_message": self.error_message,
-            "metadata": json.dumps(self.metadata) if self.metadata else None,
+            "metadata": self.metadata_json,
         }
 
 
+def _metric_row(metric: LatencyMetric) -> tuple:
+    """The _INSERT_SQL parameters for a metric."""
+    return (
+        metric.operation,
+        metric.service,
+        metric.start_ms,
+        metric.end_ms,
+        metric.duration_ms,
+        metric.success,
+        metric.error_message,
+        metric.metadata_json,
+    )
+
+
 class MetricsCollector:
     """Collects and manages latency metrics."""
 
     def __init__(self, db_path: str = "data/metrics.db"):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Shared with every other user of this database file; the lock keeps a
+        # statement and the fetch of its rows together
+        self._conn = get_connection(str(self.db_path))
         self._lock = threading.Lock()
         self._init_database()
-        self.logger = logging.getLogger("investor_intelligence.metrics")
+
+        # record_metric only queues rows; a daemon thread inserts them in batches
+        self._queue = deque(maxlen=METRICS_QUEUE_SIZE)
+        self._cv = threading.Condition()
+        threading.Thread(
+            target=self._flusher, name="metrics-writer", daemon=True
+        ).start()
+        atexit.register(self.flush)
 
     def _init_database(self):
         """Initialize the metrics database."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS latency_metrics (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    operation TEXT NOT NULL,
-                    service TEXT NOT NULL,
-                    start_time TEXT NOT NULL,
-                    end_time TEXT NOT NULL,
-                    duration_ms REAL NOT NULL,
-                    success BOOLEAN NOT NULL,
-                    error_message TEXT,
-                    metadata TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """
-            )
-
-            # Create indexes for better query performance
-            conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_operation ON latency_metrics(operation)"
+        with self._lock:
+            self._conn.execute(_CREATE_TABLE_SQL)
+            self._migrate_text_timestamps()
+
+            # Create indexes for better query performance: filtered summaries seek
+            # on (service, operation) and range-scan start_time; the unfiltered
+            # queries range-scan start_time alone
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_svc_op_time "
+                "ON latency_metrics(service, operation, start_time DESC)"
             )
-            conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_service ON latency_metrics(service)"
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_time_duration "
+                "ON latency_metrics(start_time, duration_ms DESC)"
             )
-            conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_start_time ON latency_metrics(start_time)"
-            )
-            conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_success ON latency_metrics(success)"
+            # Superseded single-column indexes from earlier versions
+            for index in (
+                "idx_operation",
+                "idx_service",
+                "idx_start_time",
+                "idx_success",
+            ):
+                self._conn.execute(f"DROP INDEX IF EXISTS {index}")
+
+    def _migrate_text_timestamps(self):
+        """Rebuilds a table from earlier versions that stored ISO-8601 TEXT times.
+
+        A TEXT column would keep storing the new integers as strings, so the rows
+        are copied into a table with INTEGER columns. Called with the lock held.
+        """
+        columns = self._conn.execute("PRAGMA table_info(latency_metrics)").fetchall()
+        if not any(c[1] == "start_time" and c[2] == "TEXT" for c in columns):
+            return
+        self._conn.execute("BEGIN")
+        try:
+            self._conn.execute(
+                "ALTER TABLE latency_metrics RENAME TO latency_metrics_text"
             )
+            # Index names are global; the renamed table still owns the old ones
+            for index in ("idx_svc_op_time", "idx_time_duration"):
+                self._conn.execute(f"DROP INDEX IF EXISTS {index}")
+            self._conn.execute(_CREATE_TABLE_SQL)
+            self._conn.execute(_MIGRATE_TEXT_TIMESTAMPS_SQL)
+            self._conn.execute("DROP TABLE latency_metrics_text")
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
 
     def record_metric(self, metric: LatencyMetric):
-        """Record a latency metric to the database."""
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute(
-                    """
-                    INSERT INTO latency_metrics 
-                    (operation, service, start_time, end_time, duration_ms, success, error_message, metadata)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        metric.operation,
-                        metric.service,
-                        metric.start_time.isoformat(),
-                        metric.end_time.isoformat(),
-                        metric.duration_ms,
-                        metric.success,
-                        metric.error_message,
-                        json.dumps(metric.metadata) if metric.metadata else None,
-                    ),
-                )
-        except Exception as e:
-            self.logger.error(f"Failed to record metric: {e}")
+        """Queue a latency metric; the writer thread stores it with the next batch."""
+        with self._cv:
+            self._queue.append(_metric_row(metric))
+            self._cv.notify()
+
+    def record_many(self, metrics: List[LatencyMetric]):
+        """Queue several latency metrics at once, waking the writer thread only once."""
+        rows = [_metric_row(metric) for metric in metrics]
+        if rows:
+            with self._cv:
+                self._queue.extend(rows)
+                self._cv.notify()
+
+    def flush(self):
+        """Write every queued metric now. Queries and interpreter exit call this."""
+        with self._lock:
+            while True:
+                with self._cv:
+                    batch = [
+                        self._queue.popleft()
+                        for _ in range(min(len(self._queue), METRICS_FLUSH_BATCH))
+                    ]
+                if not batch:
+                    return
+                try:
+                    # One transaction (and one WAL commit) per batch
+                    self._conn.execute("BEGIN")
+                    self._conn.executemany(_INSERT_SQL, batch)
+                    self._conn.execute("COMMIT")
+                except Exception as e:
+                    if self._conn.in_transaction:
+                        self._conn.execute("ROLLBACK")
+                    _LOG.error("Failed to record %d metrics: %s", len(batch), e)
+
+    def _flusher(self):
+        while True:
+            with self._cv:
+                while not self._queue:
+                    self._cv.wait()
+            self.flush()
 
     def get_metrics_summary(
         self,
@@ -117,37 +293,20 @@ class MetricsCollector:
         hours: int = 24,
     ) -> Dict[str, Any]:
         """Get a summary of metrics for the specified time period."""
+        self.flush()
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._lock:
                 cutoff_time = datetime.now() - timedelta(hours=hours)
 
-                where_clauses = ["start_time >= ?"]
-                params = [cutoff_time.isoformat()]
-
-                if service:
-                    where_clauses.append("service = ?")
-                    params.append(service)
-
-                if operation:
-                    where_clauses.append("operation = ?")
-                    params.append(operation)
-
-                where_clause = " AND ".join(where_clauses)
+                params = (
+                    (_epoch_ms(cutoff_time),)
+                    + ((service,) if service else ())
+                    + ((operation,) if operation else ())
+                )
 
                 # Get basic statistics
-                cursor = conn.execute(
-                    f"""
-                    SELECT 
-                        COUNT(*) as total_requests,
-                        AVG(duration_ms) as avg_duration,
-                        MIN(duration_ms) as min_duration,
-                        MAX(duration_ms) as max_duration,
-                        SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END) as successful_requests,
-                        SUM(CASE WHEN success = 0 THEN 1 ELSE 0 END) as failed_requests
-                    FROM latency_metrics 
-                    WHERE {where_clause}
-                """,
-                    params,
+                cursor = self._conn.execute(
+                    _SUMMARY_SQL[bool(service), bool(operation)], params
                 )
 
                 row = cursor.fetchone()
@@ -188,29 +347,18 @@ class MetricsCollector:
                 }
 
         except Exception as e:
-            self.logger.error(f"Failed to get metrics summary: {e}")
+            _LOG.error("Failed to get metrics summary: %s", e)
             return {}
 
     def get_service_metrics(self, hours: int = 24) -> Dict[str, Dict[str, Any]]:
         """Get metrics grouped by service."""
+        self.flush()
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._lock:
                 cutoff_time = datetime.now() - timedelta(hours=hours)
 
-                cursor = conn.execute(
-                    """
-                    SELECT service, 
-                           COUNT(*) as total_requests,
-                           AVG(duration_ms) as avg_duration,
-                           MIN(duration_ms) as min_duration,
-                           MAX(duration_ms) as max_duration,
-                           SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END) as successful_requests
-                    FROM latency_metrics 
-                    WHERE start_time >= ?
-                    GROUP BY service
-                    ORDER BY total_requests DESC
-                """,
-                    [cutoff_time.isoformat()],
+                cursor = self._conn.execute(
+                    _SERVICE_METRICS_SQL, [_epoch_ms(cutoff_time)]
                 )
 
                 services = {}
@@ -229,26 +377,20 @@ class MetricsCollector:
                 return services
 
         except Exception as e:
-            self.logger.error(f"Failed to get service metrics: {e}")
+            _LOG.error("Failed to get service metrics: %s", e)
             return {}
 
     def get_slowest_operations(
         self, limit: int = 10, hours: int = 24
     ) -> List[Dict[str, Any]]:
         """Get the slowest operations in the specified time period."""
+        self.flush()
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._lock:
                 cutoff_time = datetime.now() - timedelta(hours=hours)
 
-                cursor = conn.execute(
-                    """
-                    SELECT operation, service, duration_ms, start_time, success
-                    FROM latency_metrics 
-                    WHERE start_time >= ?
-                    ORDER BY duration_ms DESC
-                    LIMIT ?
-                """,
-                    [cutoff_time.isoformat(), limit],
+                cursor = self._conn.execute(
+                    _SLOWEST_OPERATIONS_SQL, [_epoch_ms(cutoff_time), limit]
                 )
 
                 operations = []
@@ -259,7 +401,9 @@ class MetricsCollector:
                             "operation": operation,
                             "service": service,
                             "duration_ms": round(duration, 2),
-                            "start_time": start_time,
+                            "start_time": datetime.fromtimestamp(
+                                start_time / 1000
+                            ).isoformat(),
                             "success": bool(success),
                         }
                     )
@@ -267,43 +411,104 @@ class MetricsCollector:
                 return operations
 
         except Exception as e:
-            self.logger.error(f"Failed to get slowest operations: {e}")
+            _LOG.error("Failed to get slowest operations: %s", e)
             return []
 
-    def cleanup_old_metrics(self, days: int = 30):
-        """Clean up metrics older than specified days."""
+    def cleanup_old_metrics(self, days: int = 30, background: bool = False):
+        """Clean up metrics older than specified days.
+
+        Rows are deleted in transactions of METRICS_CLEANUP_BATCH, releasing the
+        lock in between so queued metrics keep being written during a long cleanup.
+        With background=True the cleanup runs on a daemon thread, which is returned.
+        """
+        if background:
+            thread = threading.Thread(
+                target=self.cleanup_old_metrics,
+                args=(days,),
+                name="metrics-cleanup",
+                daemon=True,
+            )
+            thread.start()
+            return thread
+
+        cutoff = _epoch_ms(datetime.now() - timedelta(days=days))
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cutoff_time = datetime.now() - timedelta(days=days)
-                conn.execute(
-                    "DELETE FROM latency_metrics WHERE start_time < ?",
-                    [cutoff_time.isoformat()],
-                )
-                self.logger.info(f"Cleaned up metrics older than {days} days")
+            while True:
+                with self._lock:
+                    deleted = self._conn.execute(
+                        _CLEANUP_SQL, [cutoff, METRICS_CLEANUP_BATCH]
+                    ).rowcount
+                if deleted < METRICS_CLEANUP_BATCH:
+                    break
+                time.sleep(0.01)  # Let the writer thread in between batches
+            _LOG.info("Cleaned up metrics older than %d days", days)
         except Exception as e:
-            self.logger.error(f"Failed to cleanup old metrics: {e}")
+            _LOG.error("Failed to cleanup old metrics: %s", e)
 
 
 # Global metrics collector instance
 _metrics_collector = None
+_metrics_collector_lock = threading.Lock()
 
 
 def get_metrics_collector() -> MetricsCollector:
-    """Get the global metrics collector instance."""
+    """Get the global metrics collector instance.
+
+    Producers only append to its in-memory queue, so request threads share it
+    without contending on the database; the lock just keeps two threads from both
+    creating it (and running its DDL) on first use.
+    """
     global _metrics_collector
     if _metrics_collector is None:
-        _metrics_collector = MetricsCollector()
+        with _metrics_collector_lock:
+            if _metrics_collector is None:
+                _metrics_collector = MetricsCollector()
     return _metrics_collector
 
 
+def _record_latency(
+    collector: MetricsCollector,
+    operation: str,
+    service: str,
+    start_time: datetime,
+    start_ns: int,
+    success: bool,
+    error_message: Optional[str],
+    metadata: Optional[Dict[str, Any]] = None,
+):
+    """Records a call that started at start_time / perf_counter_ns() == start_ns.
+
+    The duration comes from the monotonic counter; end_time is derived from it
+    rather than read from the wall clock a second time.
+    """
+    duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
+    if duration_ms < _MIN_DURATION_MS:
+        return
+    collector.record_metric(
+        LatencyMetric(
+            operation=operation,
+            service=service,
+            start_time=start_time,
+            end_time=start_time + timedelta(milliseconds=duration_ms),
+            duration_ms=duration_ms,
+            success=success,
+            error_message=error_message,
+            metadata=metadata,
+        )
+    )
+
+
 def track_latency(operation: str, service: str):
     """Decorator to track latency of function calls."""
 
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
+            if not _ENABLED:
+                return func(*args, **kwargs)
             collector = get_metrics_collector()
             start_time = datetime.now()
+            start_ns = time.perf_counter_ns()
             success = True
             error_message = None
 
@@ -315,21 +520,16 @@ def track_latency(operation: str, service: str):
                 error_message = str(e)
                 raise
             finally:
-                end_time = datetime.now()
-                duration_ms = (end_time - start_time).total_seconds() * 1000
-
-                metric = LatencyMetric(
-                    operation=operation,
-                    service=service,
-                    start_time=start_time,
-                    end_time=end_time,
-                    duration_ms=duration_ms,
-                    success=success,
-                    error_message=error_message,
+                _record_latency(
+                    collector,
+                    operation,
+                    service,
+                    start_time,
+                    start_ns,
+                    success,
+                    error_message,
                 )
 
-                collector.record_metric(metric)
-
         return wrapper
 
     return decorator
@@ -341,8 +541,11 @@ def track_async_latency(operation: str, service: str):
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
+            if not _ENABLED:
+                return await func(*args, **kwargs)
             collector = get_metrics_collector()
             start_time = datetime.now()
+            start_ns = time.perf_counter_ns()
             success = True
             error_message = None
 
@@ -354,21 +557,16 @@ def track_async_latency(operation: str, service: str):
                 error_message = str(e)
                 raise
             finally:
-                end_time = datetime.now()
-                duration_ms = (end_time - start_time).total_seconds() * 1000
-
-                metric = LatencyMetric(
-                    operation=operation,
-                    service=service,
-                    start_time=start_time,
-                    end_time=end_time,
-                    duration_ms=duration_ms,
-                    success=success,
-                    error_message=error_message,
+                _record_latency(
+                    collector,
+                    operation,
+                    service,
+                    start_time,
+                    start_ns,
+                    success,
+                    error_message,
                 )
 
-                collector.record_metric(metric)
-
         return wrapper
 
     return decorator
@@ -378,33 +576,74 @@ class LatencyTracker:
     """Context manager for tracking latency of code blocks."""
 
     def __init__(
-        self, operation: str, service: str, metadata: Optional[Dict[str, Any]] = None
+        self,
+        operation: str,
+        service: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        collector=None,
     ):
         self.operation = operation
         self.service = service
         self.metadata = metadata
         self.start_time = None
-        self.collector = get_metrics_collector()
+        self._start_ns = None
+        # Anything with record_metric, e.g. a BatchLatencyTracker. The shared
+        # collector is looked up on entry, and only with metrics enabled, so a
+        # disabled tracker never opens the metrics database
+        self.collector = collector
 
     def __enter__(self):
-        self.start_time = datetime.now()
+        if _ENABLED:
+            if self.collector is None:
+                self.collector = get_metrics_collector()
+            self.start_time = datetime.now()
+            self._start_ns = time.perf_counter_ns()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        end_time = datetime.now()
-        duration_ms = (end_time - self.start_time).total_seconds() * 1000
-        success = exc_type is None
-        error_message = str(exc_val) if exc_val else None
-
-        metric = LatencyMetric(
-            operation=self.operation,
-            service=self.service,
-            start_time=self.start_time,
-            end_time=end_time,
-            duration_ms=duration_ms,
-            success=success,
-            error_message=error_message,
-            metadata=self.metadata,
+        if self._start_ns is None:
+            return
+        _record_latency(
+            self.collector,
+            self.operation,
+            self.service,
+            self.start_time,
+            self._start_ns,
+            exc_type is None,
+            str(exc_val) if exc_val else None,
+            self.metadata,
         )
 
-        self.collector.record_metric(metric)
+
+class BatchLatencyTracker:
+    """Context manager that records the metrics of many tracked blocks together.
+
+    Use it around loops that would otherwise record a metric per iteration:
+
+        with BatchLatencyTracker() as batch:
+            for symbol in symbols:
+                with batch.track("get_news_articles", "monitoring_service"):
+                    ...
+
+    The collected metrics are handed to MetricsCollector.record_many on exit.
+    """
+
+    def __init__(self):
+        self.metrics: List[LatencyMetric] = []
+
+    def track(
+        self, operation: str, service: str, metadata: Optional[Dict[str, Any]] = None
+    ) -> LatencyTracker:
+        """Returns a LatencyTracker whose metric is added to this batch."""
+        return LatencyTracker(operation, service, metadata, collector=self)
+
+    def record_metric(self, metric: LatencyMetric):
+        self.metrics.append(metric)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self.metrics:
+            get_metrics_collector().record_many(self.metrics)
+            self.metrics = []
@@ -1,5 +1,17 @@
-from flask import Flask, render_template, request, redirect, url_for, jsonify
+from flask import (
+    Blueprint,
+    Flask,
+    current_app,
+    render_template,
+    request,
+    redirect,
+    url_for,
+    jsonify,
+)
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 # Import services and models
 from investor_intelligence.services.portfolio_service import PortfolioService
@@ -12,13 +24,7 @@ from datetime import date, datetime
 from investor_intelligence.services.monitoring_service import MonitoringService
 from investor_intelligence.utils.logging import logger
 
-app = Flask(__name__)
-
-# Initialize services
-alert_service = AlertService()
-analytics_service = AnalyticsService()
-metrics_service = MetricsService()
-monitoring_service = MonitoringService(alert_service, analytics_service)
+bp = Blueprint("dashboard", __name__)
 
 # IMPORTANT: Replace with your actual Google Sheet ID and range for a test user
 # In a real application, this would be dynamic based on the logged-in user
@@ -27,25 +33,80 @@ SAMPLE_PORTFOLIO_NAME = "Web Dashboard Portfolio"
 SAMPLE_SPREADSHEET_ID = "16Bi8WR-mn5ggPZsGmu3Yr3XAg_S7LaZqDhdy2D6x35Q"  # Replace this
 SAMPLE_RANGE_NAME = "Sheet1!A1:D"
 
-portfolio_service = PortfolioService(SAMPLE_SPREADSHEET_ID, SAMPLE_RANGE_NAME)
+# Runs the independent monitoring jobs of a /monitor request side by side
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="monitor")
+
+# How long page views reuse a loaded portfolio, in seconds
+PORTFOLIO_CACHE_TTL = 60
+
+
+def create_app() -> Flask:
+    """Creates the dashboard app and the services its views use.
+
+    Importing this module does no setup; WSGI servers call this once per worker
+    (e.g. gunicorn "investor_intelligence.web_app.app:create_app()").
+    """
+    app = Flask(__name__)
+    alert_service = AlertService()
+    analytics_service = AnalyticsService()
+    app.extensions.update(
+        alert_service=alert_service,
+        analytics_service=analytics_service,
+        metrics_service=MetricsService(),
+        monitoring_service=MonitoringService(alert_service, analytics_service),
+        portfolio_service=PortfolioService(SAMPLE_SPREADSHEET_ID, SAMPLE_RANGE_NAME),
+    )
+    app.register_blueprint(bp)
+    return app
+
+
+def _service(name: str):
+    """Returns a service created by create_app for the current app."""
+    return current_app.extensions[name]
+
+
+def _load_sample_portfolio():
+    """Loads the sample user's portfolio, reusing it for up to PORTFOLIO_CACHE_TTL."""
+    try:
+        return _load_portfolio_for_window(
+            _service("portfolio_service"),
+            SAMPLE_USER_ID,
+            SAMPLE_PORTFOLIO_NAME,
+            int(time.time() // PORTFOLIO_CACHE_TTL),
+        )
+    except _NoPortfolio:
+        return None
+
+
+class _NoPortfolio(Exception):
+    """Raised instead of returning None so lru_cache doesn't memoize a failed load."""
 
 
-@app.route("/")
+@lru_cache(maxsize=32)
+def _load_portfolio_for_window(portfolio_service, user_id, portfolio_name, window):
+    # window only busts the cache: each PORTFOLIO_CACHE_TTL-second window is a new key
+    portfolio = portfolio_service.load_portfolio_from_sheets(user_id, portfolio_name)
+    if portfolio is None:
+        raise _NoPortfolio()
+    return portfolio
+
+
+@bp.route("/")
 def index():
     logger.info("Accessed index route")
     # Load portfolio data for the sample user
-    portfolio = portfolio_service.load_portfolio_from_sheets(
-        SAMPLE_USER_ID, SAMPLE_PORTFOLIO_NAME
-    )
+    portfolio = _load_sample_portfolio()
 
     # Get active alerts for the sample user
-    alerts = alert_service.get_alerts_for_user(SAMPLE_USER_ID, active_only=True)
+    alerts = _service("alert_service").get_alerts_for_user(
+        SAMPLE_USER_ID, active_only=True
+    )
 
     portfolio_performance = None
     if portfolio:
-        portfolio_performance = analytics_service.calculate_portfolio_performance(
-            portfolio
-        )
+        portfolio_performance = _service(
+            "analytics_service"
+        ).calculate_portfolio_performance(portfolio)
 
     return render_template(
         "index.html",
@@ -55,7 +116,7 @@ def index():
     )
 
 
-@app.route("/add_holding", methods=["POST"])
+@bp.route("/add_holding", methods=["POST"])
 def add_holding():
     try:
         symbol = request.form["symbol"].upper()
@@ -67,7 +128,9 @@ def add_holding():
         )
         # Convert date string to date object
         purchase_date = datetime.strptime(purchase_date_str, "%Y-%m-%d").date()
-        # Load portfolio to add holding
+        portfolio_service = _service("portfolio_service")
+        # Load a fresh copy of the portfolio to add holding (not the cached one,
+        # which page views may be reading)
         portfolio = portfolio_service.load_portfolio_from_sheets(
             SAMPLE_USER_ID, SAMPLE_PORTFOLIO_NAME
         )
@@ -80,113 +143,132 @@ def add_holding():
             )
             portfolio.add_holding(new_holding)
             portfolio_service.save_portfolio_to_sheets()  # Assuming this method exists and updates the sheet
+            _load_portfolio_for_window.cache_clear()  # Show the new holding right away
             logger.info(f"Successfully added holding {symbol} to portfolio.")
         else:
             logger.warning("Portfolio not found when trying to add holding.")
     except Exception as e:
         logger.error(f"Error adding holding: {e}")
-    return redirect(url_for("index"))
+    return redirect(url_for(".index"))
 
 
-@app.route("/deactivate_alert/<int:alert_id>")
+@bp.route("/deactivate_alert/<int:alert_id>")
 def deactivate_alert(alert_id):
     try:
-        alert_service.deactivate_alert(alert_id)
+        _service("alert_service").deactivate_alert(alert_id)
         logger.info(f"Deactivated alert with ID: {alert_id}")
     except Exception as e:
         logger.error(f"Error deactivating alert {alert_id}: {e}")
-    return redirect(url_for("index"))
+    return redirect(url_for(".index"))
 
 
-@app.route("/monitor")
+@bp.route("/monitor")
 def monitor():
     logger.info("Accessed monitor route")
     # Load portfolio data for the sample user
-    portfolio = portfolio_service.load_portfolio_from_sheets(
-        SAMPLE_USER_ID, SAMPLE_PORTFOLIO_NAME
-    )
+    portfolio = _load_sample_portfolio()
     if not portfolio:
         logger.warning("No portfolio found for monitoring.")
         return "No portfolio found for monitoring."
-    try:
-        # Run monitoring services
-        monitoring_service.monitor_earnings_reports(SAMPLE_USER_ID, portfolio)
-        monitoring_service.monitor_news_sentiment(SAMPLE_USER_ID, portfolio)
-        monitoring_service.monitor_price_changes(SAMPLE_USER_ID, portfolio)
+    # Run monitoring services; they are I/O bound and independent, so the request
+    # takes about as long as the slowest one
+    monitoring_service = _service("monitoring_service")
+    futures = [
+        _executor.submit(monitor, SAMPLE_USER_ID, portfolio)
+        for monitor in (
+            monitoring_service.monitor_earnings_reports,
+            monitoring_service.monitor_news_sentiment,
+            monitoring_service.monitor_price_changes,
+        )
+    ]
+    failed = False
+    for future in futures:
+        try:
+            future.result()
+        except Exception as e:
+            failed = True
+            logger.error(f"Error during monitoring: {e}")
+    if not failed:
         logger.info("Monitoring services executed successfully.")
-    except Exception as e:
-        logger.error(f"Error during monitoring: {e}")
     # Get updated alerts
-    alerts = alert_service.get_alerts_for_user(SAMPLE_USER_ID, active_only=True)
+    alerts = _service("alert_service").get_alerts_for_user(
+        SAMPLE_USER_ID, active_only=True
+    )
     return render_template(
         "index.html",
         portfolio=portfolio,
         alerts=alerts,
-        performance=analytics_service.calculate_portfolio_performance(portfolio),
+        performance=_service("analytics_service").calculate_portfolio_performance(
+            portfolio
+        ),
         message="Monitoring complete. Alerts and behavior reflect your current configuration.",
     )
 
 
-@app.route("/metrics")
+@bp.route("/metrics")
 def metrics_dashboard():
     """Metrics dashboard page."""
     return render_template("metrics.html")
 
 
-@app.route("/api/metrics/summary")
+@bp.route("/api/metrics/summary")
 def api_metrics_summary():
     """API endpoint for metrics summary."""
     try:
         hours = request.args.get("hours", 24, type=int)
-        summary = metrics_service.get_overall_performance_summary(hours=hours)
+        summary = _service("metrics_service").get_overall_performance_summary(
+            hours=hours
+        )
         return jsonify(summary)
     except Exception as e:
         logger.error(f"Error getting metrics summary: {e}")
         return jsonify({"error": str(e)}), 500
 
 
-@app.route("/api/metrics/services")
+@bp.route("/api/metrics/services")
 def api_metrics_services():
     """API endpoint for service-specific metrics."""
     try:
         hours = request.args.get("hours", 24, type=int)
-        report = metrics_service.get_service_performance_report(hours=hours)
+        report = _service("metrics_service").get_service_performance_report(hours=hours)
         return jsonify(report)
     except Exception as e:
         logger.error(f"Error getting service metrics: {e}")
         return jsonify({"error": str(e)}), 500
 
 
-@app.route("/api/metrics/alerts")
+@bp.route("/api/metrics/alerts")
 def api_metrics_alerts():
     """API endpoint for performance alerts."""
     try:
         hours = request.args.get("hours", 24, type=int)
-        alerts = metrics_service.get_performance_alerts(hours=hours)
+        alerts = _service("metrics_service").get_performance_alerts(hours=hours)
         return jsonify(alerts)
     except Exception as e:
         logger.error(f"Error getting performance alerts: {e}")
         return jsonify({"error": str(e)}), 500
 
 
-@app.route("/api/metrics/recommendations")
+@bp.route("/api/metrics/recommendations")
 def api_metrics_recommendations():
     """API endpoint for performance recommendations."""
     try:
         hours = request.args.get("hours", 24, type=int)
-        recommendations = metrics_service.get_performance_recommendations(hours=hours)
+        recommendations = _service("metrics_service").get_performance_recommendations(
+            hours=hours
+        )
         return jsonify(recommendations)
     except Exception as e:
         logger.error(f"Error getting performance recommendations: {e}")
         return jsonify({"error": str(e)}), 500
 
 
-@app.route("/api/metrics/trends")
+@bp.route("/api/metrics/trends")
 def api_metrics_trends():
     """API endpoint for trend analysis."""
     try:
         days = request.args.get("days", 7, type=int)
-        trends = metrics_service.get_trend_analysis(days=days)
+        trends = _service("metrics_service").get_trend_analysis(days=days)
         return jsonify(trends)
     except Exception as e:
         logger.error(f"Error getting trend analysis: {e}")
@@ -200,4 +282,4 @@ if __name__ == "__main__":
         exist_ok=True,
     )
     logger.info("Starting Flask web app...")
-    app.run(debug=True, host="0.0.0.0")
+    create_app().run(debug=True, host="0.0.0.0")
@@ -0,0 +1,118 @@
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+
+from investor_intelligence.utils import cache, metrics
+from investor_intelligence.utils.db import create_schema
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-live",
+        action="store_true",
+        default=False,
+        help="Also run tests marked live, which call the real market data APIs.",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-live"):
+        return
+    skip_live = pytest.mark.skip(reason="needs --run-live")
+    for item in items:
+        if "live" in item.keywords:
+            item.add_marker(skip_live)
+
+
+@pytest.fixture
+def mock_alpha_vantage_tool():
+    """Stubs MonitoringService's market data: fixed batch quotes, no earnings."""
+    with patch(
+        "investor_intelligence.services.monitoring_service.get_batch_quotes"
+    ) as mock_get_prices, patch(
+        "investor_intelligence.services.monitoring_service.get_earnings_calendar"
+    ) as mock_get_earnings:
+        # Above the purchase prices the tests use, so price alerts trigger
+        mock_get_prices.return_value = {"AAPL": 160.0, "MSFT": 310.0}
+        mock_get_earnings.return_value = []
+        yield mock_get_prices
+
+
+@pytest.fixture(scope="session", autouse=True)
+def isolated_metrics_collector(tmp_path_factory):
+    # Latency metrics recorded by the code under test go to a throwaway
+    # database instead of data/metrics.db in the working tree
+    collector = metrics.MetricsCollector(
+        str(tmp_path_factory.mktemp("metrics") / "metrics.db")
+    )
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(metrics, "_metrics_collector", collector)
+        yield collector
+        collector.flush()
+
+
+@pytest.fixture(autouse=True)
+def isolated_file_cache(tmp_path, monkeypatch):
+    # Keep the on-disk API response cache out of the working tree and
+    # make sure no test sees entries written by another
+    monkeypatch.setattr(cache, "CACHE_DIR", str(tmp_path / "cache"))
+
+
+# Portfolio sheet contents, by scenario, as read_spreadsheet_data returns them
+_SHEET_ROWS = {
+    "success": (
+        ("Stock Symbol", "Quantity", "Purchase Price", "Purchase Date"),
+        ("AAPL", "10", "150.00", "2023-01-15"),
+        ("MSFT", "5", "250.00", "2023-02-20"),
+    ),
+    "empty": (),
+    "invalid": (
+        ("Stock Symbol", "Quantity", "Purchase Price", "Purchase Date"),
+        ("AAPL", "invalid_qty", "150.00", "2023-01-15"),
+    ),
+}
+
+
+@pytest.fixture(scope="session")
+def sheet_rows():
+    """Returns a function giving a fresh copy of a scenario's sheet rows."""
+
+    def rows(scenario):
+        return [list(row) for row in _SHEET_ROWS[scenario]]
+
+    return rows
+
+
+@pytest.fixture(scope="session")
+def relevance_model():
+    # Built on first use and shared by every test that asks for it; imported here
+    # so runs that never request it don't load it at collection time
+    from investor_intelligence.ml.relevance_model import RelevanceModel
+
+    return RelevanceModel()
+
+
+@pytest.fixture(scope="session")
+def nlp_service():
+    from investor_intelligence.services.nlp_service import NLPService
+
+    return NLPService()
+
+
+@pytest.fixture(scope="session")
+def alert_db():
+    # One in-memory alerts database per worker; the schema is built once
+    conn = sqlite3.connect(":memory:", check_same_thread=False, isolation_level=None)
+    create_schema(conn)
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def alert_db_savepoint(alert_db):
+    # Rolls back whatever a test wrote instead of rebuilding the schema
+    alert_db.execute("SAVEPOINT test_case")
+    yield alert_db
+    alert_db.execute("ROLLBACK TO test_case")
+    alert_db.execute("RELEASE test_case")
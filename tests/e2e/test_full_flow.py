@@ -1,5 +1,4 @@
 import pytest
-import os
 import time
 from datetime import datetime, timedelta
 
@@ -8,39 +7,28 @@ from investor_intelligence.services.portfolio_service import PortfolioService
 from investor_intelligence.services.alert_service import AlertService
 from investor_intelligence.services.monitoring_service import MonitoringService
 from investor_intelligence.services.summary_service import SummaryService
-from investor_intelligence.services.nlp_service import NLPService
 from investor_intelligence.services.query_processor_service import QueryProcessorService
 from investor_intelligence.services.user_config_service import UserConfigService
-from investor_intelligence.tools.gmail_tool import send_message, get_unread_emails
 from investor_intelligence.models.portfolio import Portfolio, StockHolding
 from investor_intelligence.models.alert import Alert
-from investor_intelligence.ml.relevance_model import RelevanceModel
 
 # --- Setup Fixtures (for pytest) ---
 
 
 @pytest.fixture(scope="module")
-def setup_test_environment():
-    # Get the project root directory
-    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    data_dir = os.path.join(project_root, "data")
-
-    # Ensure data directory exists
-    os.makedirs(data_dir, exist_ok=True)
-
-    # Clean up any existing test databases or files
-    if os.path.exists(os.path.join(data_dir, "investor_intelligence.db")):
-        os.remove(os.path.join(data_dir, "investor_intelligence.db"))
-    if os.path.exists(os.path.join(data_dir, "user_configs.db")):
-        os.remove(os.path.join(data_dir, "user_configs.db"))
+def setup_test_environment(tmp_path_factory, worker_id, relevance_model, nlp_service):
+    # Each xdist worker gets fresh databases of its own, so parallel runs don't
+    # delete or share each other's data
+    data_dir = tmp_path_factory.mktemp(f"data_{worker_id}")
 
     # Initialize services with clean state
-    alert_service = AlertService()
-    user_config_service = UserConfigService()
-    relevance_model = RelevanceModel()
+    user_config_service = UserConfigService(db_path=data_dir / "user_configs.db")
+    alert_service = AlertService(
+        db_path=data_dir / "investor_intelligence.db",
+        user_config_service=user_config_service,
+    )
     monitoring_service = MonitoringService(alert_service, relevance_model)
     summary_service = SummaryService(alert_service, monitoring_service)
-    nlp_service = NLPService()
     query_processor_service = QueryProcessorService(
         nlp_service, PortfolioService("", ""), monitoring_service
     )  # Dummy PortfolioService for query_processor
@@ -76,8 +64,8 @@ def setup_test_environment():
         user_id=test_user_id, name=test_portfolio_name, holdings=test_holdings
     )
 
-    # Yield services and test data
-    yield {
+    # The databases go away with the temporary directory, so there is no teardown
+    return {
         "alert_service": alert_service,
         "monitoring_service": monitoring_service,
         "summary_service": summary_service,
@@ -91,25 +79,16 @@ def setup_test_environment():
         "test_range_name": test_range_name,
     }
 
-    # Teardown (clean up after tests)
-    if os.path.exists(os.path.join(data_dir, "investor_intelligence.db")):
-        os.remove(os.path.join(data_dir, "investor_intelligence.db"))
-    if os.path.exists(os.path.join(data_dir, "user_configs.db")):
-        os.remove(os.path.join(data_dir, "user_configs.db"))
-
 
 # --- Test Functions ---
 
 
-def test_price_monitoring_and_alerting(setup_test_environment):
-    env = setup_test_environment
+def _check_price_monitoring_and_alerting(env):
     monitoring_service = env["monitoring_service"]
     alert_service = env["alert_service"]
     test_user_id = env["test_user_id"]
     test_portfolio = env["test_portfolio"]
 
-    # Simulate price change (this requires mocking external API calls in a real E2E test)
-    # For now, we assume get_current_price will return a value that triggers an alert
     monitoring_service.monitor_price_changes(
         test_user_id, test_portfolio, threshold=0.1
     )
@@ -123,6 +102,18 @@ def test_price_monitoring_and_alerting(setup_test_environment):
     print("E2E Test: Price monitoring and alerting successful.")
 
 
+@pytest.mark.usefixtures("mock_alpha_vantage_tool")
+def test_price_monitoring_and_alerting(setup_test_environment):
+    # Quotes come from the mock, which prices every holding above its cost
+    _check_price_monitoring_and_alerting(setup_test_environment)
+
+
+@pytest.mark.live
+def test_price_monitoring_and_alerting_live(setup_test_environment):
+    # Real quotes; any move beyond the 0.1% threshold raises an alert
+    _check_price_monitoring_and_alerting(setup_test_environment)
+
+
 def test_email_query_processing(setup_test_environment):
     env = setup_test_environment
     query_processor_service = env["query_processor_service"]
@@ -5,19 +5,6 @@ from investor_intelligence.services.monitoring_service import MonitoringService
 from investor_intelligence.services.alert_service import AlertService
 from investor_intelligence.models.portfolio import Portfolio, StockHolding
 from datetime import datetime, date
-from investor_intelligence.ml.relevance_model import RelevanceModel
-
-
-@pytest.fixture
-def mock_alpha_vantage_tool():
-    with patch(
-        "investor_intelligence.tools.alpha_vantage_tool.get_current_price"
-    ) as mock_get_price, patch(
-        "investor_intelligence.tools.alpha_vantage_tool.get_earnings_calendar"
-    ) as mock_get_earnings:
-        mock_get_price.return_value = 160.0  # Mock a price that triggers an alert
-        mock_get_earnings.return_value = []  # Mock no earnings for simplicity
-        yield
 
 
 @pytest.fixture
@@ -29,18 +16,10 @@ def mock_news_tool():
         yield
 
 
-def test_monitoring_service_triggers_alert(mock_alpha_vantage_tool, mock_news_tool):
-    # Get the project root directory and ensure data directory exists
-    import os
-
-    project_root = os.path.dirname(
-        os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    )
-    data_dir = os.path.join(project_root, "data")
-    os.makedirs(data_dir, exist_ok=True)
-
-    alert_service = AlertService()
-    relevance_model = RelevanceModel()
+def test_monitoring_service_triggers_alert(
+    mock_alpha_vantage_tool, mock_news_tool, alert_db_savepoint, relevance_model
+):
+    alert_service = AlertService(connection=alert_db_savepoint)
     monitoring_service = MonitoringService(alert_service, relevance_model)
 
     test_portfolio = Portfolio(
@@ -53,18 +32,54 @@ def test_monitoring_service_triggers_alert(mock_alpha_vantage_tool, mock_news_to
                 purchase_price=150.0,
                 purchase_date=date.today(),
             ),
+            StockHolding(
+                symbol="MSFT",
+                quantity=5,
+                purchase_price=300.0,
+                purchase_date=date.today(),
+            ),
         ],
     )
 
-    # Ensure alert service is clean
-    alert_service.create_table()  # Recreate table for clean state
-
     monitoring_service.monitor_price_changes(
         "test_user_int", test_portfolio, threshold=0.1
     )
 
+    # One batch quote request covers every holding
+    mock_alpha_vantage_tool.assert_called_once_with(["AAPL", "MSFT"])
     alerts = alert_service.get_alerts_for_user("test_user_int", active_only=True)
-    assert len(alerts) == 1
-    assert alerts[0].alert_type == "price_gain"
-    assert alerts[0].symbol == "AAPL"
+    assert len(alerts) == 2
+    assert {alert.alert_type for alert in alerts} == {"price_gain"}
+    assert sorted(alert.symbol for alert in alerts) == ["AAPL", "MSFT"]
     print("Integration Test: Monitoring service successfully triggered price alert.")
+
+
+@patch("investor_intelligence.tools.news_tool._SESSION.get")
+@patch("investor_intelligence.tools.news_tool.NEWS_API_KEY", "test_key")
+def test_repeated_news_checks_reuse_cached_articles(
+    mock_get, alert_db_savepoint, relevance_model
+):
+    from investor_intelligence.tools import news_tool
+
+    news_tool._get_news_articles_for_window.cache_clear()
+    mock_get.return_value.content = (
+        b'{"articles": [{"title": "AAPL shareholder meeting scheduled"}]}'
+    )
+    monitoring_service = MonitoringService(
+        AlertService(connection=alert_db_savepoint), relevance_model
+    )
+    portfolio = Portfolio(
+        user_id="test_user_int",
+        name="News Test Portfolio",
+        holdings=[StockHolding("AAPL", 10, 150.0, date.today())],
+    )
+
+    monitoring_service.monitor_news_sentiment("test_user_int", portfolio)
+    # A later check in a new process (empty in-process memo) reads the disk cache
+    news_tool._get_news_articles_for_window.cache_clear()
+    monitoring_service.monitor_news_sentiment("test_user_int", portfolio)
+
+    mock_get.assert_called_once()
+    params = mock_get.call_args.kwargs["params"]
+    assert params["from"].endswith(":00:00")
+    news_tool._get_news_articles_for_window.cache_clear()
@@ -0,0 +1,174 @@
+import pytest
+import threading
+from datetime import datetime, timedelta
+
+from investor_intelligence.services import alert_service as alert_service_module
+from investor_intelligence.services import alert_feedback_service
+from investor_intelligence.services.alert_service import AlertService
+from investor_intelligence.services.user_config_service import UserConfigService
+from investor_intelligence.models.alert import Alert
+from investor_intelligence.utils import db
+
+
+@pytest.fixture
+def alert_service(tmp_path, monkeypatch):
+    # Point every module that captured DATABASE_FILE at a throwaway database
+    db_file = str(tmp_path / "investor_intelligence.db")
+    monkeypatch.setattr(db, "DATABASE_FILE", db_file)
+    monkeypatch.setattr(alert_service_module, "DATABASE_FILE", db_file)
+    monkeypatch.setattr(alert_feedback_service, "DATABASE_FILE", db_file)
+    user_configs_file = str(tmp_path / "user_configs.db")
+    monkeypatch.setattr(
+        UserConfigService, "DB_FILE", property(lambda self: user_configs_file)
+    )
+    return AlertService()
+
+
+def _make_alert(user_id, alert_type, symbol="AAPL"):
+    return Alert(
+        user_id=user_id,
+        portfolio_id="p1",
+        alert_type=alert_type,
+        symbol=symbol,
+        message=f"{alert_type} for {symbol}",
+        triggered_at=datetime.now(),
+    )
+
+
+def test_get_alerts_for_user_filters_by_alert_types(alert_service):
+    alert_service.create_alert(_make_alert("user1", "price_gain"))
+    alert_service.create_alert(_make_alert("user1", "price_drop", "MSFT"))
+    alert_service.create_alert(_make_alert("user1", "news_sentiment"))
+    alert_service.create_alert(_make_alert("user2", "price_gain"))
+
+    price_alerts = alert_service.get_alerts_for_user(
+        "user1", alert_types=("price_gain", "price_drop")
+    )
+    assert sorted(a.alert_type for a in price_alerts) == ["price_drop", "price_gain"]
+
+    news_alerts = alert_service.get_alerts_for_user(
+        "user1", alert_types=["news_sentiment"]
+    )
+    assert [a.alert_type for a in news_alerts] == ["news_sentiment"]
+
+    assert alert_service.get_alerts_for_user("user1", alert_types=[]) == []
+    assert len(alert_service.get_alerts_for_user("user1")) == 3
+
+
+def test_get_alerts_for_user_active_only(alert_service):
+    alert = alert_service.create_alert(_make_alert("user1", "price_gain"))
+    alert_service.create_alert(_make_alert("user1", "price_gain", "MSFT"))
+    alert_service.deactivate_alert(alert.id)
+
+    active = alert_service.get_alerts_for_user("user1", alert_types=["price_gain"])
+    assert [a.symbol for a in active] == ["MSFT"]
+
+    everything = alert_service.get_alerts_for_user(
+        "user1", active_only=False, alert_types=["price_gain"]
+    )
+    assert len(everything) == 2
+
+
+def test_get_filtered_alerts_for_user_matches_filter_alerts(alert_service):
+    alert_service.user_config_service.save_user_config(
+        "user1", {"min_price_change_percent": 2.0}
+    )
+    small = _make_alert("user1", "price_gain")
+    small.message = "ALERT: AAPL price changed by 1.50% to $10.00."
+    large = _make_alert("user1", "price_gain", "MSFT")
+    large.message = "ALERT: MSFT price changed by 3.00% to $10.00."
+    for alert in (small, large, _make_alert("user1", "news_sentiment")):
+        alert_service.create_alert(alert)
+
+    filtered = alert_service.get_filtered_alerts_for_user("user1")
+    expected = alert_service.filter_alerts(
+        alert_service.get_alerts_for_user("user1"), "user1"
+    )
+
+    assert [a.id for a in filtered] == [a.id for a in expected]
+    assert sorted(a.symbol + a.alert_type for a in filtered) == [
+        "AAPLnews_sentiment",
+        "MSFTprice_gain",
+    ]
+    assert alert_service.get_filtered_alerts_for_user("user1", types=["news_sentiment"])
+    assert (
+        alert_service.get_filtered_alerts_for_user(
+            "user1", since=datetime.now() + timedelta(days=1)
+        )
+        == []
+    )
+
+
+def test_alert_service_uses_injected_connection(alert_db_savepoint):
+    service = AlertService(connection=alert_db_savepoint)
+    alert = service.create_alert(_make_alert("user1", "price_gain"))
+
+    assert service.get_alert_by_id(alert.id).symbol == "AAPL"
+    assert service.feedback_service._get_db_connection() is alert_db_savepoint
+    assert service.user_config_service._conn is alert_db_savepoint
+    count = alert_db_savepoint.execute("SELECT COUNT(*) FROM alerts").fetchone()[0]
+    assert count == 1
+
+
+def test_create_alert_ids_match_rows_across_threads(alert_service):
+    created = []
+
+    def create(symbol):
+        created.append(
+            alert_service.create_alert(_make_alert("user1", "price_gain", symbol))
+        )
+
+    threads = [threading.Thread(target=create, args=(f"S{i}",)) for i in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({alert.id for alert in created}) == 20
+    for alert in created:
+        assert alert_service.get_alert_by_id(alert.id).symbol == alert.symbol
+
+
+def test_get_alerts_for_users_groups_by_user(alert_service):
+    alert_service.create_alert(_make_alert("user1", "price_gain"))
+    alert_service.create_alert(_make_alert("user1", "news_sentiment"))
+    alert_service.create_alert(_make_alert("user2", "price_drop", "MSFT"))
+    alert_service.create_alert(_make_alert("user3", "price_gain"))
+
+    alerts = alert_service.get_alerts_for_users(
+        ["user1", "user2", "nobody"], alert_types=["price_gain", "price_drop"]
+    )
+
+    assert {
+        user_id: [a.symbol for a in found] for user_id, found in alerts.items()
+    } == {
+        "user1": ["AAPL"],
+        "user2": ["MSFT"],
+        "nobody": [],
+    }
+    assert alert_service.get_alerts_for_users([]) == {}
+
+
+def test_alert_service_uses_given_db_paths(tmp_path):
+    user_config_service = UserConfigService(db_path=tmp_path / "user_configs.db")
+    service = AlertService(
+        db_path=tmp_path / "alerts.db", user_config_service=user_config_service
+    )
+    alert = service.create_alert(_make_alert("user1", "price_gain"))
+
+    assert service.user_config_service is user_config_service
+    assert user_config_service.DB_FILE == str(tmp_path / "user_configs.db")
+    assert service.feedback_service._get_db_connection() is service._conn
+    row = db.get_connection(str(tmp_path / "alerts.db")).execute(
+        "SELECT symbol FROM alerts WHERE id = ?", (alert.id,)
+    )
+    assert row.fetchone()[0] == "AAPL"
+
+
+def test_alert_service_keeps_user_configs_in_its_db_path(tmp_path):
+    service = AlertService(db_path=tmp_path / "alerts.db")
+    service.user_config_service.save_user_config("user1", {"n": 1})
+
+    assert service.user_config_service._conn is service._conn
+    assert service.user_config_service.DB_FILE == str(tmp_path / "alerts.db")
+    assert service.user_config_service.get_user_config("user1")["n"] == 1
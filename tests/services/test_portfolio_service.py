@@ -2,18 +2,26 @@ import pytest
 from unittest.mock import patch, MagicMock
 from datetime import date
 
+from investor_intelligence.services import portfolio_service
 from investor_intelligence.services.portfolio_service import PortfolioService
 from investor_intelligence.models.portfolio import Portfolio, StockHolding
 
 
-# Mock the read_spreadsheet_data function from sheets_tool
-@patch("investor_intelligence.services.portfolio_service.read_spreadsheet_data")
-def test_load_portfolio_from_sheets_success(mock_read_spreadsheet_data):
-    mock_read_spreadsheet_data.return_value = [
-        ["Stock Symbol", "Quantity", "Purchase Price", "Purchase Date"],
-        ["AAPL", "10", "150.00", "2023-01-15"],
-        ["MSFT", "5", "250.00", "2023-02-20"],
-    ]
+@pytest.fixture
+def sheet_scenario(sheet_rows, monkeypatch):
+    """Makes read_spreadsheet_data return the rows of the given scenario."""
+
+    def use(scenario):
+        rows = sheet_rows(scenario)
+        monkeypatch.setattr(
+            portfolio_service, "read_spreadsheet_data", lambda *args, **kwargs: rows
+        )
+
+    return use
+
+
+def test_load_portfolio_from_sheets_success(sheet_scenario):
+    sheet_scenario("success")
 
     service = PortfolioService("test_sheet_id", "Sheet1!A1:D")
     portfolio = service.load_portfolio_from_sheets("user123", "My Portfolio")
@@ -26,9 +34,8 @@ def test_load_portfolio_from_sheets_success(mock_read_spreadsheet_data):
     assert portfolio.holdings[1].quantity == 5
 
 
-@patch("investor_intelligence.services.portfolio_service.read_spreadsheet_data")
-def test_load_portfolio_from_sheets_empty(mock_read_spreadsheet_data):
-    mock_read_spreadsheet_data.return_value = []
+def test_load_portfolio_from_sheets_empty(sheet_scenario):
+    sheet_scenario("empty")
 
     service = PortfolioService("test_sheet_id", "Sheet1!A1:D")
     portfolio = service.load_portfolio_from_sheets("user123", "My Portfolio")
@@ -36,12 +43,8 @@ def test_load_portfolio_from_sheets_empty(mock_read_spreadsheet_data):
     assert portfolio is None
 
 
-@patch("investor_intelligence.services.portfolio_service.read_spreadsheet_data")
-def test_load_portfolio_from_sheets_invalid_data(mock_read_spreadsheet_data):
-    mock_read_spreadsheet_data.return_value = [
-        ["Stock Symbol", "Quantity", "Purchase Price", "Purchase Date"],
-        ["AAPL", "invalid_qty", "150.00", "2023-01-15"],
-    ]
+def test_load_portfolio_from_sheets_invalid_data(sheet_scenario):
+    sheet_scenario("invalid")
 
     service = PortfolioService("test_sheet_id", "Sheet1!A1:D")
     portfolio = service.load_portfolio_from_sheets("user123", "My Portfolio")
@@ -52,6 +55,44 @@ def test_load_portfolio_from_sheets_invalid_data(mock_read_spreadsheet_data):
     assert len(portfolio.holdings) == 0
 
 
+@patch("investor_intelligence.services.portfolio_service.read_spreadsheet_data")
+def test_load_portfolio_from_sheets_skips_only_bad_rows(mock_read_spreadsheet_data):
+    mock_read_spreadsheet_data.return_value = [
+        ["Stock Symbol", "Quantity", "Purchase Price", "Purchase Date"],
+        ["AAPL", "10", "150.00", "2023-01-15"],
+        ["GOOG", "1.5", "100.00", "2023-01-15"],
+        ["TSLA", "3", "200.00", "2023/01/15"],
+        ["NVDA", "4"],
+        [" MSFT ", 5, 250.0, "2023-02-20"],
+    ]
+
+    service = PortfolioService("test_sheet_id", "Sheet1!A1:D")
+    portfolio = service.load_portfolio_from_sheets("user123", "My Portfolio")
+
+    assert portfolio.holdings == [
+        StockHolding("AAPL", 10, 150.0, date(2023, 1, 15)),
+        StockHolding("MSFT", 5, 250.0, date(2023, 2, 20)),
+    ]
+    assert type(portfolio.holdings[0].quantity) is int
+
+
+@patch("investor_intelligence.services.portfolio_service.read_spreadsheet_data")
+def test_load_portfolio_from_sheets_skips_non_positive_rows(mock_read_spreadsheet_data):
+    mock_read_spreadsheet_data.return_value = [
+        ["Stock Symbol", "Quantity", "Purchase Price", "Purchase Date"],
+        ["AAPL", "10", "150.00", "2023-01-15"],
+        ["MSFT", "-1", "250.00", "2023-02-20"],
+        ["GOOG", "0", "100.00", "2023-01-15"],
+        ["TSLA", "3", "0", "2023-01-15"],
+        ["  ", "4", "50.00", "2023-01-15"],
+    ]
+
+    service = PortfolioService("test_sheet_id", "Sheet1!A1:D")
+    portfolio = service.load_portfolio_from_sheets("user123", "My Portfolio")
+
+    assert portfolio.holdings == [StockHolding("AAPL", 10, 150.0, date(2023, 1, 15))]
+
+
 def test_add_holding_to_portfolio():
     portfolio = Portfolio(user_id="user1", name="Test")
     service = PortfolioService("", "")  # Dummy values, not used for this test
@@ -61,6 +102,11 @@ def test_add_holding_to_portfolio():
     service.add_holding_to_portfolio(holding)
     assert len(portfolio.holdings) == 1
     assert portfolio.holdings[0].symbol == "GOOG"
+    assert portfolio.get_holding("goog") is holding
+
+    service.add_holding_to_portfolio(StockHolding("GOOG", 5, 110.0, date(2023, 2, 1)))
+    assert portfolio.get_holding("GOOG") is holding
+    assert portfolio.total_quantity("GOOG") == 15
 
 
 def test_remove_holding_from_portfolio():
@@ -79,7 +125,37 @@ def test_remove_holding_from_portfolio():
     assert removed is True
     assert len(portfolio.holdings) == 1
     assert portfolio.holdings[0].symbol == "AAPL"
+    assert portfolio.get_holding("GOOG") is None
+    assert portfolio.total_quantity("GOOG") == 0
+    assert portfolio.get_holding("AAPL").quantity == 5
 
     removed_non_existent = service.remove_holding_from_portfolio("XYZ")
     assert removed_non_existent is False
     assert len(portfolio.holdings) == 1
+
+
+@patch("investor_intelligence.services.portfolio_service.get_sheets_service")
+def test_save_portfolio_to_sheets(mock_get_sheets_service):
+    mock_values = mock_get_sheets_service.return_value.spreadsheets.return_value.values
+    mock_values.return_value.update.return_value.execute.return_value = {
+        "updatedCells": 8
+    }
+    service = PortfolioService("test_sheet_id", "Sheet1!A1:D")
+    service._portfolio = Portfolio(
+        user_id="user1",
+        name="Test",
+        holdings=[StockHolding("GOOG", 10, 100.0, date(2023, 1, 5))],
+    )
+
+    assert service.save_portfolio_to_sheets() is True
+    mock_values.return_value.update.assert_called_once_with(
+        spreadsheetId="test_sheet_id",
+        range="Sheet1!A1:D",
+        valueInputOption="RAW",
+        body={
+            "values": [
+                ["Stock Symbol", "Quantity", "Purchase Price", "Purchase Date"],
+                ["GOOG", 10, 100.0, "2023-01-05"],
+            ]
+        },
+    )
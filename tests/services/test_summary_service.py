@@ -0,0 +1,129 @@
+from unittest.mock import patch, MagicMock
+from datetime import date, datetime, timedelta
+
+from investor_intelligence.services.summary_service import SummaryService
+from investor_intelligence.models.portfolio import Portfolio, StockHolding
+
+
+def test_generate_daily_summary_empty_portfolio_skips_lookups():
+    alert_service = MagicMock()
+    monitoring_service = MagicMock()
+    service = SummaryService(alert_service, monitoring_service)
+
+    summary = service.generate_daily_summary(
+        "user1", Portfolio(user_id="user1", name="Empty"), today="2024-01-02"
+    )
+
+    assert summary.startswith(
+        "Daily Investor Intelligence Summary for Empty (2024-01-02)"
+    )
+    assert "no holdings" in summary
+    alert_service.get_filtered_alerts_for_user.assert_not_called()
+    monitoring_service.generate_earnings_summary.assert_not_called()
+
+
+@patch("investor_intelligence.services.summary_service.fetch_daily_series")
+@patch("investor_intelligence.services.summary_service.get_batch_quotes")
+def test_generate_weekly_summary_totals(mock_get_batch_quotes, mock_fetch_daily_series):
+    week_ago = (datetime.now() - timedelta(days=8)).strftime("%Y-%m-%d")
+    mock_get_batch_quotes.return_value = {"AAPL": 110.0}
+    mock_fetch_daily_series.return_value = {
+        "AAPL": {
+            datetime.now().strftime("%Y-%m-%d"): {"4. close": "110.00"},
+            week_ago: {"4. close": "100.00"},
+            "2000-01-03": {"4. close": "1.00"},
+        },
+        "MSFT": None,
+    }
+    alert_service = MagicMock()
+    alert_service.get_filtered_alerts_for_user.return_value = []
+    service = SummaryService(alert_service, MagicMock())
+    portfolio = Portfolio(
+        user_id="user1",
+        name="Weekly",
+        holdings=[
+            StockHolding("AAPL", 10, 90.0, date(2023, 1, 1)),
+            StockHolding("MSFT", 5, 200.0, date(2023, 1, 1)),
+        ],
+    )
+
+    summary = service.generate_weekly_summary("user1", portfolio)
+
+    mock_get_batch_quotes.assert_called_once_with(["AAPL", "MSFT"])
+    # MSFT has no current price, so its history is not requested
+    mock_fetch_daily_series.assert_called_once_with(["AAPL"], outputsize="compact")
+    assert "Total Portfolio Value: $1100.00" in summary
+    assert "Weekly Change: 10.00%" in summary
+
+
+def test_generate_daily_summary_fetches_alerts_once():
+    price_alert = MagicMock(alert_type="price_drop", message="AAPL fell 5%")
+    news_alert = MagicMock(alert_type="news_sentiment", message="MSFT news is upbeat")
+    alert_service = MagicMock()
+    alert_service.get_filtered_alerts_for_user.return_value = [price_alert, news_alert]
+    monitoring_service = MagicMock()
+    monitoring_service.generate_earnings_summary.return_value = "No earnings.\n"
+    service = SummaryService(alert_service, monitoring_service)
+    portfolio = Portfolio(
+        user_id="user1",
+        name="Daily",
+        holdings=[StockHolding("AAPL", 10, 90.0, date(2023, 1, 1))],
+    )
+
+    summary = service.generate_daily_summary("user1", portfolio, today="2024-01-02")
+
+    alert_service.get_filtered_alerts_for_user.assert_called_once()
+    alert_service.filter_alerts.assert_not_called()
+    price_section, news_section = summary.split("## News Sentiment Alerts")
+    assert "- AAPL fell 5%" in price_section
+    assert "- MSFT news is upbeat" in news_section
+
+
+def test_generate_daily_summaries_fetches_alerts_in_one_query():
+    alerts_by_user = {
+        "user1": [MagicMock(alert_type="price_drop", message="AAPL fell 5%")],
+        "user2": [MagicMock(alert_type="news_sentiment", message="MSFT is upbeat")],
+    }
+    alert_service = MagicMock()
+    alert_service.get_alerts_for_users.return_value = alerts_by_user
+    alert_service.filter_alerts.side_effect = lambda alerts, user_id: alerts
+    alert_service.get_filtered_alerts_for_user.side_effect = (
+        lambda user_id, **kwargs: alerts_by_user[user_id]
+    )
+    monitoring_service = MagicMock()
+    monitoring_service.generate_earnings_summary.return_value = "No earnings.\n"
+    service = SummaryService(alert_service, monitoring_service)
+    holdings = [StockHolding("AAPL", 10, 90.0, date(2023, 1, 1))]
+    portfolios = {
+        "user1": Portfolio(user_id="user1", name="One", holdings=holdings),
+        "user2": Portfolio(user_id="user2", name="Two", holdings=holdings),
+        "user3": Portfolio(user_id="user3", name="Empty"),
+    }
+
+    summaries = service.generate_daily_summaries(portfolios, today="2024-01-02")
+
+    alert_service.get_alerts_for_users.assert_called_once()
+    assert alert_service.get_alerts_for_users.call_args.args == (["user1", "user2"],)
+    assert summaries == {
+        user_id: service.generate_daily_summary(user_id, p, today="2024-01-02")
+        for user_id, p in portfolios.items()
+    }
+    assert "- MSFT is upbeat" in summaries["user2"]
+
+
+@patch("investor_intelligence.services.summary_service.fetch_daily_series")
+@patch("investor_intelligence.services.summary_service.get_batch_quotes")
+def test_generate_weekly_summary_empty_portfolio_skips_fetches(
+    mock_get_batch_quotes, mock_fetch_daily_series
+):
+    alert_service = MagicMock()
+    alert_service.get_filtered_alerts_for_user.return_value = []
+    service = SummaryService(alert_service, MagicMock())
+
+    summary = service.generate_weekly_summary(
+        "user1", Portfolio(user_id="user1", name="Empty")
+    )
+
+    assert "No holdings in portfolio." in summary
+    mock_get_batch_quotes.assert_not_called()
+    mock_fetch_daily_series.assert_not_called()
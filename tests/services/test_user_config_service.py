@@ -0,0 +1,120 @@
+import threading
+
+import pytest
+
+from investor_intelligence.services.user_config_service import UserConfigService
+
+
+@pytest.fixture
+def user_config_service(tmp_path, monkeypatch):
+    db_file = str(tmp_path / "user_configs.db")
+    monkeypatch.setattr(UserConfigService, "DB_FILE", property(lambda self: db_file))
+    return UserConfigService()
+
+
+def test_save_and_get_user_config(user_config_service):
+    user_config_service.save_user_config("user1", {"alert_frequency": "daily"})
+    user_config_service.save_user_config("user1", {"risk_profile": "high"}, "p1")
+
+    assert user_config_service.get_user_config("user1") == {
+        "alert_frequency": "daily",
+        "risk_profile": "moderate",
+    }
+    assert user_config_service.get_user_config("user1", "p1") == {
+        "risk_profile": "high"
+    }
+    assert user_config_service.get_user_config("user2") == {}
+
+
+def test_instances_share_one_wal_connection(user_config_service):
+    other = UserConfigService()
+
+    assert other._conn is user_config_service._conn
+    mode = user_config_service._conn.execute("PRAGMA journal_mode").fetchone()[0]
+    assert mode == "wal"
+
+
+def test_save_user_config_replaces_global_config(user_config_service):
+    user_config_service.save_user_config("user1", {"alert_frequency": "daily"})
+    user_config_service.save_user_config("user1", {"alert_frequency": "weekly"})
+
+    assert user_config_service.get_user_config("user1")["alert_frequency"] == "weekly"
+    count = user_config_service._conn.execute(
+        "SELECT COUNT(*) FROM user_configs WHERE user_id = 'user1'"
+    ).fetchone()[0]
+    assert count == 1
+
+
+def test_null_portfolio_ids_are_migrated(user_config_service):
+    conn = user_config_service._conn
+    conn.execute("INSERT INTO user_configs VALUES ('user1', NULL, '{\"v\": 1}')")
+    conn.execute("INSERT INTO user_configs VALUES ('user1', NULL, '{\"v\": 2}')")
+
+    migrated = UserConfigService()
+
+    assert migrated.get_user_config("user1") == {"v": 2}
+    assert conn.execute(
+        "SELECT COUNT(*) FROM user_configs WHERE portfolio_id IS NULL"
+    ).fetchone() == (0,)
+
+
+def test_save_user_configs_bulk(user_config_service):
+    user_config_service.save_user_configs(
+        [
+            ("user1", None, {"alert_frequency": "daily"}),
+            ("user1", "p1", {"risk_profile": "high"}),
+            ("user2", None, {"preferred_news_sources": ["Reuters"]}),
+        ]
+    )
+
+    assert user_config_service.get_user_config("user1") == {
+        "alert_frequency": "daily",
+        "risk_profile": "moderate",
+    }
+    assert user_config_service.get_user_config("user1", "p1")["risk_profile"] == "high"
+    assert user_config_service.get_user_config("user2")["preferred_news_sources"] == [
+        "Reuters"
+    ]
+
+
+def test_single_save_waits_for_bulk_transaction(user_config_service):
+    in_transaction = threading.Event()
+    single_started = threading.Event()
+    bulk_errors = []
+    conn = user_config_service._conn
+
+    class PausingConnection:
+        # Holds the bulk save open mid-transaction, then makes it fail
+        def __getattr__(self, name):
+            return getattr(conn, name)
+
+        def executemany(self, sql, rows):
+            in_transaction.set()
+            single_started.wait()
+            single.join(timeout=0.2)
+            raise ValueError("bulk save failed")
+
+    user_config_service._conn = PausingConnection()
+    single = threading.Thread(
+        target=lambda: UserConfigService().save_user_config("user1", {"n": 1})
+    )
+
+    def save_bulk():
+        try:
+            user_config_service.save_user_configs([("user2", None, {"n": 2})])
+        except ValueError as e:
+            bulk_errors.append(e)
+
+    bulk = threading.Thread(target=save_bulk)
+    bulk.start()
+    in_transaction.wait()
+    single.start()
+    single_started.set()
+    bulk.join()
+    single.join()
+
+    # The single save ran after the rollback instead of being undone by it
+    user_config_service._conn = conn
+    assert len(bulk_errors) == 1
+    assert user_config_service.get_user_config("user1")["n"] == 1
+    assert user_config_service.get_user_config("user2") == {}
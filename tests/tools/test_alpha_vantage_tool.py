@@ -1,66 +1,99 @@
+import orjson
 import pytest
-from unittest.mock import patch, MagicMock
+from io import BytesIO
+from datetime import datetime
+from unittest.mock import patch, MagicMock, AsyncMock
+from investor_intelligence.tools import alpha_vantage_tool
 from investor_intelligence.tools.alpha_vantage_tool import (
     get_historical_data,
     get_intraday_data,
     get_quote_endpoint,
+    fetch_daily_series,
+    get_batch_quotes,
 )
-from alpha_vantage.timeseries import TimeSeries
 
 
-# Mock the TimeSeries class from alpha_vantage.timeseries
-@patch("investor_intelligence.tools.alpha_vantage_tool.ts")
-def test_get_historical_data(mock_ts):
-    mock_ts_instance = mock_ts
-
-    # Configure the mock to return sample data
-    mock_ts_instance.get_daily.return_value = (
-        {"2023-01-01": {"4. close": "150.00"}},
-        {},
+@pytest.fixture(autouse=True)
+def clear_alpha_vantage_memos():
+    # The in-process memos outlive a test; clear them so results don't depend
+    # on which tests ran before
+    memos = (
+        alpha_vantage_tool._get_historical_data_for_day,
+        alpha_vantage_tool._get_quote_for_window,
+        alpha_vantage_tool._get_earnings_calendar_for_session,
     )
+    for memo in memos:
+        memo.cache_clear()
+    yield
+    for memo in memos:
+        memo.cache_clear()
 
-    symbol = "TEST"
-    data = get_historical_data(symbol)
 
-    # Check that get_daily was called with the correct arguments
-    mock_ts_instance.get_daily.assert_called_once_with(
-        symbol=symbol, outputsize="compact"
-    )
-    assert data == {"2023-01-01": {"4. close": "150.00"}}
+@pytest.fixture
+def mock_api_call():
+    with patch("investor_intelligence.tools.alpha_vantage_tool._make_api_call") as mock:
+        yield mock
 
 
-@patch("investor_intelligence.tools.alpha_vantage_tool.TimeSeries")
-def test_get_intraday_data(mock_timeseries):
-    mock_ts_instance = MagicMock()
-    mock_timeseries.return_value = mock_ts_instance
+def _json_response(payload):
+    response = MagicMock()
+    response.content = orjson.dumps(payload)
+    return response
 
-    mock_ts_instance.get_intraday.return_value = (
-        {"2023-01-01 10:00:00": {"4. close": "150.50"}},
-        {},
-    )
+
+@pytest.mark.parametrize(
+    "fetch, series_key, url_parts, series, read_only",
+    [
+        (
+            lambda symbol: get_historical_data(symbol),
+            "Time Series (Daily)",
+            ["function=TIME_SERIES_DAILY"],
+            {"2023-01-01": {"4. close": "150.00"}},
+            True,
+        ),
+        (
+            lambda symbol: get_intraday_data(symbol, interval="5min"),
+            "Time Series (5min)",
+            ["function=TIME_SERIES_INTRADAY", "interval=5min"],
+            {"2023-01-01 10:00:00": {"4. close": "150.50"}},
+            False,
+        ),
+    ],
+    ids=["daily", "intraday"],
+)
+def test_get_series_data(
+    mock_api_call, fetch, series_key, url_parts, series, read_only
+):
+    mock_api_call.return_value = _json_response({series_key: series})
 
     symbol = "TEST"
-    interval = "5min"
-    data = get_intraday_data(symbol, interval=interval)
+    data = fetch(symbol)
+    # Served from the in-process memo (daily) or disk cache (intraday) next time
+    assert fetch(symbol) == data
 
-    # Check that TimeSeries was called with the correct arguments
-    mock_timeseries.assert_called_once()
-    call_args = mock_timeseries.call_args
-    assert call_args is not None
-    assert "key" in call_args.kwargs
-    assert call_args.kwargs["output_format"] == "json"
+    mock_api_call.assert_called_once()
+    url = mock_api_call.call_args[0][0]
+    for part in url_parts + [f"symbol={symbol}", "outputsize=compact"]:
+        assert part in url
+    assert data == series
+
+    if read_only:
+        # The memoized daily series is shared, so it must not be mutable
+        with pytest.raises(TypeError):
+            data[next(iter(data))]["4. close"] = "0.00"
 
-    mock_ts_instance.get_intraday.assert_called_once_with(
-        symbol=symbol, interval=interval, outputsize="compact"
-    )
-    assert data == {"2023-01-01 10:00:00": {"4. close": "150.50"}}
+
+def test_get_historical_data_raises_api_errors(mock_api_call):
+    mock_api_call.return_value = _json_response({"Error Message": "Invalid API call"})
+
+    with pytest.raises(ValueError, match="Invalid API call"):
+        get_historical_data("BAD", interval="1wk")
 
 
-@patch("investor_intelligence.tools.alpha_vantage_tool._make_api_call")
 def test_get_quote_endpoint(mock_api_call):
     # Mock the HTTP response
     mock_response = MagicMock()
-    mock_response.json.return_value = {"Global Quote": {"05. price": "151.00"}}
+    mock_response.content = orjson.dumps({"Global Quote": {"05. price": "151.00"}})
     mock_api_call.return_value = mock_response
 
     symbol = "TEST"
@@ -74,3 +107,250 @@ def test_get_quote_endpoint(mock_api_call):
     assert f"symbol={symbol}" in call_args[0][0]  # URL should contain the symbol
 
     assert data == {"05. price": "151.00"}
+
+
+@patch("investor_intelligence.tools.alpha_vantage_tool.time.time")
+@patch("investor_intelligence.tools.alpha_vantage_tool._fetch_quote")
+def test_get_quote_endpoint_expires_in_process(mock_fetch_quote, mock_time):
+    mock_fetch_quote.return_value = {"05. price": "151.00"}
+
+    mock_time.return_value = 10 * alpha_vantage_tool.QUOTE_CACHE_TTL
+    get_quote_endpoint("AAPL")
+    mock_time.return_value += alpha_vantage_tool.QUOTE_CACHE_TTL - 1
+    get_quote_endpoint("AAPL")
+    assert mock_fetch_quote.call_count == 1
+
+    # The next window looks the quote up again
+    mock_time.return_value += 1
+    get_quote_endpoint("AAPL")
+    assert mock_fetch_quote.call_count == 2
+
+
+@patch("investor_intelligence.tools.alpha_vantage_tool.httpx.AsyncClient")
+def test_fetch_daily_series(mock_async_client):
+    def respond(url):
+        if "symbol=AAPL" in url:
+            return _json_response(
+                {"Time Series (Daily)": {"2023-01-01": {"4. close": "1.00"}}}
+            )
+        return _json_response({"Error Message": "Invalid API call"})
+
+    client = mock_async_client.return_value.__aenter__.return_value
+    client.get = AsyncMock(side_effect=respond)
+
+    data = fetch_daily_series(["AAPL", "GE", "AAPL"])
+
+    assert data == {"AAPL": {"2023-01-01": {"4. close": "1.00"}}, "GE": None}
+    assert client.get.await_count == 2  # Duplicate symbols fetched once
+    assert mock_async_client.call_args.kwargs["http2"] is True
+    mock_async_client.return_value.__aexit__.assert_awaited_once()
+
+
+def test_get_batch_quotes(mock_api_call):
+    mock_response = MagicMock()
+    mock_response.content = orjson.dumps(
+        {
+            "Stock Quotes": [
+                {"1. symbol": "AAPL", "2. price": "151.00"},
+                {"1. symbol": "MSFT", "2. price": "301.50"},
+            ]
+        }
+    )
+    mock_api_call.return_value = mock_response
+
+    prices = get_batch_quotes(["AAPL", "MSFT"])
+
+    mock_api_call.assert_called_once()
+    assert "function=BATCH_STOCK_QUOTES" in mock_api_call.call_args[0][0]
+    assert "symbols=AAPL,MSFT" in mock_api_call.call_args[0][0]
+    assert prices == {"AAPL": 151.0, "MSFT": 301.5}
+
+
+def test_get_batch_quotes_keys_by_requested_symbol(mock_api_call):
+    mock_api_call.return_value.content = orjson.dumps(
+        {"Stock Quotes": [{"1. symbol": "AAPL", "2. price": "151.00"}]}
+    )
+
+    assert get_batch_quotes(["aapl", "MSFT"]) == {"aapl": 151.0}
+
+
+@patch("investor_intelligence.tools.alpha_vantage_tool.get_quotes")
+def test_get_batch_quotes_falls_back_per_symbol(mock_get_quotes, mock_api_call):
+    mock_response = MagicMock()
+    mock_response.content = orjson.dumps({"Information": "Endpoint not available"})
+    mock_api_call.return_value = mock_response
+    mock_get_quotes.return_value = {"AAPL": {"05. price": "151.00"}}
+
+    assert get_batch_quotes(["AAPL", "MSFT"]) == {"AAPL": 151.0}
+    mock_get_quotes.assert_called_once_with(["AAPL", "MSFT"])
+
+
+@patch("investor_intelligence.tools.alpha_vantage_tool.get_quotes")
+def test_get_batch_quotes_requests_unreadable_prices_per_symbol(
+    mock_get_quotes, mock_api_call
+):
+    mock_api_call.return_value.content = orjson.dumps(
+        {
+            "Stock Quotes": [
+                {"1. symbol": "AAPL", "2. price": "151.00"},
+                {"1. symbol": "MSFT", "2. price": "N/A"},
+            ]
+        }
+    )
+    mock_get_quotes.return_value = {"MSFT": {"05. price": "301.50"}}
+
+    assert get_batch_quotes(["AAPL", "MSFT"]) == {"AAPL": 151.0, "MSFT": 301.5}
+    mock_get_quotes.assert_called_once_with(["MSFT"])
+
+
+@patch("investor_intelligence.tools.alpha_vantage_tool.httpx.AsyncClient")
+def test_get_quotes(mock_async_client):
+    def respond(url):
+        response = MagicMock()
+        if "symbol=AAPL" in url:
+            response.content = orjson.dumps({"Global Quote": {"05. price": "151.00"}})
+        else:
+            response.content = orjson.dumps({"Error Message": "Invalid API call"})
+        return response
+
+    client = mock_async_client.return_value.__aenter__.return_value
+    client.get = AsyncMock(side_effect=respond)
+
+    assert alpha_vantage_tool.get_quotes(["AAPL", "BAD", "AAPL"]) == {
+        "AAPL": {"05. price": "151.00"}
+    }
+    assert client.get.await_count == 2
+
+    # AAPL is now served from the on-disk cache
+    alpha_vantage_tool.get_quotes(["AAPL"])
+    assert client.get.await_count == 2
+
+
+def test_get_quote_endpoint_served_from_disk_cache(mock_api_call):
+    mock_response = mock_api_call.return_value
+    mock_response.content = orjson.dumps({"Global Quote": {"05. price": "150.00"}})
+
+    assert get_quote_endpoint("AAPL") == {"05. price": "150.00"}
+
+    # A fresh process (empty lru_cache) reads the quote back from disk
+    alpha_vantage_tool._get_quote_for_window.cache_clear()
+    assert get_quote_endpoint("AAPL") == {"05. price": "150.00"}
+    mock_api_call.assert_called_once()
+
+
+@patch("investor_intelligence.tools.alpha_vantage_tool._SESSION")
+def test_make_api_call_uses_shared_session(mock_session):
+    response = alpha_vantage_tool._make_api_call("https://example.com/query")
+
+    mock_session.get.assert_called_once_with(
+        "https://example.com/query",
+        timeout=alpha_vantage_tool.REQUEST_TIMEOUT,
+        stream=False,
+    )
+    assert response is mock_session.get.return_value
+    response.raise_for_status.assert_called_once()
+
+
+def test_shared_session_retries_rate_limits():
+    adapter = alpha_vantage_tool._SESSION.get_adapter(alpha_vantage_tool.BASE_URL)
+    assert 429 in adapter.max_retries.status_forcelist
+    assert adapter.max_retries.total == 5
+    assert adapter.max_retries.backoff_jitter == alpha_vantage_tool.RETRY_JITTER
+    assert alpha_vantage_tool._SESSION.headers["Accept-Encoding"] == "gzip, deflate"
+
+
+@patch("investor_intelligence.tools.alpha_vantage_tool.random.uniform")
+def test_retry_after_is_honored_with_jitter(mock_uniform):
+    mock_uniform.return_value = 2.0
+    retry = alpha_vantage_tool._SESSION.get_adapter(
+        alpha_vantage_tool.BASE_URL
+    ).max_retries
+    response = MagicMock()
+    response.headers.get.return_value = "10"
+
+    assert retry.get_retry_after(response) == 12.0
+    mock_uniform.assert_called_once_with(0, 10 * alpha_vantage_tool.RETRY_JITTER)
+
+
+@patch("investor_intelligence.tools.alpha_vantage_tool.get_historical_data")
+def test_get_time_series_data_delegates_to_get_historical_data(mock_get_historical):
+    mock_get_historical.return_value = {
+        "2023-01-08": {"4. close": "612345.67", "5. volume": "1200"},
+        "2023-01-01": {"4. close": "150.00", "5. volume": "1000"},
+    }
+
+    frame = alpha_vantage_tool.get_time_series_data("TEST", interval="weekly")
+    mock_get_historical.assert_called_once_with("TEST", "1wk", "compact")
+    assert list(frame.index.strftime("%Y-%m-%d")) == ["2023-01-01", "2023-01-08"]
+    assert frame["4. close"].dtype == "float64"
+    # High share prices keep their cents
+    assert frame["4. close"].tolist() == [150.0, 612345.67]
+    assert frame["5. volume"].tolist() == [1000, 1200]
+
+    mock_get_historical.side_effect = ValueError("Invalid API call")
+    assert alpha_vantage_tool.get_time_series_data("TEST") is None
+
+
+@pytest.mark.parametrize(
+    "now, expected",
+    [
+        (datetime(2024, 1, 3, 15, 59), "2024-01-02"),  # Wednesday before the close
+        (datetime(2024, 1, 3, 16, 0), "2024-01-03"),  # Wednesday at the close
+        (datetime(2024, 1, 6, 12, 0), "2024-01-05"),  # Saturday
+        (datetime(2024, 1, 8, 9, 30), "2024-01-05"),  # Monday morning
+    ],
+)
+def test_last_market_close(now, expected):
+    with patch("investor_intelligence.tools.alpha_vantage_tool.datetime") as mock_dt:
+        mock_dt.now.return_value = now.replace(
+            tzinfo=alpha_vantage_tool.MARKET_TIMEZONE
+        )
+        assert alpha_vantage_tool._last_market_close() == expected
+
+
+def test_get_earnings_calendar(mock_api_call):
+    response = mock_api_call.return_value.__enter__.return_value
+    response.raw = BytesIO(
+        b"symbol,name,reportDate,fiscalDateEnding,estimate,currency\r\n"
+        b"AAPL,Apple Inc,2024-01-25,2023-12-31,2.10,USD\r\n"
+        b"GE,General Electric,2024-01-23,2023-12-31,,USD\r\n"
+    )
+
+    calendar = alpha_vantage_tool.get_earnings_calendar(horizon="3month")
+
+    assert mock_api_call.call_args.kwargs == {"stream": True}
+    assert list(calendar) == [
+        {
+            "symbol": "AAPL",
+            "name": "Apple Inc",
+            "reportDate": "2024-01-25",
+            "fiscalDateEnding": "2023-12-31",
+            "estimate": "2.10",
+            "currency": "USD",
+        },
+        {
+            "symbol": "GE",
+            "name": "General Electric",
+            "reportDate": "2024-01-23",
+            "fiscalDateEnding": "2023-12-31",
+            "estimate": "",
+            "currency": "USD",
+        },
+    ]
+    # The memoized calendar is shared, so callers can't change it
+    assert isinstance(calendar, tuple)
+    with pytest.raises(TypeError):
+        calendar[0]["reportDate"] = "2024-02-01"
+
+
+def test_intern_fields_shares_repeated_values():
+    rows = [
+        {"symbol": "AAPL", "currency": "".join(["US", "D"])},
+        {"symbol": "MSFT", "currency": "".join(["U", "SD"])},
+    ]
+    assert rows[0]["currency"] is not rows[1]["currency"]
+
+    alpha_vantage_tool._intern_fields(rows, ("symbol", "currency"))
+
+    assert rows[0]["currency"] is rows[1]["currency"]
+    assert [row["symbol"] for row in rows] == ["AAPL", "MSFT"]
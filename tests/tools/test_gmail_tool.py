@@ -0,0 +1,181 @@
+import base64
+from email.mime.text import MIMEText
+from unittest.mock import patch, MagicMock
+
+from investor_intelligence.tools import gmail_tool
+
+
+def _message(msg_id, subject, body):
+    return {
+        "id": msg_id,
+        "snippet": body[:10],
+        "payload": {
+            "headers": [
+                {"name": "Subject", "value": subject},
+                {"name": "From", "value": "user@example.com"},
+            ],
+            "body": {"data": base64.urlsafe_b64encode(body.encode()).decode()},
+        },
+    }
+
+
+def _fake_batch_service(messages):
+    """A Gmail service mock whose batch requests answer from the messages dict."""
+    service = MagicMock()
+    batches = []
+
+    def new_batch_http_request(callback):
+        added = []
+        batch = MagicMock()
+        batch.add.side_effect = lambda request, request_id: added.append(request_id)
+
+        def execute():
+            for request_id in added:
+                if request_id in messages:
+                    callback(request_id, messages[request_id], None)
+                else:
+                    callback(request_id, None, Exception("Not Found"))
+
+        batch.execute.side_effect = execute
+        batches.append(added)
+        return batch
+
+    service.new_batch_http_request.side_effect = new_batch_http_request
+    return service, batches
+
+
+@patch("investor_intelligence.tools.gmail_tool.GMAIL_BATCH_SIZE", 2)
+@patch("investor_intelligence.tools.gmail_tool.get_gmail_service")
+def test_get_unread_emails_fetches_in_batches(mock_get_service):
+    service, batches = _fake_batch_service(
+        {
+            "m1": _message("m1", "AAPL price?", "What is AAPL at?"),
+            "m3": _message("m3", "Earnings", "When does MSFT report?"),
+        }
+    )
+    mock_get_service.return_value = service
+    messages_api = service.users.return_value.messages.return_value
+    messages_api.list.return_value.execute.return_value = {
+        "messages": [{"id": "m1"}, {"id": "m2"}, {"id": "m3"}]
+    }
+
+    emails = gmail_tool.get_unread_emails("is:unread")
+
+    assert batches == [["m1", "m2"], ["m3"]]
+    assert [email["id"] for email in emails] == ["m1", "m3"]
+    assert emails[0]["subject"] == "AAPL price?"
+    assert emails[0]["body"] == "What is AAPL at?"
+    # Only the messages that were fetched are marked as read, in one call
+    messages_api.batchModify.assert_called_once_with(
+        userId="me", body={"ids": ["m1", "m3"], "removeLabelIds": ["UNREAD"]}
+    )
+
+
+@patch("investor_intelligence.tools.gmail_tool.get_gmail_service")
+def test_get_unread_emails_fetches_bodies_only_when_needed(mock_get_service):
+    full = {
+        "m1": _message("m1", "AAPL price?", "What is AAPL at?"),
+        "m2": _message("m2", "Newsletter", "Big attachment inside"),
+    }
+    metadata = {
+        msg_id: {**msg, "payload": {"headers": msg["payload"]["headers"]}}
+        for msg_id, msg in full.items()
+    }
+    service, batches = _fake_batch_service(full)
+    mock_get_service.return_value = service
+    messages_api = service.users.return_value.messages.return_value
+    messages_api.list.return_value.execute.return_value = {
+        "messages": [{"id": "m1"}, {"id": "m2"}]
+    }
+    # The first batch answers with metadata, the second with full messages
+    responses = iter([metadata, full])
+    new_batch = service.new_batch_http_request.side_effect
+
+    def new_batch_http_request(callback):
+        source = next(responses)
+        return new_batch(
+            lambda request_id, response, exception: callback(
+                request_id, source[request_id], exception
+            )
+        )
+
+    service.new_batch_http_request.side_effect = new_batch_http_request
+
+    emails = gmail_tool.get_unread_emails(
+        body_filter=lambda email: "price" in email["subject"]
+    )
+
+    assert batches == [["m1", "m2"], ["m1"]]
+    assert messages_api.get.call_args_list[0].kwargs["format"] == "metadata"
+    assert messages_api.get.call_args_list[-1].kwargs["format"] == "full"
+    assert [(email["id"], email["body"]) for email in emails] == [
+        ("m1", "What is AAPL at?"),
+        ("m2", ""),
+    ]
+
+
+def _mime_text_raw(sender, to, subject, message_text):
+    message = MIMEText(message_text)
+    message["to"] = to
+    message["from"] = sender
+    message["subject"] = subject
+    return base64.urlsafe_b64encode(message.as_bytes()).decode()
+
+
+def test_parse_email_finds_nested_plain_text_part():
+    def part(mime_type, text):
+        data = base64.urlsafe_b64encode(text.encode()).decode()
+        return {"mimeType": mime_type, "body": {"data": data}}
+
+    message = _message("m1", "Nested", "")
+    del message["payload"]["body"]
+    message["payload"]["parts"] = [
+        {
+            "mimeType": "multipart/alternative",
+            "parts": [
+                part("text/html", "<b>x</b>"),
+                part("text/plain", "Earnings beat"),
+            ],
+        },
+        part("text/plain", "later"),
+    ]
+
+    assert gmail_tool._parse_email(message)["body"] == "Earnings beat"
+
+
+def test_create_message_matches_mime_text():
+    cases = [
+        ("me", "user@example.com", "Daily Summary", "Line one\nLine two\n"),
+        ("me", "user@example.com", "Résumé", "Non-ASCII subject"),
+        ("me", "user@example.com", "Prices", "AAPL \u2191 2%"),
+        ("me", "user@example.com", "Windows", "Line one\r\nLine two"),
+        ("me", "user@example.com", "Long " * 30, "Folded subject"),
+    ]
+    for sender, to, subject, text in cases:
+        assert gmail_tool.create_message(sender, to, subject, text) == {
+            "raw": _mime_text_raw(sender, to, subject, text)
+        }
+
+
+def test_message_factory_matches_create_message():
+    cases = [
+        ("user@example.com", "Daily Summary", "Line one\nLine two\n"),
+        ("user@example.com", "Résumé", "Non-ASCII subject"),
+        ("user@example.com", "Prices {AAPL}", "AAPL \u2191 2%"),
+    ]
+    for sender in ("me", "{ops}@example.com", "Équipe <me@example.com>"):
+        create = gmail_tool.make_message_factory(sender)
+        for to, subject, text in cases:
+            assert create(to, subject, text) == gmail_tool.create_message(
+                sender, to, subject, text
+            )
+
+
+@patch("investor_intelligence.tools.gmail_tool.BODY_DECODE_CHUNK", 8)
+@patch("investor_intelligence.tools.gmail_tool.MAX_INLINE_BODY_CHARS", 8)
+def test_decode_body_in_chunks_handles_split_characters():
+    # Multi-byte characters straddle the 6-byte chunk boundaries
+    text = "Prix: 12€ — café ✓ " * 5
+    data = base64.urlsafe_b64encode(text.encode("utf-8")).decode()
+
+    assert gmail_tool._decode_body(data) == text
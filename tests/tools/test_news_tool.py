@@ -0,0 +1,97 @@
+import asyncio
+import pytest
+import requests
+from unittest.mock import AsyncMock, patch, MagicMock
+
+from investor_intelligence.tools import news_tool
+
+
+@pytest.fixture(autouse=True)
+def clear_news_cache():
+    news_tool._get_news_articles_for_window.cache_clear()
+    yield
+    news_tool._get_news_articles_for_window.cache_clear()
+
+
+@patch("investor_intelligence.tools.news_tool.time.time")
+@patch("investor_intelligence.tools.news_tool._SESSION.get")
+@patch("investor_intelligence.tools.news_tool.NEWS_API_KEY", "test_key")
+def test_get_recent_news_articles_reuses_results_within_window(mock_get, mock_time):
+    mock_response = MagicMock()
+    mock_response.content = b'{"articles": [{"title": "AAPL beats"}]}'
+    mock_get.return_value = mock_response
+
+    mock_time.return_value = 3600 * 10 + 5
+    first = news_tool.get_recent_news_articles("AAPL", page_size=3)
+    mock_time.return_value = 3600 * 10 + 200
+    second = news_tool.get_recent_news_articles("AAPL", page_size=3)
+
+    assert first == second == [{"title": "AAPL beats"}]
+    mock_get.assert_called_once()
+    assert mock_get.call_args.kwargs["params"]["pageSize"] == 3
+
+    # Shares entries with get_news_articles' default date range
+    assert news_tool.get_news_articles("AAPL", page_size=3) == first
+    mock_get.assert_called_once()
+
+
+@patch(
+    "investor_intelligence.tools.news_tool.get_news_articles_batch",
+    new_callable=AsyncMock,
+)
+@patch("investor_intelligence.tools.news_tool.NEWS_API_KEY", "test_key")
+def test_get_news_articles_many_keeps_query_order(mock_batch):
+    mock_batch.side_effect = lambda queries, **kwargs: [
+        [{"title": f"{query} {kwargs['page_size']}"}] if query != "GOOG" else None
+        for query in queries
+    ]
+
+    results = news_tool.get_news_articles_many(["AAPL", "MSFT", "GOOG"], page_size=2)
+
+    assert results == [[{"title": "AAPL 2"}], [{"title": "MSFT 2"}], []]
+    mock_batch.assert_awaited_once()
+    assert mock_batch.call_args.args == (["AAPL", "MSFT", "GOOG"],)
+
+    # Cached queries are served from disk; only the failed one is requested again
+    news_tool.get_news_articles_many(["MSFT", "GOOG"], page_size=2)
+    assert mock_batch.call_args.args == (["GOOG"],)
+    assert news_tool.get_news_articles_many([]) == []
+
+
+@patch("investor_intelligence.tools.news_tool.NEWS_API_KEY", "test_key")
+def test_get_news_articles_batch_uses_http2_client():
+    with patch("investor_intelligence.tools.news_tool.httpx.AsyncClient") as client_cls:
+        client = client_cls.return_value.__aenter__.return_value
+        client.get = AsyncMock(return_value=MagicMock())
+        client.get.return_value.content = b'{"articles": [{"title": "x"}]}'
+
+        results = asyncio.run(news_tool.get_news_articles_batch(["AAPL"], page_size=1))
+
+    assert results == [[{"title": "x"}]]
+    assert client_cls.call_args.kwargs["http2"] is True
+    assert client.get.call_args.kwargs["params"]["pageSize"] == 1
+
+
+@patch("investor_intelligence.tools.news_tool._SESSION.get")
+@patch("investor_intelligence.tools.news_tool.NEWS_API_KEY", "test_key")
+def test_get_news_articles_served_from_disk_cache(mock_get):
+    mock_get.return_value.content = b'{"articles": [{"title": "MSFT beats"}]}'
+
+    assert news_tool.get_news_articles("MSFT") == [{"title": "MSFT beats"}]
+    # A new process (empty in-process memo) reuses the on-disk entry
+    news_tool._get_news_articles_for_window.cache_clear()
+    assert news_tool.get_news_articles("MSFT") == [{"title": "MSFT beats"}]
+    mock_get.assert_called_once()
+
+
+@patch("investor_intelligence.tools.news_tool._SESSION.get")
+@patch("investor_intelligence.tools.news_tool.NEWS_API_KEY", "test_key")
+def test_get_news_articles_does_not_reuse_empty_results(mock_get):
+    mock_get.side_effect = requests.exceptions.ConnectionError("down")
+    assert news_tool.get_news_articles("TSLA") == []
+
+    # The failure isn't memoized: the next call in the same window retries
+    mock_get.side_effect = None
+    mock_get.return_value.content = b'{"articles": [{"title": "TSLA news"}]}'
+    assert news_tool.get_news_articles("TSLA") == [{"title": "TSLA news"}]
+    assert mock_get.call_count == 2
@@ -1,25 +1,32 @@
 import pytest
-from unittest.mock import patch, MagicMock, mock_open
+from unittest.mock import patch, MagicMock
 from investor_intelligence.tools import sheets_tool
 import os
 
 
+@pytest.fixture(autouse=True)
+def reset_sheets_service(monkeypatch):
+    monkeypatch.setattr(sheets_tool, "_SHEETS_SERVICE", None)
+    sheets_tool.clear_spreadsheet_cache()
+
+
+@pytest.fixture
+def mock_values_get():
+    """Stubs the Sheets service; returns the mock for spreadsheets().values().get."""
+    with patch("investor_intelligence.tools.sheets_tool.get_sheets_service") as service:
+        yield service.return_value.spreadsheets.return_value.values.return_value.get
+
+
 # Mock the build function from googleapiclient.discovery
-@patch("builtins.open", new_callable=mock_open)
 @patch("investor_intelligence.tools.sheets_tool.build")
 # Mock the InstalledAppFlow from google_auth_oauthlib.flow
 @patch("investor_intelligence.tools.sheets_tool.InstalledAppFlow")
-# Mock os.path.exists to control token.pickle presence
-@patch("investor_intelligence.tools.sheets_tool.os.path.exists")
-# Mock pickle.load and pickle.dump
-@patch("investor_intelligence.tools.sheets_tool.pickle")
+# Mock the token store: no token has been saved yet
+@patch("investor_intelligence.tools.sheets_tool.save_credentials")
+@patch("investor_intelligence.tools.sheets_tool.load_credentials", return_value=None)
 def test_get_sheets_service_new_auth(
-    mock_pickle, mock_exists, mock_flow, mock_build, mock_file
+    mock_load_credentials, mock_save_credentials, mock_flow, mock_build
 ):
-    mock_exists.side_effect = (
-        lambda path: print(f"os.path.exists called with: {path}") or False
-    )
-    mock_pickle.load.side_effect = Exception("No valid creds")
     mock_creds = MagicMock()
     mock_flow.from_client_secrets_file.return_value.run_local_server.return_value = (
         mock_creds
@@ -46,18 +53,20 @@ def test_get_sheets_service_new_auth(
     }
     assert set(actual_scopes) == expected_scopes
     assert actual_args[0] == credentials_path
-    mock_build.assert_called_once_with("sheets", "v4", credentials=mock_creds)
-    mock_pickle.dump.assert_called_once_with(mock_creds, mock_file.return_value)
+    mock_build.assert_called_once_with(
+        "sheets", "v4", credentials=mock_creds, model=sheets_tool.JSON_MODEL
+    )
+    mock_save_credentials.assert_called_once_with(mock_creds)
     assert service is not None
 
+    # Later calls reuse the service instead of authenticating again
+    assert sheets_tool.get_sheets_service() is service
+    mock_build.assert_called_once()
 
-@patch("investor_intelligence.tools.sheets_tool.get_sheets_service")
-def test_read_spreadsheet_data(mock_get_sheets_service):
-    mock_service = MagicMock()
-    mock_get_sheets_service.return_value = mock_service
 
+def test_read_spreadsheet_data(mock_values_get):
     # Configure the mock service to return sample data
-    mock_service.spreadsheets.return_value.values.return_value.get.return_value.execute.return_value = {
+    mock_values_get.return_value.execute.return_value = {
         "values": [["Header1", "Header2"], ["Data1", "Data2"]]
     }
 
@@ -66,24 +75,77 @@ def test_read_spreadsheet_data(mock_get_sheets_service):
 
     data = sheets_tool.read_spreadsheet_data(spreadsheet_id, range_name)
 
-    mock_service.spreadsheets.return_value.values.return_value.get.assert_called_once_with(
+    mock_values_get.assert_called_once_with(
         spreadsheetId=spreadsheet_id, range=range_name
     )
+    mock_values_get.return_value.execute.assert_called_once_with(
+        num_retries=sheets_tool.GOOGLE_API_RETRIES
+    )
     assert data == [["Header1", "Header2"], ["Data1", "Data2"]]
 
 
-@patch("investor_intelligence.tools.sheets_tool.get_sheets_service")
-def test_read_spreadsheet_data_no_values(mock_get_sheets_service):
-    mock_service = MagicMock()
-    mock_get_sheets_service.return_value = mock_service
-
+def test_read_spreadsheet_data_no_values(mock_values_get):
     # Configure the mock service to return no values
-    mock_service.spreadsheets.return_value.values.return_value.get.return_value.execute.return_value = (
-        {}
-    )
+    mock_values_get.return_value.execute.return_value = {}
 
     data = sheets_tool.read_spreadsheet_data(
         "16Bi8WR-mn5ggPZsGmu3Yr3XAg_S7LaZqDhdy2D6x35Q", "Sheet1!A1:B2"
     )
 
     assert data == []
+
+
+@patch("investor_intelligence.tools.sheets_tool.time.time")
+def test_read_spreadsheet_data_reuses_recent_reads(mock_time, mock_values_get):
+    get = mock_values_get
+    get.return_value.execute.return_value = {"values": [["AAPL", "10"]]}
+
+    mock_time.return_value = 10 * sheets_tool.SPREADSHEET_CACHE_TTL
+    sheets_tool.read_spreadsheet_data("test_id", "Sheet1!A1:B2")
+    sheets_tool.read_spreadsheet_data("test_id", "Sheet1!A1:B2")
+    assert get.call_count == 1
+
+    sheets_tool.clear_spreadsheet_cache()
+    sheets_tool.read_spreadsheet_data("test_id", "Sheet1!A1:B2")
+    assert get.call_count == 2
+
+    mock_time.return_value += sheets_tool.SPREADSHEET_CACHE_TTL
+    sheets_tool.read_spreadsheet_data("test_id", "Sheet1!A1:B2")
+    assert get.call_count == 3
+
+
+def test_read_spreadsheet_data_as_frame(mock_values_get):
+    get = mock_values_get
+    get.return_value.execute.return_value = {
+        "values": [
+            ["Symbol", "Quantity", "Price"],
+            ["AAPL", "10", "150.5"],
+            ["MSFT", "5"],
+        ]
+    }
+
+    frame = sheets_tool.read_spreadsheet_data("test_id", "Sheet1!A1:C3", as_frame=True)
+
+    assert list(frame.columns) == ["Symbol", "Quantity", "Price"]
+    assert frame["Symbol"].tolist() == ["AAPL", "MSFT"]
+    assert frame["Quantity"].tolist() == [10, 5]
+    assert frame["Price"].iloc[0] == 150.5 and frame["Price"].isna().iloc[1]
+    # The cached rows are shared with plain reads
+    assert sheets_tool.read_spreadsheet_data("test_id", "Sheet1!A1:C3")[1] == [
+        "AAPL",
+        "10",
+        "150.5",
+    ]
+    assert get.call_count == 1
+
+
+def test_read_spreadsheet_data_as_frame_trims_long_rows(mock_values_get):
+    mock_values_get.return_value.execute.return_value = {
+        "values": [["Symbol", "Quantity"], ["AAPL", "10", "note"], ["MSFT"]]
+    }
+
+    frame = sheets_tool.read_spreadsheet_data("test_id", "Sheet1!A1:C3", as_frame=True)
+
+    assert list(frame.columns) == ["Symbol", "Quantity"]
+    assert frame["Symbol"].tolist() == ["AAPL", "MSFT"]
+    assert frame["Quantity"].iloc[0] == 10 and frame["Quantity"].isna().iloc[1]
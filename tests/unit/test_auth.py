@@ -0,0 +1,46 @@
+"""Test the OAuth token store."""
+
+import json
+import pickle
+
+from google.oauth2.credentials import Credentials
+
+from investor_intelligence.utils import auth
+
+SCOPES = ["https://www.googleapis.com/auth/spreadsheets"]
+
+
+def _credentials():
+    return Credentials(
+        token="access",
+        refresh_token="refresh",
+        token_uri="https://oauth2.googleapis.com/token",
+        client_id="client",
+        client_secret="secret",
+        scopes=SCOPES,
+    )
+
+
+def test_credentials_round_trip_through_json(tmp_path, monkeypatch):
+    """Saved credentials are written as JSON and loaded back."""
+    monkeypatch.chdir(tmp_path)
+    assert auth.load_credentials(SCOPES) is None
+
+    auth.save_credentials(_credentials())
+    assert json.loads((tmp_path / auth.TOKEN_FILE).read_text())["refresh_token"] == (
+        "refresh"
+    )
+    assert auth.load_credentials(SCOPES).refresh_token == "refresh"
+
+
+def test_legacy_pickle_token_is_migrated(tmp_path, monkeypatch):
+    """A token.pickle from an earlier version is replaced by token.json."""
+    monkeypatch.chdir(tmp_path)
+    with open(auth.LEGACY_TOKEN_FILE, "wb") as token:
+        pickle.dump(_credentials(), token)
+
+    creds = auth.load_credentials(SCOPES)
+
+    assert creds.refresh_token == "refresh"
+    assert not (tmp_path / auth.LEGACY_TOKEN_FILE).exists()
+    assert (tmp_path / auth.TOKEN_FILE).exists()
@@ -0,0 +1,103 @@
+"""Test the on-disk TTL cache."""
+
+import os
+import time
+import threading
+from unittest.mock import MagicMock, patch
+
+from investor_intelligence.utils.cache import (
+    FileCache,
+    file_cached,
+    singleflight,
+    sweep_cache,
+)
+
+
+def test_file_cache_round_trip_and_expiry():
+    """Entries are served until they are older than the TTL."""
+    cache = FileCache("test")
+    key = FileCache.make_key("AAPL", "1d")
+
+    assert cache.get(key, ttl=60) is None
+    with patch("investor_intelligence.utils.cache.time.time", return_value=1000.0):
+        cache.set(key, {"price": 1.5})
+    with patch("investor_intelligence.utils.cache.time.time", return_value=1059.0):
+        assert cache.get(key, ttl=60) == {"price": 1.5}
+    with patch("investor_intelligence.utils.cache.time.time", return_value=1060.0):
+        assert cache.get(key, ttl=60) is None
+    # The expired entry was deleted
+    assert not os.path.exists(cache._path(key))
+
+
+def test_sweep_cache_removes_old_files():
+    """Files older than max_age are deleted, whatever their namespace."""
+    old, fresh = FileCache("old"), FileCache("fresh")
+    old.set("k", [1])
+    fresh.set("k", [2])
+    os.utime(old._path("k"), (time.time() - 120, time.time() - 120))
+
+    assert sweep_cache(max_age=60) == 1
+    assert not os.path.exists(old._path("k"))
+    assert fresh.get("k", ttl=60) == [2]
+
+
+def test_file_cached_normalizes_arguments_and_skips_empty_results():
+    """Default and keyword arguments share an entry; empty results are not cached."""
+    fetch = MagicMock(side_effect=lambda symbol, interval: {"symbol": symbol})
+
+    @file_cached("quotes", ttl=60)
+    def get_quote(symbol, interval="1d"):
+        return fetch(symbol, interval)
+
+    assert get_quote("AAPL") == {"symbol": "AAPL"}
+    assert get_quote(symbol="AAPL", interval="1d") == {"symbol": "AAPL"}
+    assert fetch.call_count == 1
+
+    fetch.side_effect = None
+    fetch.return_value = None
+    assert get_quote("MSFT") is None
+    assert get_quote("MSFT") is None
+    assert fetch.call_count == 3
+
+
+def test_file_cached_partition_rolls_keys():
+    """A new partition value starts a fresh set of entries."""
+    fetch = MagicMock(return_value=[{"symbol": "AAPL"}])
+    session = ["2024-01-02"]
+
+    @file_cached("calendar", ttl=3600, partition=lambda: session[0])
+    def get_calendar(horizon="3month"):
+        return fetch(horizon)
+
+    get_calendar()
+    get_calendar()
+    assert fetch.call_count == 1
+
+    session[0] = "2024-01-03"
+    get_calendar()
+    assert fetch.call_count == 2
+
+
+def test_singleflight_shares_one_fetch_between_concurrent_callers():
+    """Callers waiting on an in-flight fetch are served from the entry it cached."""
+    calls = []
+
+    @singleflight
+    @file_cached("quotes", ttl=60)
+    def get_quote(symbol):
+        calls.append(symbol)
+        time.sleep(0.05)
+        return {"symbol": symbol}
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(get_quote("AAPL")))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [{"symbol": "AAPL"}] * 5
+    assert calls == ["AAPL"]
@@ -1,5 +1,8 @@
+import os
 import pytest
+from unittest.mock import patch
 from src.investor_intelligence.utils.config import Config, AppConfig
+from investor_intelligence.utils import env
 
 
 def test_config_initialization():
@@ -19,3 +22,33 @@ def test_app_config():
     assert app_config.name == "Investor Intelligence Agent"
     assert app_config.version == "1.0.0"
     assert app_config.debug == False
+
+
+def test_load_env_reads_env_file_once():
+    """Test that repeated load_env calls only load the .env file once."""
+    env.load_env.cache_clear()
+    try:
+        with patch("investor_intelligence.utils.env.load_dotenv") as mock_load:
+            env.load_env()
+            env.load_env()
+        mock_load.assert_called_once_with(env.ENV_FILE)
+    finally:
+        env.load_env.cache_clear()
+
+
+def test_config_reuses_parsed_yaml_until_file_changes(tmp_path):
+    """Test that the YAML file is only parsed again after it changes."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("app:\n  name: From YAML\n")
+
+    assert Config(str(config_file)).app.name == "From YAML"
+    # Nothing is written next to the config file
+    assert [p.name for p in tmp_path.iterdir()] == ["config.yaml"]
+
+    with patch("yaml.load") as mock_load:
+        assert Config(str(config_file)).app.name == "From YAML"
+    mock_load.assert_not_called()
+
+    config_file.write_text("app:\n  name: Edited\n")
+    os.utime(config_file, (0, 12345))
+    assert Config(str(config_file)).app.name == "Edited"
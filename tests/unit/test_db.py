@@ -0,0 +1,43 @@
+"""Test the shared SQLite connection and schema setup."""
+
+from unittest.mock import patch
+
+from investor_intelligence.utils import db
+
+
+def test_init_db_uses_shared_wal_connection(tmp_path, monkeypatch):
+    """init_db goes through the shared, WAL-mode connection and indexes alerts."""
+    monkeypatch.setattr(db, "DATABASE_FILE", str(tmp_path / "investor_intelligence.db"))
+
+    db.init_db()
+    conn = db.get_connection()
+
+    assert db.get_connection(db.DATABASE_FILE) is conn
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    indexes = {row[1] for row in conn.execute("PRAGMA index_list(alerts)").fetchall()}
+    assert "idx_alerts_user" in indexes
+
+
+def test_ensure_data_directory_remembers_writable_directories(tmp_path, monkeypatch):
+    monkeypatch.setattr(db, "DATABASE_FILE", str(tmp_path / "data" / "app.db"))
+
+    with patch("investor_intelligence.utils.db.os.access", return_value=False):
+        assert not db.ensure_data_directory()
+    assert db.ensure_data_directory()
+    with patch("investor_intelligence.utils.db.os.makedirs") as mock_makedirs:
+        assert db.ensure_data_directory()
+    mock_makedirs.assert_not_called()
+
+
+def test_init_db_runs_schema_once_per_database(tmp_path, monkeypatch):
+    monkeypatch.setattr(db, "DATABASE_FILE", str(tmp_path / "investor_intelligence.db"))
+
+    with patch("investor_intelligence.utils.db._init_db") as mock_init_db:
+        db.init_db()
+        db.init_db()
+        mock_init_db.assert_called_once()
+
+        monkeypatch.setattr(db, "DATABASE_FILE", str(tmp_path / "other.db"))
+        db.init_db()
+        assert mock_init_db.call_count == 2
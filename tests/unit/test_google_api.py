@@ -0,0 +1,11 @@
+from googleapiclient.model import JsonModel
+
+from investor_intelligence.utils.google_api import OrjsonModel
+
+
+def test_orjson_model_matches_json_model():
+    for content in (b'{"values": [["AAPL", "10"]]}', '{"id": "m1"}', b"not json"):
+        assert OrjsonModel().deserialize(content) == JsonModel().deserialize(content)
+
+    wrapped = b'{"data": {"id": "m1"}}'
+    assert OrjsonModel(data_wrapper=True).deserialize(wrapped) == {"id": "m1"}
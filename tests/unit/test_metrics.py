@@ -0,0 +1,212 @@
+"""Test latency metric storage."""
+
+import threading
+from datetime import datetime, timedelta
+
+from investor_intelligence.utils import db, metrics
+from unittest.mock import patch
+
+from investor_intelligence.utils.metrics import (
+    BatchLatencyTracker,
+    LatencyMetric,
+    LatencyTracker,
+    MetricsCollector,
+    track_latency,
+)
+
+
+def _metric(operation, duration_ms, success=True):
+    start = datetime.now()
+    return LatencyMetric(
+        operation=operation,
+        service="test_service",
+        start_time=start,
+        end_time=start + timedelta(milliseconds=duration_ms),
+        duration_ms=duration_ms,
+        success=success,
+    )
+
+
+def test_metrics_collector_reuses_one_connection(tmp_path):
+    collector = MetricsCollector(str(tmp_path / "metrics.db"))
+
+    for duration in (10.0, 30.0):
+        collector.record_metric(_metric("fetch", duration))
+    collector.record_metric(_metric("fetch", 50.0, success=False))
+
+    assert collector._conn is db.get_connection(str(collector.db_path))
+    assert collector._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    summary = collector.get_metrics_summary(service="test_service")
+    assert summary["total_requests"] == 3
+    assert summary["avg_duration_ms"] == 30.0
+    assert summary["error_rate"] == 33.33
+    assert collector.get_slowest_operations(limit=1)[0]["duration_ms"] == 50.0
+
+
+def test_metrics_recorded_from_many_threads_are_all_written(tmp_path):
+    collector = MetricsCollector(str(tmp_path / "metrics.db"))
+
+    def record():
+        for _ in range(100):
+            collector.record_metric(_metric("quote", 1.0))
+
+    threads = [threading.Thread(target=record) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    collector.flush()
+    assert not collector._queue
+    assert collector.get_metrics_summary(operation="quote")["total_requests"] == 800
+
+
+@patch("investor_intelligence.utils.metrics.time.perf_counter_ns")
+def test_latency_tracker_times_with_monotonic_counter(mock_perf_counter_ns, tmp_path):
+    collector = MetricsCollector(str(tmp_path / "metrics.db"))
+    mock_perf_counter_ns.side_effect = [1_000_000, 13_500_000]
+
+    with patch(
+        "investor_intelligence.utils.metrics.get_metrics_collector",
+        return_value=collector,
+    ), patch.object(collector, "record_metric") as mock_record:
+        with LatencyTracker("load", "test_service"):
+            pass
+
+    metric = mock_record.call_args.args[0]
+    assert metric.duration_ms == 12.5
+    assert metric.end_time - metric.start_time == timedelta(milliseconds=12.5)
+    assert metric.success
+
+
+def test_summary_queries_use_composite_indexes(tmp_path):
+    collector = MetricsCollector(str(tmp_path / "metrics.db"))
+    conn = collector._conn
+
+    indexes = {row[1] for row in conn.execute("PRAGMA index_list(latency_metrics)")}
+    assert indexes == {"idx_svc_op_time", "idx_time_duration"}
+    plan = " ".join(
+        row[3]
+        for row in conn.execute(
+            "EXPLAIN QUERY PLAN " + metrics._SUMMARY_SQL[True, True], ["", "s", "o"]
+        )
+    )
+    assert "idx_svc_op_time" in plan
+
+
+def test_cleanup_old_metrics_deletes_in_batches(tmp_path, monkeypatch):
+    monkeypatch.setattr(metrics, "METRICS_CLEANUP_BATCH", 2)
+    collector = MetricsCollector(str(tmp_path / "metrics.db"))
+    for age_days in (40, 40, 35, 31, 31, 1):
+        metric = _metric("old", 1.0)
+        metric.start_ms -= age_days * 86_400_000
+        collector.record_metric(metric)
+    collector.flush()
+
+    collector.cleanup_old_metrics(days=30, background=True).join()
+
+    remaining = collector._conn.execute("SELECT COUNT(*) FROM latency_metrics")
+    assert remaining.fetchone()[0] == 1
+
+
+@patch("investor_intelligence.utils.metrics.get_metrics_collector")
+def test_track_latency_skips_disabled_and_trivial_calls(mock_collector, monkeypatch):
+    @track_latency("add", "test_service")
+    def add(a, b):
+        return a + b
+
+    monkeypatch.setattr(metrics, "_ENABLED", False)
+    assert add(1, 2) == 3
+    mock_collector.assert_not_called()
+
+    monkeypatch.setattr(metrics, "_ENABLED", True)
+    monkeypatch.setattr(metrics, "_MIN_DURATION_MS", 60_000)
+    assert add(2, 2) == 4
+    mock_collector.return_value.record_metric.assert_not_called()
+
+    monkeypatch.setattr(metrics, "_MIN_DURATION_MS", 0.0)
+    add(3, 3)
+    mock_collector.return_value.record_metric.assert_called_once()
+
+
+@patch("investor_intelligence.utils.metrics.get_metrics_collector")
+def test_disabled_latency_tracker_never_gets_collector(mock_collector, monkeypatch):
+    monkeypatch.setattr(metrics, "_ENABLED", False)
+    with LatencyTracker("op", "test_service"):
+        pass
+    mock_collector.assert_not_called()
+
+    monkeypatch.setattr(metrics, "_ENABLED", True)
+    monkeypatch.setattr(metrics, "_MIN_DURATION_MS", 0.0)
+    with LatencyTracker("op", "test_service"):
+        pass
+    mock_collector.return_value.record_metric.assert_called_once()
+
+
+@patch("investor_intelligence.utils.metrics.get_metrics_collector")
+def test_batch_latency_tracker_records_all_metrics_at_once(mock_collector, tmp_path):
+    collector = MetricsCollector(str(tmp_path / "metrics.db"))
+    mock_collector.return_value = collector
+
+    with patch.object(collector, "record_many", wraps=collector.record_many) as many:
+        with BatchLatencyTracker() as batch:
+            for symbol in ("AAPL", "MSFT", "GOOG"):
+                with batch.track("fetch", "test_service", {"symbol": symbol}):
+                    pass
+            assert len(batch.metrics) == 3
+        many.assert_called_once()
+
+    assert collector.get_metrics_summary(service="test_service")["total_requests"] == 3
+
+
+def test_get_metrics_collector_creates_one_instance_across_threads(monkeypatch):
+    monkeypatch.setattr(metrics, "_metrics_collector", None)
+
+    with patch.object(metrics, "MetricsCollector") as collector_cls:
+        threads = [
+            threading.Thread(target=metrics.get_metrics_collector) for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    collector_cls.assert_called_once_with()
+
+
+def test_text_timestamps_are_migrated_to_epoch_millis(tmp_path):
+    db_path = str(tmp_path / "metrics.db")
+    start = datetime(2025, 7, 1, 9, 30)
+    conn = db.get_connection(db_path)
+    conn.execute(
+        "CREATE TABLE latency_metrics (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+        "operation TEXT NOT NULL, service TEXT NOT NULL, start_time TEXT NOT NULL, "
+        "end_time TEXT NOT NULL, duration_ms REAL NOT NULL, success BOOLEAN NOT NULL, "
+        "error_message TEXT, metadata TEXT, "
+        "created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)"
+    )
+    conn.execute(
+        "INSERT INTO latency_metrics (operation, service, start_time, end_time, "
+        "duration_ms, success) VALUES ('fetch', 'test_service', ?, ?, 5.0, 1)",
+        [start.isoformat(), (start + timedelta(milliseconds=5)).isoformat()],
+    )
+
+    collector = MetricsCollector(db_path)
+    metric = _metric("fetch", 10.0)
+    collector.record_metric(metric)
+    collector.flush()
+
+    rows = conn.execute(
+        "SELECT start_time, end_time, typeof(start_time) FROM latency_metrics "
+        "ORDER BY id"
+    ).fetchall()
+    start_ms = int(start.timestamp() * 1000)
+    assert rows == [
+        (start_ms, start_ms + 5, "integer"),
+        (metric.start_ms, metric.end_ms, "integer"),
+    ]
+    slowest = collector.get_slowest_operations(limit=1)[0]
+    assert (
+        slowest["start_time"]
+        == datetime.fromtimestamp(metric.start_ms / 1000).isoformat()
+    )
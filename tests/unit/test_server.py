@@ -5,9 +5,9 @@ from unittest.mock import AsyncMock, patch
 from src.investor_intelligence.server import InvestorIntelligenceServer
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def server():
-    """Create a test server instance."""
+    """Create a test server instance, shared by the tests in the session."""
     return InvestorIntelligenceServer()
 
 
@@ -16,7 +16,6 @@ def test_server_initialization(server):
     assert server.server.name == "investor-intelligence"
 
 
-@pytest.mark.asyncio
 async def test_get_portfolio_status(server):
     """Test portfolio status tool."""
     result = await server._get_portfolio_status({})
@@ -25,7 +24,6 @@ async def test_get_portfolio_status(server):
     assert not result.isError
 
 
-@pytest.mark.asyncio
 async def test_check_alerts(server):
     """Test alert checking tool."""
     result = await server._check_alerts({})
@@ -34,7 +32,6 @@ async def test_check_alerts(server):
     assert not result.isError
 
 
-@pytest.mark.asyncio
 async def test_send_summary(server):
     """Test summary sending tool."""
     result = await server._send_summary(